@@ -21,6 +21,7 @@ except ImportError:
 import contextlib
 
 from services import (
+    BandwidthLimiter,
     DownloadManager,
     DownloadSpeedTracker,
     HistoryManager,
@@ -28,15 +29,20 @@ from services import (
     LanguageManager,
     LoadingIndicateManager,
     LoadManager,
+    MetadataCache,
+    ProgressUpdater,
     ThemeManager,
+    ThumbnailProcessor,
+    TickScheduler,
     VideoConvertManager,
     VideoCountTracker,
+    VideoRecord,
 )
 from settings import (
     AppearanceSettings,
     GeneralSettings,
 )
-from utils import DataRetrieveUtility, FileUtility, ValueConvertUtility
+from utils import DataRetrieveUtility, FileUtility, HttpUtility, ValueConvertUtility
 from utils.logger import get_logger
 from widgets import (
     AddedPlayList,
@@ -49,6 +55,7 @@ from widgets import (
     HistoryPanel,
     SettingPanel,
     TrayMenu,
+    VirtualList,
 )
 from widgets.core_widgets.context_menu import ContextMenu
 
@@ -152,6 +159,7 @@ class App(ctk.CTk):
 
         self.net_speed_chart = None
         self.net_speed_line = None
+        self.net_speed_limit_line = None
         self.net_speed_label = None
         self.net_speed_temp_label = None
         self.net_speed_switch = None
@@ -159,6 +167,8 @@ class App(ctk.CTk):
 
         self.current_max_download_speed_bytes = 0.00001
         self.current_download_speed_bytes = 0.00001
+        # The global speed limit drawn on the chart, None until the first update
+        self.chart_speed_limit = None
 
         ThemeManager.register_widget(self)
 
@@ -280,6 +290,8 @@ class App(ctk.CTk):
             video_history_change_callback=self.manage_history_videos,
             playlist_history_change_callback=self.manage_history_playlists,
         )
+        self.set_initializing_status("initializing_metadata_cache")
+        MetadataCache.initialize()
 
         # deactivate the automatic scale
         scale = AppearanceSettings.get_scale("decimal")
@@ -297,7 +309,9 @@ class App(ctk.CTk):
         self.set_initializing_status("initializing_theme_manager")
         ThemeManager.initialize()
         self.set_initializing_status("initializing_loading_indicate_manager")
+        TickScheduler.initialize(self)
         LoadingIndicateManager.initialize()
+        ProgressUpdater.initialize()
 
         self.set_initializing_status("initializing_widgets")
         # Create the main widgets of the application
@@ -381,9 +395,16 @@ class App(ctk.CTk):
             hover=False,
         )
 
-        self.added_content_scroll_frame = ctk.CTkScrollableFrame(master=self)
-        self.downloading_content_scroll_frame = ctk.CTkScrollableFrame(master=self)
-        self.downloaded_content_scroll_frame = ctk.CTkScrollableFrame(master=self)
+        # Only the rows in view are shown, added videos reuse their widgets while scrolling
+        self.added_content_scroll_frame = VirtualList(
+            master=self,
+            create_row=self.create_added_video,
+            bind_row=lambda video, record: video.bind_record(record),
+            release_row=lambda video: video.unbind_record(),
+            row_height=int(70 * AppearanceSettings.get_scale("decimal")),
+        )
+        self.downloading_content_scroll_frame = VirtualList(master=self)
+        self.downloaded_content_scroll_frame = VirtualList(master=self)
         self.history_content_frame = HistoryPanel(
             master=self,
             video_add_to_download_callback=self.add_video,
@@ -449,6 +470,11 @@ class App(ctk.CTk):
             fill="enabled",
         )
 
+        self.net_speed_limit_line = ctkchart.CTkLine(
+            master=self.net_speed_chart,
+            style="dashed",
+        )
+
         self.net_speed_label = ctk.CTkLabel(master=self, text="Download Speed : 0 KB/s")
 
         self.net_speed_temp_label = ctk.CTkLabel(master=self, text="Download Speed : 0 KB/s")
@@ -798,11 +824,11 @@ class App(ctk.CTk):
             text=LanguageManager.data["downloaded_videos_&_playlists_will_be_display_here"]
         )
         self.videos_status_count_label.configure(
-            text=f"{LanguageManager.data['loading']} : {LoadManager.queued_load_count + LoadManager.active_load_count}"
+            text=f"{LanguageManager.data['loading']} : {LoadManager.get_queued_count() + LoadManager.get_active_count()}"  # noqa: E501
             f" | "
-            f"{LanguageManager.data['downloading']} : {DownloadManager.queued_download_count + DownloadManager.active_download_count}"  # noqa: E501
+            f"{LanguageManager.data['downloading']} : {DownloadManager.get_queued_count() + DownloadManager.get_active_count()}"  # noqa: E501
             f" | "
-            f" {LanguageManager.data['converting']} : {VideoConvertManager.active_convert_count + VideoConvertManager.queued_convert_count}"  # noqa: E501
+            f" {LanguageManager.data['converting']} : {VideoConvertManager.get_active_count() + VideoConvertManager.get_queued_count()}"  # noqa: E501
         )
         self.net_speed_label.configure(
             text=f"{LanguageManager.data['download_speed']} : {ValueConvertUtility.convert_size(self.current_download_speed_bytes, decimal_points=3)}/s"  # noqa: E501
@@ -1005,6 +1031,7 @@ class App(ctk.CTk):
         )
 
         self.net_speed_line.configure(fill_color=ThemeManager.get_color_based_on_theme("secondary"))
+        self.net_speed_limit_line.configure(color=ThemeManager.get_color_based_on_theme("text_muted"))
 
         self.bottom_hr.configure(
             fg_color=ThemeManager.get_color_based_on_theme("primary"),
@@ -1558,20 +1585,30 @@ class App(ctk.CTk):
 
     def update_widgets(self) -> None:
         """
-        Update all the widgets in the application.
+        Update all the shown widgets in the application.
+
+        Hidden widgets, like the rows a list keeps out of view, are skipped with their children.
         """
         for widget in self.winfo_children():
+            if not widget.winfo_ismapped():
+                continue
             widget.update()
             try:
                 for sub_widget in widget.winfo_children():
+                    if not sub_widget.winfo_ismapped():
+                        continue
                     sub_widget.update()
                     sub_widget.focus_set()
                     try:
                         for sub_sub_widget in sub_widget.winfo_children():
+                            if not sub_sub_widget.winfo_ismapped():
+                                continue
                             sub_sub_widget.update()
                             sub_widget.focus_set()
                             try:
                                 for sub_sub_sub_widget in sub_sub_widget.winfo_children():
+                                    if not sub_sub_sub_widget.winfo_ismapped():
+                                        continue
                                     sub_sub_sub_widget.update()
                                     sub_widget.focus_set()
                             except Exception as error:
@@ -1641,11 +1678,11 @@ class App(ctk.CTk):
         Update the status label with the count of active loading and active downloading videos.
         """
         self.videos_status_count_label.configure(
-            text=f"{LanguageManager.data['loading']} : {LoadManager.queued_load_count + LoadManager.active_load_count}"
+            text=f"{LanguageManager.data['loading']} : {LoadManager.get_queued_count() + LoadManager.get_active_count()}"  # noqa: E501
             f" | "
-            f"{LanguageManager.data['downloading']} : {DownloadManager.queued_download_count + DownloadManager.active_download_count}"  # noqa: E501
+            f"{LanguageManager.data['downloading']} : {DownloadManager.get_queued_count() + DownloadManager.get_active_count()}"  # noqa: E501
             f" | "
-            f" {LanguageManager.data['converting']} : {VideoConvertManager.active_convert_count + VideoConvertManager.queued_convert_count}"  # noqa: E501
+            f" {LanguageManager.data['converting']} : {VideoConvertManager.get_active_count() + VideoConvertManager.get_queued_count()}"  # noqa: E501
         )
 
     def update_total_videos_count_status(
@@ -1700,16 +1737,22 @@ class App(ctk.CTk):
         self.added_frame_info_label.place_forget()
         self.is_content_added = True
 
-        AddedVideo(
+        # The widget is created once the video scrolls into view
+        record = VideoRecord(yt_url, download_callback=self.download_video)
+        record.register()
+        self.added_content_scroll_frame.add_item(record)
+
+    def create_added_video(self, record: VideoRecord) -> AddedVideo:
+        """
+        Create the widget of an added video, called by the added list for a video scrolled into view.
+        """
+        return AddedVideo(
             root=self,
             master=self.added_content_scroll_frame,
             height=int(70 * AppearanceSettings.get_scale("decimal")),
             width=self.added_content_scroll_frame.winfo_width(),
-            # video url
-            video_url=yt_url,
-            # download btn callback
-            video_download_button_click_callback=self.download_video,
-        ).pack(fill="x", pady=2)
+            record=record,
+        )
 
     def add_playlist(self, url: str = None) -> None:
         if url is None:
@@ -1721,7 +1764,7 @@ class App(ctk.CTk):
         self.added_frame_info_label.place_forget()
         self.is_content_added = True
 
-        AddedPlayList(
+        added_playlist = AddedPlayList(
             root=self,
             master=self.added_content_scroll_frame,
             height=int(86 * AppearanceSettings.get_scale("decimal")),
@@ -1729,7 +1772,8 @@ class App(ctk.CTk):
             playlist_download_button_click_callback=self.download_playlist,
             video_download_button_click_callback=self.download_video,
             playlist_url=yt_url,
-        ).pack(fill="x", pady=2)
+        )
+        self.added_content_scroll_frame.add_item(added_playlist)
 
     def add_video_playlist(self) -> None:
         """
@@ -1754,17 +1798,17 @@ class App(ctk.CTk):
         # auot scroll to bottom
         self.scroll_frame_to_bottom(self.added_content_scroll_frame)
 
-    def download_video(self, video: AddedVideo) -> None:
+    def download_video(self, video: VideoRecord) -> None:
         """
         Download a video.
 
         Args:
-            video (AddedVideo): The video to be downloaded.
+            video (VideoRecord): The record of the added video to be downloaded.
         """
         self.is_content_downloading = True
         self.downloading_frame_info_label.place_forget()
 
-        DownloadingVideo(
+        downloading_video = DownloadingVideo(
             root=self,
             master=self.downloading_content_scroll_frame,
             height=int(70 * AppearanceSettings.get_scale("decimal")),
@@ -1787,7 +1831,8 @@ class App(ctk.CTk):
             download_type=video.download_type,
             download_type_info=video.selected_download_type_info,
             video_download_complete_callback=self.downloaded_video,
-        ).pack(fill="x", pady=2)
+        )
+        self.downloading_content_scroll_frame.add_item(downloading_video)
 
         self.scroll_frame_to_bottom(self.downloading_content_scroll_frame)
 
@@ -1800,7 +1845,7 @@ class App(ctk.CTk):
         """
         self.is_content_downloading = True
         self.downloading_frame_info_label.place_forget()
-        DownloadingPlayList(
+        downloading_playlist = DownloadingPlayList(
             root=self,
             master=self.downloading_content_scroll_frame,
             height=int(86 * AppearanceSettings.get_scale("decimal")),
@@ -1817,7 +1862,8 @@ class App(ctk.CTk):
             # download directory
             # playlist download completed callback utils
             playlist_download_complete_callback=self.downloaded_playlist,
-        ).pack(fill="x", pady=2)
+        )
+        self.downloading_content_scroll_frame.add_item(downloading_playlist)
 
         self.scroll_frame_to_bottom(self.downloading_content_scroll_frame)
 
@@ -1830,7 +1876,7 @@ class App(ctk.CTk):
         """
         self.is_content_downloaded = True
         self.downloaded_frame_info_label.place_forget()
-        DownloadedVideo(
+        downloaded_video = DownloadedVideo(
             root=self,
             master=self.downloaded_content_scroll_frame,
             height=int(70 * AppearanceSettings.get_scale("decimal")),
@@ -1849,7 +1895,8 @@ class App(ctk.CTk):
             downloaded_file_name=video.download_file_name,
             download_quality=video.download_quality,
             download_type=video.download_type,
-        ).pack(fill="x", pady=2)
+        )
+        self.downloaded_content_scroll_frame.add_item(downloaded_video)
 
         self.scroll_frame_to_bottom(self.downloaded_content_scroll_frame)
 
@@ -1862,7 +1909,7 @@ class App(ctk.CTk):
         """
         self.is_content_downloaded = True
         self.downloaded_frame_info_label.place_forget()
-        DownloadedPlayList(
+        downloaded_playlist = DownloadedPlayList(
             root=self,
             master=self.downloaded_content_scroll_frame,
             height=86 * AppearanceSettings.get_scale("decimal"),
@@ -1875,7 +1922,8 @@ class App(ctk.CTk):
             playlist_video_count=len(playlist.downloaded_videos),
             playlist_url=playlist.playlist_url,
             videos=playlist.downloaded_videos,
-        ).pack(fill="x", pady=2)
+        )
+        self.downloaded_content_scroll_frame.add_item(downloaded_playlist)
 
         self.scroll_frame_to_bottom(self.downloaded_content_scroll_frame)
 
@@ -1897,23 +1945,31 @@ class App(ctk.CTk):
 
         self.current_download_speed_bytes = download_speed_bytes_per_sec
 
-        self.net_speed_label.configure(
-            text=f"{LanguageManager.data['download_speed']} : {ValueConvertUtility.convert_size(download_speed_bytes_per_sec, decimal_points=3)}/s"  # noqa: E501
-        )
+        download_speed_text = f"{LanguageManager.data['download_speed']} : {ValueConvertUtility.convert_size(download_speed_bytes_per_sec, decimal_points=3)}/s"  # noqa: E501
+        # Show the active speed limit next to the measured speed and as a line on the chart
+        speed_limit = BandwidthLimiter.get_global_limit()
+        if speed_limit != self.chart_speed_limit:
+            self.chart_speed_limit = speed_limit
+            self.net_speed_chart.set_line_visibility(self.net_speed_limit_line, speed_limit > 0)
+            self.confgiure_chart_y_axis_values()
+        if speed_limit > 0:
+            converted_limit = ValueConvertUtility.convert_size(speed_limit, decimal_points=1)
+            download_speed_text += f" ({LanguageManager.data['speed_limit']} : {converted_limit}/s)"
 
-        self.net_speed_temp_label.configure(
-            text=f"{LanguageManager.data['download_speed']} : {ValueConvertUtility.convert_size(download_speed_bytes_per_sec, decimal_points=3)}/s"  # noqa: E501
-        )
+        self.net_speed_label.configure(text=download_speed_text)
+
+        self.net_speed_temp_label.configure(text=download_speed_text)
 
         self.net_speed_chart.show_data(line=self.net_speed_line, data=[download_speed_bytes_per_sec])
+        self.net_speed_chart.show_data(line=self.net_speed_limit_line, data=[speed_limit])
 
     def confgiure_chart_y_axis_values(self):
         converted_speed = ValueConvertUtility.convert_size(self.current_max_download_speed_bytes, decimal_points=2)
         y_axis_data = f"{LanguageManager.data['peak']} : {converted_speed}/s"
 
-        self.net_speed_chart.configure(
-            y_axis_data=y_axis_data, y_axis_values=(0, self.current_max_download_speed_bytes)
-        )
+        # Keep the speed limit line in view when the downloads stay below it
+        y_axis_max = max(self.current_max_download_speed_bytes, self.chart_speed_limit or 0)
+        self.net_speed_chart.configure(y_axis_data=y_axis_data, y_axis_values=(0, y_axis_max))
 
     def confgiure_chart_x_axis_values(self):
         scale = AppearanceSettings.get_scale("decimal")
@@ -1924,6 +1980,7 @@ class App(ctk.CTk):
             x_axis_values=tuple([x for x in range(1, x_axis_point_count)]),
         )
         self.net_speed_line.configure(style_type=style_type)
+        self.net_speed_limit_line.configure(style_type=style_type)
 
     def open_context_menu(self, _event: tk.Event) -> None:
         """
@@ -2026,6 +2083,8 @@ class App(ctk.CTk):
                 App.maintain_history()
             except Exception as error:
                 _log.error("close_app: failed to save settings or clean up: %s", error)
+        ThumbnailProcessor.shutdown()
+        HttpUtility.close()
         self.destroy()
         self.is_app_running = False
         if not restart:
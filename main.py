@@ -1,3 +1,4 @@
+import multiprocessing
 import threading
 
 from customtkinter import CTkScrollableFrame
@@ -63,6 +64,8 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    # The thumbnail worker processes start from the same executable when the app is frozen
+    multiprocessing.freeze_support()
     main()
 
 # Codes under here will only execute when the app is closed
@@ -1,11 +1,30 @@
+from .async_download_engine import AsyncDownloadEngine as AsyncDownloadEngine
+from .bandwidth_limiter import BandwidthLimiter as BandwidthLimiter
+from .bandwidth_limiter import TokenBucket as TokenBucket
+from .client_health_registry import ClientHealthRegistry as ClientHealthRegistry
+from .concurrency_controller import ConcurrencyController as ConcurrencyController
+from .download_journal import DownloadJournal as DownloadJournal
 from .download_manager import DownloadManager as DownloadManager
 from .download_speed_tracker import DownloadSpeedTracker as DownloadSpeedTracker
+from .hedged_request import HedgedRequest as HedgedRequest
 from .history_manager import HistoryManager as HistoryManager
 from .information_manager import InformationManager as InformationManager
 from .language_manager import LanguageManager as LanguageManager
 from .load_manager import LoadManager as LoadManager
 from .loading_indicate_manager import LoadingIndicateManager as LoadingIndicateManager
+from .metadata_cache import MetadataCache as MetadataCache
 from .notification_manager import NotificationManager as NotificationManager
+from .playlist_progress import PlaylistProgress as PlaylistProgress
+from .progress_updater import ProgressUpdater as ProgressUpdater
+from .queue_policy import FairShareQueuePolicy as FairShareQueuePolicy
+from .queue_policy import FifoQueuePolicy as FifoQueuePolicy
+from .queue_scheduler import QueueScheduler as QueueScheduler
+from .segmented_downloader import SegmentedDownloader as SegmentedDownloader
+from .streaming_muxer import StreamingMuxer as StreamingMuxer
 from .theme_manager import ThemeManager as ThemeManager
+from .thumbnail_processor import ThumbnailProcessor as ThumbnailProcessor
+from .thumbnail_store import ThumbnailStore as ThumbnailStore
+from .tick_scheduler import TickScheduler as TickScheduler
 from .video_convert_manager import VideoConvertManager as VideoConvertManager
 from .video_count_tracker import VideoCountTracker as VideoCountTracker
+from .video_record import VideoRecord as VideoRecord
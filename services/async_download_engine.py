@@ -0,0 +1,168 @@
+import asyncio
+import concurrent.futures
+import threading
+from collections.abc import AsyncIterator, Awaitable, Callable, Coroutine
+from typing import Any
+
+import aiohttp
+
+from utils.logger import get_logger
+
+_log = get_logger(__name__)
+
+
+class AsyncDownloadEngine:
+    """
+    Runs every download transfer as a task on one asyncio event loop.
+
+    The loop lives on a single daemon thread and owns a pooled ``aiohttp.ClientSession``,
+    so connections to the same host are reused across downloads. Other threads hand
+    work to it with ``submit`` and ``call_soon``.
+    """
+
+    request_timeout: int = 30
+    max_retries: int = 3
+    # Upper bound of open connections shared by all downloads
+    connection_limit: int = 64
+    # Response bodies are read in pieces of this size when they are throttled
+    read_size: int = 65536
+    headers: dict = {"User-Agent": "Mozilla/5.0", "accept-language": "en-US,en"}
+
+    _loop: asyncio.AbstractEventLoop | None = None
+    _thread: threading.Thread | None = None
+    _session: aiohttp.ClientSession | None = None
+
+    @staticmethod
+    def initialize() -> None:
+        """
+        Start the event loop thread if it is not running yet.
+        """
+        if AsyncDownloadEngine._loop is not None:
+            return
+        AsyncDownloadEngine._loop = asyncio.new_event_loop()
+        AsyncDownloadEngine._thread = threading.Thread(
+            target=AsyncDownloadEngine._loop.run_forever, name="AsyncDownloadEngine", daemon=True
+        )
+        AsyncDownloadEngine._thread.start()
+
+    @staticmethod
+    def submit(coroutine: Coroutine) -> concurrent.futures.Future:
+        """
+        Schedule a coroutine on the engine loop from any thread.
+
+        Args:
+            coroutine (Coroutine): The coroutine to run.
+
+        Returns:
+            concurrent.futures.Future: A future holding the result of the coroutine.
+        """
+        AsyncDownloadEngine.initialize()
+        future = asyncio.run_coroutine_threadsafe(coroutine, AsyncDownloadEngine._loop)
+        future.add_done_callback(AsyncDownloadEngine._log_failure)
+        return future
+
+    @staticmethod
+    def call_soon(callback: Callable, *args: Any) -> None:
+        """
+        Run a plain callback on the engine loop from any thread.
+        """
+        AsyncDownloadEngine.initialize()
+        AsyncDownloadEngine._loop.call_soon_threadsafe(callback, *args)
+
+    @staticmethod
+    def call_later(delay: float, callback: Callable, *args: Any) -> None:
+        """
+        Run a plain callback on the engine loop after ``delay`` seconds, from any thread.
+        """
+        AsyncDownloadEngine.initialize()
+        AsyncDownloadEngine._loop.call_soon_threadsafe(AsyncDownloadEngine._loop.call_later, delay, callback, *args)
+
+    @staticmethod
+    def _log_failure(future: concurrent.futures.Future) -> None:
+        if not future.cancelled() and future.exception() is not None:
+            _log.error("download task failed: %s", future.exception())
+
+    @staticmethod
+    def get_session() -> aiohttp.ClientSession:
+        """
+        Get the shared client session, creating it on first use.
+
+        Must be called from the engine loop.
+        """
+        if AsyncDownloadEngine._session is None or AsyncDownloadEngine._session.closed:
+            AsyncDownloadEngine._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=AsyncDownloadEngine.connection_limit),
+                timeout=aiohttp.ClientTimeout(
+                    sock_connect=AsyncDownloadEngine.request_timeout, sock_read=AsyncDownloadEngine.request_timeout
+                ),
+                headers=AsyncDownloadEngine.headers,
+            )
+        return AsyncDownloadEngine._session
+
+    @staticmethod
+    async def fetch_range(
+        url: str,
+        start: int,
+        end: int,
+        cancel_event: asyncio.Event | None = None,
+        throttle: Callable[[int], Awaitable] | None = None,
+    ) -> bytes:
+        """
+        Fetch bytes ``start``-``end`` (inclusive) of a stream, retrying on network errors.
+
+        Args:
+            url (str): The stream url.
+            start (int): The first byte to fetch.
+            end (int): The last byte to fetch.
+            cancel_event (asyncio.Event, optional): Stops retrying once set.
+            throttle (Callable, optional): Awaited with the size of every piece read, to limit the speed.
+
+        Returns:
+            bytes: The fetched data.
+        """
+        tries = 0
+        while True:
+            try:
+                async with AsyncDownloadEngine.get_session().get(f"{url}&range={start}-{end}") as response:
+                    response.raise_for_status()
+                    if throttle is None:
+                        return await response.read()
+                    data = bytearray()
+                    async for piece in response.content.iter_chunked(AsyncDownloadEngine.read_size):
+                        data += piece
+                        await throttle(len(piece))
+                    return bytes(data)
+            except (aiohttp.ClientError, TimeoutError, ConnectionError) as error:
+                tries += 1
+                if tries > AsyncDownloadEngine.max_retries or (cancel_event is not None and cancel_event.is_set()):
+                    raise
+                _log.warning(
+                    "retrying range %s-%s (%s/%s): %s", start, end, tries, AsyncDownloadEngine.max_retries, error
+                )
+
+    @staticmethod
+    async def iter_stream(
+        url: str, chunk_size: int, throttle: Callable[[int], Awaitable] | None = None, start: int = 0
+    ) -> AsyncIterator[bytes]:
+        """
+        Fetch a whole stream of unknown size in one request.
+
+        Args:
+            url (str): The stream url.
+            chunk_size (int): Size of the yielded chunks in bytes.
+            throttle (Callable, optional): Awaited with the size of every chunk, to limit the speed.
+            start (int): The first byte to fetch, to continue a stream that was closed early.
+
+        Returns:
+            AsyncIterator[bytes]: The body of the response, chunk by chunk.
+        """
+        headers = {"Range": f"bytes={start}-"} if start else None
+        async with AsyncDownloadEngine.get_session().get(url, headers=headers) as response:
+            response.raise_for_status()
+            if start and response.status != 206:
+                # The whole body again would be appended to the part already written
+                raise ConnectionError(f"range request from byte {start} not honoured")
+            async for data in response.content.iter_chunked(chunk_size):
+                if throttle is not None:
+                    await throttle(len(data))
+                yield data
@@ -0,0 +1,136 @@
+import asyncio
+import time
+from datetime import datetime
+
+from settings.general_settings import GeneralSettings
+from utils.logger import get_logger
+
+_log = get_logger(__name__)
+
+
+class TokenBucket:
+    """
+    Token bucket that paces byte transfers to an average rate.
+
+    The bucket refills at ``rate`` bytes per second and holds at most one second worth of
+    tokens, so short bursts are allowed but the average never exceeds the rate. A transfer
+    larger than the tokens left puts the bucket in debt, and the caller waits until the
+    debt is paid back. A rate of 0 means unlimited.
+    """
+
+    def __init__(self, rate: float = 0):
+        self.rate: float = rate
+        self._tokens: float = 0.0
+        self._updated: float = time.monotonic()
+
+    def set_rate(self, rate: float) -> None:
+        """Change the rate, keeping the tokens collected so far."""
+        if rate != self.rate:
+            self._refill(time.monotonic())
+            self.rate = rate
+
+    def _refill(self, now: float) -> None:
+        if self.rate > 0:
+            self._tokens = min(self._tokens + max(now - self._updated, 0) * self.rate, self.rate)
+        self._updated = now
+
+    def reserve(self, size: int, now: float | None = None) -> float:
+        """
+        Take ``size`` tokens from the bucket.
+
+        Args:
+            size (int): Number of bytes about to be transferred.
+            now (float, optional): The current ``time.monotonic()`` value.
+
+        Returns:
+            float: Seconds the caller has to wait before transferring the bytes.
+        """
+        if self.rate <= 0:
+            return 0.0
+        self._refill(time.monotonic() if now is None else now)
+        self._tokens -= size
+        return max(-self._tokens / self.rate, 0.0)
+
+    async def consume(self, size: int) -> None:
+        """Wait until ``size`` bytes may be transferred."""
+        delay = self.reserve(size)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class BandwidthLimiter:
+    """
+    Caps the download throughput of the whole app and of each single download.
+
+    Every downloaded piece passes through ``throttle``, which waits on the shared global
+    bucket and on the bucket of its download. Limits are read from ``GeneralSettings``, so
+    changes made in the settings take effect on the next piece.
+
+    ``download_speed_limit_schedule`` may hold time-of-day windows like
+    ``{"start": "09:00", "end": "17:00", "limit": 1048576}`` that replace the global limit
+    while they are active. Windows may wrap past midnight.
+    """
+
+    global_bucket: TokenBucket = TokenBucket()
+    # Seconds between checks of the schedule and settings
+    refresh_interval: float = 5
+    _last_refresh: float = 0.0
+
+    @staticmethod
+    def get_scheduled_limit(schedule: list[dict], default_limit: int, now: datetime | None = None) -> int:
+        """
+        Get the global limit for the current time of day.
+
+        Args:
+            schedule (list[dict]): Windows with "start" and "end" ("HH:MM") and "limit" (bytes/s).
+            default_limit (int): The limit used outside every window.
+            now (datetime, optional): The time to check, defaults to the current time.
+
+        Returns:
+            int: The limit in bytes per second, 0 means unlimited.
+        """
+        current = (now or datetime.now()).strftime("%H:%M")
+        for window in schedule:
+            try:
+                start, end, limit = window["start"], window["end"], int(window["limit"])
+            except (KeyError, TypeError, ValueError) as error:
+                _log.warning("ignoring invalid speed limit window %r: %s", window, error)
+                continue
+            if start <= end and start <= current < end:
+                return limit
+            # The window wraps past midnight
+            if start > end and (current >= start or current < end):
+                return limit
+        return default_limit
+
+    @staticmethod
+    def get_global_limit() -> int:
+        """Get the global limit in bytes per second that applies right now, 0 means unlimited."""
+        return BandwidthLimiter.get_scheduled_limit(
+            GeneralSettings.settings["download_speed_limit_schedule"],
+            GeneralSettings.settings["download_speed_limit"],
+        )
+
+    @staticmethod
+    def refresh() -> None:
+        """Apply the current settings and schedule to the global bucket."""
+        BandwidthLimiter._last_refresh = time.monotonic()
+        BandwidthLimiter.global_bucket.set_rate(BandwidthLimiter.get_global_limit())
+
+    @staticmethod
+    async def throttle(size: int, download_bucket: TokenBucket | None = None) -> None:
+        """
+        Wait until ``size`` more bytes may be downloaded.
+
+        Must be called from the AsyncDownloadEngine loop.
+
+        Args:
+            size (int): Number of bytes just received.
+            download_bucket (TokenBucket, optional): The bucket of the download the bytes belong to.
+        """
+        if time.monotonic() - BandwidthLimiter._last_refresh >= BandwidthLimiter.refresh_interval:
+            BandwidthLimiter.refresh()
+        await BandwidthLimiter.global_bucket.consume(size)
+        if download_bucket is not None:
+            download_bucket.set_rate(GeneralSettings.settings["download_speed_limit_per_video"])
+            await download_bucket.consume(size)
@@ -0,0 +1,159 @@
+import threading
+import time
+
+from utils.logger import get_logger
+
+_log = get_logger(__name__)
+
+
+class ClientHealthRegistry:
+    """
+    Shared record of how well each pytubefix client has been loading videos.
+
+    Every load attempt reports its client, outcome and latency here, so the load threads
+    learn from each other: ``get_client_order`` puts the clients that recently worked
+    first. A client that fails ``failure_threshold`` times in a row is skipped for
+    ``cooldown`` seconds (circuit breaker), then gets a single trial attempt again.
+    """
+
+    failure_threshold: int = 3
+    cooldown: float = 300
+    # Weight of the newest outcome in the success rate and latency averages
+    smoothing: float = 0.3
+    # Latency budget before a hedged load races the next client: a multiple of the average
+    # latency of the client, clamped, or the default for clients never timed
+    hedge_latency_factor: float = 2.0
+    min_hedge_delay: float = 1.0
+    max_hedge_delay: float = 10.0
+    default_hedge_delay: float = 4.0
+
+    _stats: dict[str, dict] = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _get_stats(client: str) -> dict:
+        if client not in ClientHealthRegistry._stats:
+            ClientHealthRegistry._stats[client] = {
+                "successes": 0,
+                "failures": 0,
+                "consecutive_failures": 0,
+                # Unknown clients rank between working and failing ones
+                "success_rate": 0.5,
+                "latency": None,
+                "open_until": 0.0,
+            }
+        return ClientHealthRegistry._stats[client]
+
+    @staticmethod
+    def record_success(client: str, latency: float) -> None:
+        """
+        Record a successful load.
+
+        Args:
+            client (str): The client name.
+            latency (float): Seconds the load took.
+        """
+        with ClientHealthRegistry._lock:
+            stats = ClientHealthRegistry._get_stats(client)
+            smoothing = ClientHealthRegistry.smoothing
+            stats["successes"] += 1
+            stats["consecutive_failures"] = 0
+            stats["success_rate"] += smoothing * (1 - stats["success_rate"])
+            stats["latency"] = (
+                latency if stats["latency"] is None else stats["latency"] + smoothing * (latency - stats["latency"])
+            )
+            stats["open_until"] = 0.0
+
+    @staticmethod
+    def record_failure(client: str) -> None:
+        """
+        Record a failed load, opening the circuit of the client if it keeps failing.
+
+        Args:
+            client (str): The client name.
+        """
+        with ClientHealthRegistry._lock:
+            stats = ClientHealthRegistry._get_stats(client)
+            stats["failures"] += 1
+            stats["consecutive_failures"] += 1
+            stats["success_rate"] -= ClientHealthRegistry.smoothing * stats["success_rate"]
+            if stats["consecutive_failures"] >= ClientHealthRegistry.failure_threshold:
+                if stats["open_until"] <= time.monotonic():
+                    _log.info(
+                        "skipping client %s for %ss after repeated failures", client, ClientHealthRegistry.cooldown
+                    )
+                stats["open_until"] = time.monotonic() + ClientHealthRegistry.cooldown
+
+    @staticmethod
+    def get_client_order(clients: list[str]) -> list[str]:
+        """
+        Order clients for a load attempt, best first.
+
+        Clients are ranked by recent success rate, then latency, then their position in
+        ``clients``. Clients whose circuit is open are left out, unless all of them are.
+
+        Args:
+            clients (list[str]): The available clients in fallback order.
+
+        Returns:
+            list[str]: The clients to try, in order.
+        """
+        now = time.monotonic()
+        with ClientHealthRegistry._lock:
+            ranked = []
+            for index, client in enumerate(clients):
+                stats = ClientHealthRegistry._get_stats(client)
+                latency = stats["latency"] if stats["latency"] is not None else float("inf")
+                ranked.append((stats["open_until"] > now, -stats["success_rate"], latency, index, client))
+        ranked.sort()
+        available = [entry[-1] for entry in ranked if not entry[0]]
+        return available or [entry[-1] for entry in ranked]
+
+    @staticmethod
+    def get_latency_budget(client: str) -> float:
+        """
+        Get how long to wait for a client before hedging its load with the next client.
+
+        Args:
+            client (str): The client name.
+
+        Returns:
+            float: The budget in seconds.
+        """
+        with ClientHealthRegistry._lock:
+            latency = ClientHealthRegistry._get_stats(client)["latency"]
+        if latency is None:
+            return ClientHealthRegistry.default_hedge_delay
+        return min(
+            max(latency * ClientHealthRegistry.hedge_latency_factor, ClientHealthRegistry.min_hedge_delay),
+            ClientHealthRegistry.max_hedge_delay,
+        )
+
+    @staticmethod
+    def get_counters() -> dict[str, dict]:
+        """
+        Get a snapshot of the per-client counters for diagnostics.
+
+        Returns:
+            dict: Client name to its successes, failures, consecutive failures, success
+            rate, average latency in seconds and whether its circuit is open.
+        """
+        now = time.monotonic()
+        with ClientHealthRegistry._lock:
+            return {
+                client: {
+                    "successes": stats["successes"],
+                    "failures": stats["failures"],
+                    "consecutive_failures": stats["consecutive_failures"],
+                    "success_rate": round(stats["success_rate"], 3),
+                    "latency": stats["latency"],
+                    "circuit_open": stats["open_until"] > now,
+                }
+                for client, stats in ClientHealthRegistry._stats.items()
+            }
+
+    @staticmethod
+    def reset() -> None:
+        """Forget everything recorded so far."""
+        with ClientHealthRegistry._lock:
+            ClientHealthRegistry._stats.clear()
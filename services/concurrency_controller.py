@@ -0,0 +1,127 @@
+from statistics import mean, median
+
+from utils.logger import get_logger
+
+_log = get_logger(__name__)
+
+
+class ConcurrencyController:
+    """
+    Picks the number of simultaneous downloads AIMD-style from measured throughput.
+
+    Throughput samples are only taken while every slot is busy and more downloads are
+    waiting, since that is the only time the limit is what holds the speed back. After a
+    few samples at the same limit, the average is compared with the one at the previous
+    limit:
+
+    - The extra slot paid off: add one more slot (additive increase).
+    - It made no real difference: give the slot back and hold the limit for a while
+      before probing again.
+    - Total throughput fell, or the median per-download speed collapsed, which is what
+      server-side throttling looks like: halve the limit (multiplicative decrease).
+    """
+
+    def __init__(
+        self,
+        min_limit: int = 1,
+        max_limit: int = 10,
+        settle_samples: int = 3,
+        hold_samples: int = 15,
+        gain_threshold: float = 0.05,
+        collapse_ratio: float = 0.3,
+    ):
+        """
+        Args:
+            min_limit (int): The lowest limit handed out.
+            max_limit (int): The highest limit handed out.
+            settle_samples (int): Samples averaged before the limit is judged.
+            hold_samples (int): Samples to wait before probing again after a step back.
+            gain_threshold (float): Relative throughput gain an extra slot must bring.
+            collapse_ratio (float): Median per-download speed below this share of the
+                previous one counts as throttling.
+        """
+        self.min_limit: int = min_limit
+        self.max_limit: int = max_limit
+        self.settle_samples: int = settle_samples
+        self.hold_samples: int = hold_samples
+        self.gain_threshold: float = gain_threshold
+        self.collapse_ratio: float = collapse_ratio
+
+        self.limit: int = min_limit
+        self._samples: list[float] = []
+        self._stream_samples: list[float] = []
+        # Average total and median per-download speed measured at the previous limit
+        self._baseline: float | None = None
+        self._stream_baseline: float | None = None
+        self._increased: bool = False
+        self._hold: int = 0
+
+    def add_sample(self, total_speed: float, stream_speeds: list[float], saturated: bool) -> int:
+        """
+        Record one throughput measurement and adjust the limit when enough are collected.
+
+        Args:
+            total_speed (float): Combined speed of all active downloads in bytes/s.
+            stream_speeds (list[float]): Speed of every active download in bytes/s.
+            saturated (bool): True if every slot is busy and downloads are waiting.
+
+        Returns:
+            int: The limit to use from now on.
+        """
+        if not saturated or not stream_speeds:
+            # Nothing to learn while slots sit idle, start over once they fill up again
+            self._samples.clear()
+            self._stream_samples.clear()
+            return self.limit
+
+        if self._hold > 0:
+            self._hold -= 1
+            return self.limit
+
+        self._samples.append(total_speed)
+        self._stream_samples.append(median(stream_speeds))
+        if len(self._samples) < self.settle_samples:
+            return self.limit
+
+        throughput = mean(self._samples)
+        stream_speed = mean(self._stream_samples)
+        self._samples.clear()
+        self._stream_samples.clear()
+
+        if self._baseline is not None and (
+            throughput < self._baseline * (1 - self.gain_threshold)
+            or stream_speed < self._stream_baseline * self.collapse_ratio
+        ):
+            self._set_limit(max(self.limit // 2, self.min_limit), "throughput dropped")
+            self._increased = False
+            # The halved limit gets measured from scratch
+            self._baseline = None
+            return self.limit
+
+        if self._increased and throughput < self._baseline * (1 + self.gain_threshold):
+            self._set_limit(max(self.limit - 1, self.min_limit), "extra slot did not help")
+            self._increased = False
+            self._hold = self.hold_samples
+            return self.limit
+
+        self._baseline = throughput
+        self._stream_baseline = stream_speed
+        if self.limit < self.max_limit:
+            self._set_limit(self.limit + 1, "probing for more throughput")
+            self._increased = True
+        return self.limit
+
+    def _set_limit(self, limit: int, reason: str) -> None:
+        if limit != self.limit:
+            _log.info("simultaneous downloads %s -> %s: %s", self.limit, limit, reason)
+        self.limit = limit
+
+    def reset(self, limit: int | None = None) -> None:
+        """Forget all measurements and start again from ``limit`` or the lowest limit."""
+        self.limit = self.min_limit if limit is None else max(min(limit, self.max_limit), self.min_limit)
+        self._samples.clear()
+        self._stream_samples.clear()
+        self._baseline = None
+        self._stream_baseline = None
+        self._increased = False
+        self._hold = 0
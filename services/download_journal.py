@@ -0,0 +1,216 @@
+import os
+import threading
+from pathlib import Path
+
+from utils import JsonUtility
+from utils.logger import get_logger
+
+_log = get_logger(__name__)
+
+
+class DownloadJournal:
+    """
+    Sidecar file that records which byte ranges of a download are already on disk.
+
+    The journal lives next to the target file as ``<file><JOURNAL_EXTENSION>`` and stores
+    the video id, the stream itag, the expected file size and the completed (start, end)
+    ranges, end inclusive. A range is only recorded after its bytes were synced to disk, so
+    a download can always continue from what the journal says without re-checking the data.
+    """
+
+    JOURNAL_EXTENSION: str = ".pytubejournal"
+
+    # Target files that currently have a running download, so two downloads never share a file
+    active_paths: set[str] = set()
+    active_paths_lock = threading.Lock()
+
+    def __init__(
+        self, file_path: str, video_id: str, itag: int, file_size: int, ranges: list[tuple[int, int]] | None = None
+    ):
+        self.file_path: str = file_path
+        self.video_id: str = video_id
+        self.itag: int = itag
+        self.file_size: int = file_size
+        self.ranges: list[tuple[int, int]] = DownloadJournal.merge_ranges(ranges or [])
+        self._lock = threading.Lock()
+
+    @property
+    def journal_path(self) -> str:
+        return self.file_path + DownloadJournal.JOURNAL_EXTENSION
+
+    @staticmethod
+    def merge_ranges(ranges: list[tuple[int, int]]) -> list[tuple[int, int]]:
+        """
+        Sort inclusive byte ranges and merge the ones that overlap or touch.
+
+        Args:
+            ranges (list[tuple[int, int]]): The (start, end) ranges to merge.
+
+        Returns:
+            list[tuple[int, int]]: The merged ranges in ascending order.
+        """
+        merged: list[tuple[int, int]] = []
+        for start, end in sorted(ranges):
+            if merged and start <= merged[-1][1] + 1:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+            else:
+                merged.append((start, end))
+        return merged
+
+    @staticmethod
+    def load(file_path: str, video_id: str, itag: int, file_size: int) -> "DownloadJournal | None":
+        """
+        Load the journal of a partially downloaded file.
+
+        Args:
+            file_path (str): The path of the partially downloaded file.
+            video_id (str): The id of the video the stream belongs to.
+            itag (int): The itag of the stream being downloaded.
+            file_size (int): The expected size of the stream in bytes.
+
+        Returns:
+            DownloadJournal | None: The journal, or None if there is no usable journal for this stream.
+        """
+        journal_path = file_path + DownloadJournal.JOURNAL_EXTENSION
+        if not os.path.isfile(journal_path) or not os.path.isfile(file_path):
+            return None
+
+        try:
+            data = JsonUtility.read_from_file(journal_path)
+            ranges = [(int(start), int(end)) for start, end in data["ranges"]]
+            # Another video may have a stream with the same itag and size saved under the same name
+            if data["video_id"] != video_id or data["itag"] != itag or data["file_size"] != file_size:
+                return None
+        except Exception as error:
+            _log.warning("ignoring unreadable download journal %r: %s", journal_path, error)
+            return None
+
+        # The file is preallocated to its full size, anything else means it was touched by something else
+        if os.path.getsize(file_path) != file_size:
+            return None
+        if any(start < 0 or end >= file_size or start > end for start, end in ranges):
+            return None
+
+        return DownloadJournal(file_path, video_id, itag, file_size, ranges)
+
+    @staticmethod
+    def find_resumable(file_path: str, video_id: str, itag: int, file_size: int, acquire: bool = False) -> str | None:
+        """
+        Find a partially downloaded copy of a stream among the names ``get_available_file_name`` hands out.
+
+        Args:
+            file_path (str): The preferred file name of the download.
+            video_id (str): The id of the video the stream belongs to.
+            itag (int): The itag of the stream being downloaded.
+            file_size (int): The expected size of the stream in bytes.
+            acquire (bool): Mark the file found as being downloaded in the same step, so a
+                download of the same stream started at the same time can't pick it too.
+                Free it with ``release_path``.
+
+        Returns:
+            str | None: The path of a resumable file that is not being downloaded right now, or None.
+        """
+        path = Path(file_path)
+        candidates = [file_path]
+        counter = 0
+        while True:
+            candidate = f"{path.parent / path.stem} ({counter}){path.suffix}"
+            if not os.path.exists(candidate):
+                break
+            candidates.append(candidate)
+            counter += 1
+
+        with DownloadJournal.active_paths_lock:
+            for candidate in candidates:
+                if candidate in DownloadJournal.active_paths:
+                    continue
+                if DownloadJournal.load(candidate, video_id, itag, file_size) is not None:
+                    if acquire:
+                        DownloadJournal.active_paths.add(candidate)
+                    return candidate
+        return None
+
+    @staticmethod
+    def acquire_available_path(file_path: str) -> str:
+        """
+        Pick a file name that neither exists nor is being downloaded and mark it as being downloaded.
+
+        Args:
+            file_path (str): The preferred file name, "name (N).ext" is tried next like
+                ``get_available_file_name`` does.
+
+        Returns:
+            str: The path, free it with ``release_path``.
+        """
+        path = Path(file_path)
+        candidate = file_path
+        counter = 0
+        with DownloadJournal.active_paths_lock:
+            while os.path.exists(candidate) or candidate in DownloadJournal.active_paths:
+                candidate = f"{path.parent / path.stem} ({counter}){path.suffix}"
+                counter += 1
+            DownloadJournal.active_paths.add(candidate)
+        return candidate
+
+    @staticmethod
+    def release_path(file_path: str) -> None:
+        """Mark a file as free to be resumed by another download."""
+        with DownloadJournal.active_paths_lock:
+            DownloadJournal.active_paths.discard(file_path)
+
+    def completed_bytes(self) -> int:
+        """Return the number of bytes recorded as written."""
+        with self._lock:
+            return sum(end - start + 1 for start, end in self.ranges)
+
+    def missing_ranges(self) -> list[tuple[int, int]]:
+        """Return the inclusive byte ranges of the file that still need to be downloaded."""
+        with self._lock:
+            missing = []
+            position = 0
+            for start, end in self.ranges:
+                if start > position:
+                    missing.append((position, start - 1))
+                position = max(position, end + 1)
+            if position < self.file_size:
+                missing.append((position, self.file_size - 1))
+            return missing
+
+    def add_ranges(self, ranges: list[tuple[int, int]]) -> None:
+        """
+        Record inclusive byte ranges as written and persist the journal.
+
+        Only call this once the bytes were synced to disk, e.g. with ``os.fsync``.
+        """
+        with self._lock:
+            self.ranges = DownloadJournal.merge_ranges([*self.ranges, *ranges])
+            self._save()
+
+    def reset(self) -> None:
+        """Forget every recorded range and persist the empty journal."""
+        with self._lock:
+            self.ranges = []
+            self._save()
+
+    def delete(self) -> None:
+        """Remove the journal file once the download is complete."""
+        try:
+            os.remove(self.journal_path)
+        except FileNotFoundError:
+            pass
+        except Exception as error:
+            _log.warning("remove download journal failed for %r: %s", self.journal_path, error)
+
+    def _save(self) -> None:
+        # Write to a temporary file first so a crash never leaves a half written journal
+        temp_path = self.journal_path + ".tmp"
+        JsonUtility.write_to_file(
+            temp_path,
+            {
+                "video_id": self.video_id,
+                "itag": self.itag,
+                "file_size": self.file_size,
+                "ranges": [list(completed_range) for completed_range in self.ranges],
+            },
+        )
+        os.replace(temp_path, self.journal_path)
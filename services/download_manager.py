@@ -1,9 +1,10 @@
-import queue
-import threading
-from collections.abc import Callable
+from collections.abc import Callable, Hashable
 
 from pytubefix import request as pytubefix_request
 
+from services.async_download_engine import AsyncDownloadEngine
+from services.concurrency_controller import ConcurrencyController
+from services.queue_scheduler import QueueScheduler
 from settings.general_settings import GeneralSettings
 from utils.logger import get_logger
 
@@ -15,15 +16,15 @@ class DownloadManager:
     Manages the download queue and controls the download process.
     """
 
-    # Class variables to keep track of active and queued loads
-    active_download_count: int = 0
-    queued_download_count: int = 0
-    queued_downloads: list = []
-    active_downloads: list = []
+    # Queued and active downloads, shared by every thread that touches the queue
+    scheduler: QueueScheduler = QueueScheduler(
+        name="download",
+        get_max_active=lambda: DownloadManager.get_max_active_count(),
+        start_item=lambda video: video.download_video(),
+    )
     status_change_callback: Callable = None
-
-    # Queue used to signal the manager thread when the queue state changes
-    _signal_queue: queue.Queue = queue.Queue()
+    # Picks the number of simultaneous downloads while "max_simultaneous_downloads_auto" is on
+    concurrency_controller: ConcurrencyController = ConcurrencyController()
 
     resolutions: list = [
         "Audio Only",
@@ -40,53 +41,57 @@ class DownloadManager:
         "17280p",
     ]
 
+    # Priority of the videos the user chose to download next, queued before the others
+    download_next_priority: int = 1
+
     default_chunk_size: int = 2097152
+    default_download_connections: int = 4
+    default_streaming_mux: bool = False
 
     @staticmethod
     def manage_download_queue() -> None:
         """
         Manages the download queue by starting downloads if conditions are met.
 
-        Blocks on a queue.Queue instead of polling with time.sleep, so it wakes
-        up immediately when a new item is registered or an active download finishes.
+        Runs on the AsyncDownloadEngine loop, scheduled by ``_signal`` whenever a new item
+        is registered or an active download finishes, so no thread sits waiting for work.
         """
-        while True:
-            # Block until signalled (no busy-wait)
-            DownloadManager._signal_queue.get()
-
-            if (
-                GeneralSettings.settings["max_simultaneous_downloads"] > DownloadManager.active_download_count
-                and DownloadManager.queued_download_count > 0
-            ):
-                try:
-                    DownloadManager.queued_download_count -= 1
-                    DownloadManager.queued_downloads[0].download_video()
-                    DownloadManager.active_download_count += 1
-                    DownloadManager.active_downloads.append(DownloadManager.queued_downloads.pop(0))
-                except Exception:
-                    _log.exception("failed to start download")
-                    # Re-queue the item count so the queue stays consistent
-                    DownloadManager.queued_download_count += 1
-                DownloadManager.status_change_callback()
+        # Fill every free slot, not just one, in case several were freed at once
+        if DownloadManager.scheduler.schedule():
+            DownloadManager.status_change_callback()
 
     @staticmethod
     def _signal() -> None:
-        """Puts a token into the internal signal queue to wake the manager thread."""
-        DownloadManager._signal_queue.put(True)
+        """Schedules a pass of the download queue on the download engine loop."""
+        AsyncDownloadEngine.call_soon(DownloadManager.manage_download_queue)
 
     @staticmethod
-    def register(video) -> None:
+    def register(video, priority: int = 0, group: Hashable | None = None) -> None:
         """
         Registers a video to be downloaded.
 
         Adds the video to the download queue, updates the queued download count,
         and signals the manager thread.
+
+        Args:
+            video: The video widget.
+            priority (int): Videos with a higher priority are started first.
+            group (Hashable, optional): The playlist the video belongs to. Playlists and
+                standalone videos take turns for free slots.
         """
-        DownloadManager.queued_downloads.append(video)
-        DownloadManager.queued_download_count += 1
+        DownloadManager.scheduler.register(video, priority, group)
         DownloadManager.status_change_callback()
         DownloadManager._signal()
 
+    @staticmethod
+    def move_to_front(video) -> None:
+        """
+        Makes a queued video the next one to be downloaded.
+        """
+        if DownloadManager.scheduler.move_to_front(video):
+            DownloadManager.status_change_callback()
+            DownloadManager._signal()
+
     @staticmethod
     def unregister_from_queued(video) -> None:
         """
@@ -94,9 +99,7 @@ class DownloadManager:
 
         Removes the video from the download queue and updates the queued download count.
         """
-        if video in DownloadManager.queued_downloads:
-            DownloadManager.queued_downloads.remove(video)
-            DownloadManager.queued_download_count -= 1
+        DownloadManager.scheduler.unregister_from_queued(video)
         DownloadManager.status_change_callback()
 
     @staticmethod
@@ -107,25 +110,70 @@ class DownloadManager:
         Removes the video from the active download list, updates the active download
         count, and signals the manager thread so it can start the next queued item.
         """
-        if video in DownloadManager.active_downloads:
-            DownloadManager.active_downloads.remove(video)
-            DownloadManager.active_download_count -= 1
+        DownloadManager.scheduler.unregister_from_active(video)
         DownloadManager.status_change_callback()
         DownloadManager._signal()
 
+    @staticmethod
+    def is_queued(video) -> bool:
+        """Returns True if the video waits for a free slot."""
+        return DownloadManager.scheduler.is_queued(video)
+
+    @staticmethod
+    def get_queued_count() -> int:
+        """Returns the number of downloads waiting for a free slot."""
+        return DownloadManager.scheduler.get_queued_count()
+
+    @staticmethod
+    def get_active_count() -> int:
+        """Returns the number of downloads currently running."""
+        return DownloadManager.scheduler.get_active_count()
+
+    @staticmethod
+    def get_active_items() -> list:
+        """Returns a snapshot of the downloads currently running."""
+        return DownloadManager.scheduler.get_active_items()
+
+    @staticmethod
+    def get_max_active_count() -> int:
+        """Returns how many downloads may run at once, picked by the controller in auto mode."""
+        if GeneralSettings.settings["max_simultaneous_downloads_auto"]:
+            return DownloadManager.concurrency_controller.limit
+        return GeneralSettings.settings["max_simultaneous_downloads"]
+
+    @staticmethod
+    def adjust_concurrency(total_speed: float, stream_speeds: list[float]) -> None:
+        """
+        Feeds a throughput measurement to the concurrency controller in auto mode.
+
+        Args:
+            total_speed (float): Combined speed of all active downloads in bytes/s.
+            stream_speeds (list[float]): Speed of every active download in bytes/s.
+        """
+        if not GeneralSettings.settings["max_simultaneous_downloads_auto"]:
+            return
+        saturated = (
+            DownloadManager.get_active_count() >= DownloadManager.concurrency_controller.limit
+            and DownloadManager.get_queued_count() > 0
+        )
+        previous_limit = DownloadManager.concurrency_controller.limit
+        if DownloadManager.concurrency_controller.add_sample(total_speed, stream_speeds, saturated) > previous_limit:
+            # A slot was added, start the next queued download in it
+            DownloadManager._signal()
+
     @staticmethod
     def initialize(status_change_callback: Callable = None) -> None:
         """
-        Initializes the download manager by starting a separate thread for managing the download queue.
+        Initializes the download manager and the download engine loop it dispatches to.
 
         Args:
             status_change_callback (Callable, optional): A callback function to be called on status changes.
         """
         DownloadManager.status_change_callback = status_change_callback
         DownloadManager.configure_chunk_size()
-        downloading_manage_thread = threading.Thread(target=DownloadManager.manage_download_queue)
-        downloading_manage_thread.daemon = True
-        downloading_manage_thread.start()
+        # Auto mode starts probing from the manual count
+        DownloadManager.concurrency_controller.reset(GeneralSettings.settings["max_simultaneous_downloads"])
+        AsyncDownloadEngine.initialize()
 
     @staticmethod
     def configure_chunk_size() -> None:
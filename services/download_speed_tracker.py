@@ -1,6 +1,7 @@
 import threading
 import time
 from collections.abc import Callable
+from typing import Any
 
 from utils.logger import get_logger
 
@@ -11,19 +12,60 @@ _log = get_logger(__name__)
 
 class DownloadSpeedTracker:
     callback = None
+    # video -> (bytes transferred, time.monotonic()) at the previous tick
+    last_samples: dict[Any, tuple[int, float]] = {}
+
+    @staticmethod
+    def get_recent_speeds(videos: list, now: float) -> list[float]:
+        """
+        Get the speed of each download since the previous tick.
+
+        The concurrency controller is fed these rather than the average speed since each
+        download started, which hardly moves after the first minutes and so reacts late to
+        congestion or freed bandwidth.
+
+        Args:
+            videos (list): The videos downloading right now.
+            now (float): The ``time.monotonic()`` of this tick.
+
+        Returns:
+            list[float]: Bytes/s of each video that was also downloading at the previous tick.
+        """
+        samples = {}
+        speeds = []
+        for video in videos:
+            transferred_bytes = video.get_transferred_bytes()
+            samples[video] = (transferred_bytes, now)
+            previous_sample = DownloadSpeedTracker.last_samples.get(video)
+            if previous_sample is not None and now > previous_sample[1]:
+                previous_bytes, previous_time = previous_sample
+                # A failed attempt takes its bytes back
+                speeds.append(max(transferred_bytes - previous_bytes, 0) / (now - previous_time))
+        # Paused and finished downloads start over from their next tick
+        DownloadSpeedTracker.last_samples = samples
+        return speeds
 
     @staticmethod
     def track_total_download_speed():
         while True:
             total_speed = 0
-            if DownloadManager.active_download_count > 0:
-                for video in DownloadManager.active_downloads:
+            downloading_videos = []
+            if DownloadManager.get_active_count() > 0:
+                for video in DownloadManager.get_active_items():
                     try:
-                        if video.download_state == "downloading" and video.total_download_time >= 1:
-                            video_download_speed = video.total_bytes_downloaded / video.total_download_time
-                            total_speed += video_download_speed
+                        if video.download_state != "downloading":
+                            continue
+                        downloading_videos.append(video)
+                        if video.total_download_time >= 1:
+                            # Bytes resumed from disk took no download time
+                            total_speed += video.get_transferred_bytes() / video.total_download_time
                     except Exception:
                         _log.exception("failed to get download speed for a video")
+            try:
+                recent_speeds = DownloadSpeedTracker.get_recent_speeds(downloading_videos, time.monotonic())
+                DownloadManager.adjust_concurrency(sum(recent_speeds), recent_speeds)
+            except Exception:
+                _log.exception("failed to adjust the simultaneous downloads")
             if DownloadSpeedTracker.callback is not None:
                 try:
                     DownloadSpeedTracker.callback(total_speed)
@@ -0,0 +1,116 @@
+import queue
+import threading
+import time
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from utils.logger import get_logger
+
+_log = get_logger(__name__)
+
+
+class HedgedRequest:
+    """
+    Runs one request through interchangeable attempts, the first success wins.
+
+    Without hedging this is a plain fallback: the next attempt starts once the running one
+    failed. With hedging, when the running attempt has not answered within its latency
+    budget and a spare slot can be reserved, the next attempt is started next to it. When
+    one attempt succeeds the others are cancelled: attempts not started yet are dropped,
+    and as a running attempt can not be interrupted its result is discarded.
+    """
+
+    @staticmethod
+    def run(
+        attempts: Sequence[Callable[[], Any]],
+        get_delay: Callable[[int], float | None] = lambda _index: None,
+        reserve_slot: Callable[[], bool] = lambda: False,
+        release_slot: Callable[[], None] = lambda: None,
+        fatal_errors: tuple[type[Exception], ...] = (),
+        should_stop: Callable[[], bool] = lambda: False,
+    ) -> Any:
+        """
+        Run the attempts until one succeeds.
+
+        Args:
+            attempts (Sequence[Callable]): The attempts, best first.
+            get_delay (Callable): Seconds to wait for the attempt at the given index before
+                hedging it with the next one, or None to never hedge it.
+            reserve_slot (Callable): Takes a slot for a hedged attempt, returns False if none
+                is free. The first attempt and the fallbacks after a failure run in the slot
+                of the request itself.
+            release_slot (Callable): Gives back a slot taken with ``reserve_slot``.
+            fatal_errors (tuple): Errors that fail the whole request right away, because every
+                attempt would fail the same way.
+            should_stop (Callable): Checked before starting an attempt, True gives up.
+
+        Returns:
+            Any: The result of the first successful attempt.
+
+        Raises:
+            Exception: The error of the last failed attempt, or a fatal error.
+        """
+        results: queue.Queue = queue.Queue()
+
+        def run_attempt(index: int, hedged: bool) -> None:
+            try:
+                results.put((hedged, True, attempts[index]()))
+            except Exception as error:
+                results.put((hedged, False, error))
+            finally:
+                if hedged:
+                    release_slot()
+
+        def start(index: int, hedged: bool) -> None:
+            threading.Thread(target=run_attempt, args=(index, hedged), daemon=True).start()
+
+        next_index = 0
+        running = 0
+        own_slot_free = True
+        last_error: Exception | None = None
+        last_started = 0.0
+
+        while True:
+            if own_slot_free and next_index < len(attempts):
+                if should_stop():
+                    break
+                start(next_index, hedged=False)
+                own_slot_free = False
+                running += 1
+                next_index += 1
+                last_started = time.monotonic()
+
+            if running == 0:
+                break
+
+            timeout = None
+            if next_index < len(attempts):
+                delay = get_delay(next_index - 1)
+                if delay is not None:
+                    timeout = max(last_started + delay - time.monotonic(), 0)
+
+            try:
+                hedged, succeeded, value = results.get(timeout=timeout)
+            except queue.Empty:
+                # The running attempts are too slow, race the next one against them
+                if not should_stop() and reserve_slot():
+                    _log.debug("hedging attempt %s with attempt %s", next_index - 1, next_index)
+                    start(next_index, hedged=True)
+                    running += 1
+                    next_index += 1
+                # Without a free slot, check again after another delay
+                last_started = time.monotonic()
+                continue
+
+            running -= 1
+            if succeeded:
+                return value
+            if isinstance(value, fatal_errors):
+                raise value
+            last_error = value
+            if not hedged:
+                own_slot_free = True
+
+        if last_error is None:
+            raise RuntimeError("request stopped before any attempt ran")
+        raise last_error
@@ -5,7 +5,9 @@ from collections.abc import Callable
 from pathlib import Path
 from typing import Literal
 
-from utils import DataBaseUtility, DateTimeUtility, FileUtility
+from utils import DataBaseUtility, DateTimeUtility
+
+from .thumbnail_store import ThumbnailStore
 
 
 class HistoryManager:
@@ -54,6 +56,7 @@ class HistoryManager:
 
         HistoryManager.connection = sqlite3.connect(HistoryManager.data_base, check_same_thread=False)
         HistoryManager.cursor = HistoryManager.connection.cursor()
+        ThumbnailStore.initialize(HistoryManager.data_base_dir, HistoryManager.get_thumbnail_paths())
 
         HistoryManager.initialize_history()
         HistoryManager.configure_video_and_playlist_no()
@@ -101,22 +104,47 @@ class HistoryManager:
             HistoryManager.playlist_no = 0
 
     @staticmethod
-    def remove_from_history(url: str, table: Literal["videos", "playlists"]) -> None:
-        sql = f"DELETE FROM {table} WHERE url = ?"
-        HistoryManager.cursor.execute(sql, (url,))
+    def get_thumbnail_paths(
+        table: Literal["videos", "playlists"] | None = None, where: str = "", parameters: tuple = ()
+    ) -> list[str]:
+        """
+        Get the thumbnail paths of history entries, all of them by default.
+
+        Args:
+            table (str, optional): Only the entries of this table.
+            where (str, optional): Only the entries matching this SQL condition.
+            parameters (tuple, optional): The parameters of the condition.
+
+        Returns:
+            list[str]: The normal and hover thumbnail path of each entry.
+        """
+        paths = []
+        for history_table in (table,) if table is not None else ("videos", "playlists"):
+            sql = f"SELECT thumbnail_normal_path, thumbnail_hover_path FROM {history_table} {where}"
+            for thumbnail_normal_path, thumbnail_hover_path in HistoryManager.cursor.execute(sql, parameters):
+                paths.extend((thumbnail_normal_path, thumbnail_hover_path))
+        return paths
+
+    @staticmethod
+    def delete_from_history(table: Literal["videos", "playlists"], where: str, parameters: tuple) -> None:
+        """Delete history entries and release their thumbnails."""
+        thumbnail_paths = HistoryManager.get_thumbnail_paths(table, where, parameters)
+        HistoryManager.cursor.execute(f"DELETE FROM {table} {where}", parameters)
         HistoryManager.connection.commit()
+        for thumbnail_path in thumbnail_paths:
+            ThumbnailStore.release_reference(thumbnail_path)
+
+    @staticmethod
+    def remove_from_history(url: str, table: Literal["videos", "playlists"]) -> None:
+        HistoryManager.delete_from_history(table, "WHERE url = ?", (url,))
 
     @staticmethod
     def remove_from_video_history(no: int) -> None:
-        sql = "DELETE FROM videos WHERE no = ?"
-        HistoryManager.cursor.execute(sql, (no,))
-        HistoryManager.connection.commit()
+        HistoryManager.delete_from_history("videos", "WHERE no = ?", (no,))
 
     @staticmethod
     def remove_from_playlist_history(no: int) -> None:
-        sql = "DELETE FROM playlists WHERE no = ?"
-        HistoryManager.cursor.execute(sql, (no,))
-        HistoryManager.connection.commit()
+        HistoryManager.delete_from_history("playlists", "WHERE no = ?", (no,))
 
     @staticmethod
     def is_already_exists(video_url: str, table: Literal["videos", "playlists"]) -> bool:
@@ -160,6 +188,8 @@ class HistoryManager:
             ),
         )
         HistoryManager.connection.commit()
+        ThumbnailStore.add_reference(thumbnail_normal_path)
+        ThumbnailStore.add_reference(thumbnail_hover_path)
 
         HistoryManager.video_history_change_callback(
             HistoryManager.video_no,
@@ -208,6 +238,8 @@ class HistoryManager:
             ),
         )
         HistoryManager.connection.commit()
+        ThumbnailStore.add_reference(thumbnail_normal_path)
+        ThumbnailStore.add_reference(thumbnail_hover_path)
 
         HistoryManager.playlist_history_change_callback(
             HistoryManager.playlist_no,
@@ -229,25 +261,12 @@ class HistoryManager:
 
         if total_rows > HistoryManager.max_history:
             rows_to_delete = total_rows - HistoryManager.max_history
-            sql_delete = f"DELETE FROM {table} WHERE no IN (SELECT no FROM {table} ORDER BY no ASC LIMIT ?)"
-            HistoryManager.cursor.execute(sql_delete, (rows_to_delete,))
-            HistoryManager.connection.commit()
+            HistoryManager.delete_from_history(
+                table, f"WHERE no IN (SELECT no FROM {table} ORDER BY no ASC LIMIT ?)", (rows_to_delete,)
+            )
 
     @staticmethod
     def clear_invalid_history() -> None:
         HistoryManager.maintain_history("videos")
         HistoryManager.maintain_history("playlists")
-
-        videos_history_req_thumbnails = HistoryManager.cursor.execute(
-            "SELECT thumbnail_normal_path, thumbnail_hover_path FROM videos"
-        ).fetchall()
-        playlists_history_req_thumbnails = HistoryManager.cursor.execute(
-            "SELECT thumbnail_normal_path, thumbnail_hover_path FROM playlists"
-        ).fetchall()
-
-        required_thumbnails = ["this directory is necessary"]
-        for thumbnail in videos_history_req_thumbnails + playlists_history_req_thumbnails:
-            required_thumbnails.append(thumbnail[0].split("/")[-1])
-            required_thumbnails.append(thumbnail[1].split("/")[-1])
-
-        FileUtility.delete_files(directory="history/thumbnails", files_to_keep=required_thumbnails)
+        ThumbnailStore.collect_garbage()
@@ -1,7 +1,8 @@
 import queue
 import threading
-from collections.abc import Callable
+from collections.abc import Callable, Hashable
 
+from services.queue_scheduler import QueueScheduler
 from settings.general_settings import GeneralSettings
 from utils.logger import get_logger
 
@@ -13,11 +14,12 @@ class LoadManager:
     Manages the loading queue videos and controls the loading process.
     """
 
-    # Class variables to keep track of active and queued loads
-    active_load_count: int = 0
-    queued_load_count: int = 0
-    queued_loads: list = []
-    active_loads: list = []
+    # Queued and active loads, shared by every thread that touches the queue
+    scheduler: QueueScheduler = QueueScheduler(
+        name="load",
+        get_max_active=lambda: GeneralSettings.settings["max_simultaneous_loads"],
+        start_item=lambda video: video.load_video(),
+    )
     status_change_callback: Callable = None
 
     # Queue used to signal the manager thread when the queue state changes
@@ -35,20 +37,8 @@ class LoadManager:
             # Block until signalled (no busy-wait)
             LoadManager._signal_queue.get()
 
-            if (
-                GeneralSettings.settings["max_simultaneous_loads"] > LoadManager.active_load_count
-                and LoadManager.queued_load_count > 0
-            ):
-                try:
-                    # Dequeue a video, initiate loading, and update counts
-                    LoadManager.queued_load_count -= 1
-                    LoadManager.queued_loads[0].load_video()
-                    LoadManager.active_load_count += 1
-                    LoadManager.active_loads.append(LoadManager.queued_loads.pop(0))
-                except Exception:
-                    _log.exception("failed to start load")
-                    # Re-queue the item count so the queue stays consistent
-                    LoadManager.queued_load_count += 1
+            # Fill every free slot, not just one, in case several were freed at once
+            if LoadManager.scheduler.schedule():
                 LoadManager.status_change_callback()
 
     @staticmethod
@@ -57,18 +47,32 @@ class LoadManager:
         LoadManager._signal_queue.put(True)
 
     @staticmethod
-    def register(video) -> None:
+    def register(video, priority: int = 0, group: Hashable | None = None) -> None:
         """
         Registers a video to be loaded.
 
         Adds the video to the load queue, updates the queued load count,
         and signals the manager thread.
+
+        Args:
+            video: The video widget.
+            priority (int): Videos with a higher priority are started first.
+            group (Hashable, optional): The playlist the video belongs to. Playlists and
+                standalone videos take turns for free slots.
         """
-        LoadManager.queued_loads.append(video)
-        LoadManager.queued_load_count += 1
+        LoadManager.scheduler.register(video, priority, group)
         LoadManager.status_change_callback()
         LoadManager._signal()
 
+    @staticmethod
+    def move_to_front(video) -> None:
+        """
+        Makes a queued video the next one to be loaded.
+        """
+        if LoadManager.scheduler.move_to_front(video):
+            LoadManager.status_change_callback()
+            LoadManager._signal()
+
     @staticmethod
     def unregister_from_queued(video) -> None:
         """
@@ -76,9 +80,7 @@ class LoadManager:
 
         Removes the video from the load queue and updates the queued load count.
         """
-        if video in LoadManager.queued_loads:
-            LoadManager.queued_loads.remove(video)
-            LoadManager.queued_load_count -= 1
+        LoadManager.scheduler.unregister_from_queued(video)
         LoadManager.status_change_callback()
 
     @staticmethod
@@ -89,12 +91,44 @@ class LoadManager:
         Removes the video from the active load list, updates the active load count,
         and signals the manager thread so it can start the next queued item.
         """
-        if video in LoadManager.active_loads:
-            LoadManager.active_loads.remove(video)
-            LoadManager.active_load_count -= 1
+        LoadManager.scheduler.unregister_from_active(video)
         LoadManager.status_change_callback()
         LoadManager._signal()
 
+    @staticmethod
+    def reserve_slot() -> bool:
+        """
+        Takes a free load slot for a hedged load attempt.
+
+        Returns:
+            bool: False if every slot is in use.
+        """
+        return LoadManager.scheduler.reserve_slot()
+
+    @staticmethod
+    def release_slot() -> None:
+        """
+        Gives back a slot taken with reserve_slot and signals the manager thread so it
+        can start the next queued item.
+        """
+        LoadManager.scheduler.release_slot()
+        LoadManager._signal()
+
+    @staticmethod
+    def get_queued_count() -> int:
+        """Returns the number of loads waiting for a free slot."""
+        return LoadManager.scheduler.get_queued_count()
+
+    @staticmethod
+    def get_active_count() -> int:
+        """Returns the number of loads currently running."""
+        return LoadManager.scheduler.get_active_count()
+
+    @staticmethod
+    def get_active_items() -> list:
+        """Returns a snapshot of the loads currently running."""
+        return LoadManager.scheduler.get_active_items()
+
     @staticmethod
     def initialize(status_change_callback: Callable) -> None:
         """
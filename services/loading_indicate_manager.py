@@ -1,35 +1,55 @@
 import threading
-import time
+from typing import Any
 
-from settings import GeneralSettings
+from .tick_scheduler import TickScheduler
 
 
 class LoadingIndicateManager:
     """
-    Manages a loading indicator by displaying dots in a loop.
+    Manages the loading indicator dots of all loading widgets.
+
+    Widgets register while they load. On every tick the dots count moves on and the widgets
+    that are shown get ``update_loading_animation(dots_count)`` in one pass on the Tk thread.
+    Widgets that are hidden, e.g. in another tab or out of view, are skipped.
     """
 
     dots_count: int = 1
     max_dots_count: int = 4
 
+    widgets: list[Any] = []
+    # Held for a whole pass, so no widget gets dots after it stopped its animation
+    lock = threading.RLock()
+
     @staticmethod
-    def loading_indicator() -> None:
-        """
-        Displays loading indicator dots in a loop.
+    def register_widget(widget: Any) -> None:
+        with LoadingIndicateManager.lock:
+            if widget not in LoadingIndicateManager.widgets:
+                LoadingIndicateManager.widgets.append(widget)
 
-        This method continuously updates the dots_count to create a loading indicator effect.
-        """
-        while True:
-            for LoadingIndicateManager.dots_count in range(1, LoadingIndicateManager.max_dots_count + 1):  # noqa: B020
-                time.sleep(GeneralSettings.settings["update_delay"])
+    @staticmethod
+    def unregister_widget(widget: Any) -> None:
+        with LoadingIndicateManager.lock:
+            if widget in LoadingIndicateManager.widgets:
+                LoadingIndicateManager.widgets.remove(widget)
+
+    @staticmethod
+    def tick() -> None:
+        """Move the dots on and show them on the visible loading widgets."""
+        LoadingIndicateManager.dots_count = (
+            LoadingIndicateManager.dots_count % LoadingIndicateManager.max_dots_count + 1
+        )
+        with LoadingIndicateManager.lock:
+            for widget in list(LoadingIndicateManager.widgets):
+                if not widget.winfo_exists():
+                    LoadingIndicateManager.unregister_widget(widget)
+                elif widget.winfo_viewable():
+                    widget.update_loading_animation(LoadingIndicateManager.dots_count)
 
     @staticmethod
     def initialize() -> None:
         """
         Initializes the loading indicator manager.
 
-        Starts a separate thread for running the loading indicator.
+        Adds the loading indicator to the tick scheduler.
         """
-        loading_indicator_thread = threading.Thread(target=LoadingIndicateManager.loading_indicator)
-        loading_indicator_thread.daemon = True
-        loading_indicator_thread.start()
+        TickScheduler.add_callback(LoadingIndicateManager.tick)
@@ -0,0 +1,156 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any
+
+from pytubefix import extract
+from pytubefix.exceptions import RegexMatchError
+
+from utils import DataBaseUtility
+from utils.logger import get_logger
+
+from .history_manager import HistoryManager
+
+_log = get_logger(__name__)
+
+
+class MetadataCache:
+    """
+    Persistent cache of video metadata, keyed by video id.
+
+    Stores what ``AddedVideo`` shows before a download (title, channel, length, thumbnail
+    url and the supported download types) in an SQLite database next to the history
+    database, so re-adding a known video does not hit YouTube again. Stream urls expire
+    within hours and are not cached, they are fetched when a download starts.
+    """
+
+    data_base_name = "metadata_cache.db"
+    data_base = os.path.join(HistoryManager.data_base_dir, data_base_name)
+    # Seconds a cached entry stays valid
+    ttl: int = 7 * 24 * 60 * 60
+    # Video ids looked up per query by get_many
+    batch_size: int = 500
+    connection: sqlite3.Connection | None = None
+    # One connection is shared by the load threads
+    _lock = threading.Lock()
+
+    @staticmethod
+    def initialize() -> None:
+        """Open the cache database, creating it if needed, and drop expired entries."""
+        try:
+            if not os.path.exists(MetadataCache.data_base):
+                DataBaseUtility.create_data_base(os.path.dirname(MetadataCache.data_base), MetadataCache.data_base_name)
+            DataBaseUtility.create_table(
+                MetadataCache.data_base,
+                "videos",
+                "video_id TEXT PRIMARY KEY, data TEXT, cached_at REAL",
+            )
+            MetadataCache.connection = sqlite3.connect(MetadataCache.data_base, check_same_thread=False)
+            with MetadataCache._lock:
+                MetadataCache.connection.execute(
+                    "DELETE FROM videos WHERE cached_at < ?", (time.time() - MetadataCache.ttl,)
+                )
+                MetadataCache.connection.commit()
+        except sqlite3.Error as error:
+            # The app works without the cache, just slower
+            _log.error("metadata cache unavailable: %s", error)
+            MetadataCache.connection = None
+
+    @staticmethod
+    def get_video_id(video_url: str) -> str | None:
+        """Get the video id of a YouTube url, or None if it has none."""
+        try:
+            return extract.video_id(video_url)
+        except RegexMatchError:
+            return None
+
+    @staticmethod
+    def get(video_id: str) -> dict[str, Any] | None:
+        """
+        Get the cached metadata of a video.
+
+        Args:
+            video_id (str): The video id.
+
+        Returns:
+            dict | None: The metadata, or None if the video is not cached or the entry expired.
+        """
+        if MetadataCache.connection is None:
+            return None
+        try:
+            with MetadataCache._lock:
+                row = MetadataCache.connection.execute(
+                    "SELECT data, cached_at FROM videos WHERE video_id = ?", (video_id,)
+                ).fetchone()
+            if row is None or time.time() - row[1] > MetadataCache.ttl:
+                return None
+            return json.loads(row[0])
+        except (sqlite3.Error, ValueError) as error:
+            _log.error("failed to read metadata of %s from cache: %s", video_id, error)
+            return None
+
+    @staticmethod
+    def get_many(video_ids: list[str]) -> dict[str, dict[str, Any]]:
+        """
+        Get the cached metadata of many videos at once, e.g. all videos of a playlist.
+
+        Args:
+            video_ids (list[str]): The video ids.
+
+        Returns:
+            dict: Video id to metadata, for the videos that are cached and not expired.
+        """
+        if MetadataCache.connection is None:
+            return {}
+        cached = {}
+        oldest = time.time() - MetadataCache.ttl
+        try:
+            # Stay below the SQLite limit of bound parameters per query
+            for start in range(0, len(video_ids), MetadataCache.batch_size):
+                batch = video_ids[start : start + MetadataCache.batch_size]
+                placeholders = ", ".join("?" * len(batch))
+                with MetadataCache._lock:
+                    rows = MetadataCache.connection.execute(
+                        f"SELECT video_id, data FROM videos WHERE cached_at >= ? AND video_id IN ({placeholders})",
+                        (oldest, *batch),
+                    ).fetchall()
+                for video_id, data in rows:
+                    cached[video_id] = json.loads(data)
+        except (sqlite3.Error, ValueError) as error:
+            _log.error("failed to read metadata from cache: %s", error)
+        return cached
+
+    @staticmethod
+    def put(video_id: str, data: dict[str, Any]) -> None:
+        """
+        Cache the metadata of a video, replacing any older entry.
+
+        Args:
+            video_id (str): The video id.
+            data (dict): JSON serializable metadata.
+        """
+        if MetadataCache.connection is None:
+            return
+        try:
+            with MetadataCache._lock:
+                MetadataCache.connection.execute(
+                    "INSERT OR REPLACE INTO videos (video_id, data, cached_at) VALUES (?, ?, ?)",
+                    (video_id, json.dumps(data), time.time()),
+                )
+                MetadataCache.connection.commit()
+        except (sqlite3.Error, TypeError, ValueError) as error:
+            _log.error("failed to cache metadata of %s: %s", video_id, error)
+
+    @staticmethod
+    def remove(video_id: str) -> None:
+        """Drop the cached metadata of a video."""
+        if MetadataCache.connection is None:
+            return
+        try:
+            with MetadataCache._lock:
+                MetadataCache.connection.execute("DELETE FROM videos WHERE video_id = ?", (video_id,))
+                MetadataCache.connection.commit()
+        except sqlite3.Error as error:
+            _log.error("failed to remove metadata of %s from cache: %s", video_id, error)
@@ -0,0 +1,95 @@
+import threading
+from collections import Counter
+from typing import Any
+
+from utils import DownloadInfoUtility
+
+
+class PlaylistProgress:
+    """
+    Running download totals and state counts of the videos of a playlist.
+
+    Each video reports its own counters and only the difference to its last report is added
+    to the totals, so a progress update or state change costs the same however many videos
+    the playlist has.
+    """
+
+    def __init__(self):
+        self.states: dict[Any, str] = {}
+        self.state_counts: Counter[str] = Counter()
+        # the (bytes downloaded, file size, download time, completion, resumed bytes) last added per video
+        self.contributions: dict[Any, tuple[int, int, float, float, int]] = {}
+
+        self.bytes_downloaded: int = 0
+        self.file_size: int = 0
+        self.download_time: float = 0.0
+        self.completion: float = 0.0
+        # part of bytes_downloaded kept from earlier attempts, not downloaded in download_time
+        self.resumed_bytes: int = 0
+
+        # videos report progress from the download loop and states from the Tk thread
+        self.lock = threading.Lock()
+
+    def set_state(self, video: Any, state: str) -> str | None:
+        """
+        Move a video to another state.
+
+        Returns:
+            str | None: The previous state of the video, None if it had none.
+        """
+        with self.lock:
+            previous_state = self.states.get(video)
+            if previous_state is not None:
+                self.state_counts[previous_state] -= 1
+            self.states[video] = state
+            self.state_counts[state] += 1
+            return previous_state
+
+    def get_count(self, state: str) -> int:
+        """Get the number of videos in a state."""
+        return self.state_counts[state]
+
+    def update(
+        self, video: Any, bytes_downloaded: int, file_size: int, download_time: float, resumed_bytes: int = 0
+    ) -> None:
+        """
+        Replace the progress of a video in the totals with its current counters.
+
+        A video with an unknown file size does not count yet, like before its download started.
+        """
+        if file_size:
+            contribution = (bytes_downloaded, file_size, download_time, bytes_downloaded / file_size, resumed_bytes)
+        else:
+            contribution = (0, 0, 0.0, 0.0, 0)
+        with self.lock:
+            self.add_contribution(self.contributions.get(video, (0, 0, 0.0, 0.0, 0)), -1)
+            self.add_contribution(contribution, 1)
+            self.contributions[video] = contribution
+
+    def remove(self, video: Any) -> str | None:
+        """
+        Take a video out of the totals and the state counts.
+
+        Returns:
+            str | None: The state the video was in, None if it had none.
+        """
+        with self.lock:
+            self.add_contribution(self.contributions.pop(video, (0, 0, 0.0, 0.0, 0)), -1)
+            state = self.states.pop(video, None)
+            if state is not None:
+                self.state_counts[state] -= 1
+            return state
+
+    def get_estimated_time(self) -> int:
+        """The seconds left at the speed so far, the resumed bytes took no download time."""
+        return DownloadInfoUtility.get_estimated_time(
+            self.file_size - self.resumed_bytes, self.download_time, self.bytes_downloaded - self.resumed_bytes
+        )
+
+    def add_contribution(self, contribution: tuple[int, int, float, float, int], sign: int) -> None:
+        bytes_downloaded, file_size, download_time, completion, resumed_bytes = contribution
+        self.bytes_downloaded += sign * bytes_downloaded
+        self.file_size += sign * file_size
+        self.download_time += sign * download_time
+        self.completion += sign * completion
+        self.resumed_bytes += sign * resumed_bytes
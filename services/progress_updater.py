@@ -0,0 +1,48 @@
+import threading
+from typing import Any
+
+from .tick_scheduler import TickScheduler
+
+
+class ProgressUpdater:
+    """
+    Renders download progress on the Tk thread at a fixed frame rate.
+
+    Download workers only update their counters and ``publish`` the widget. Once per frame
+    the widgets published since the last frame get one ``render_progress()`` call, however
+    many chunks arrived in between. Widgets that are not shown stay pending until they are.
+    """
+
+    frame_interval: float = 0.1
+
+    # insertion ordered set of the widgets with new progress
+    pending: dict[Any, None] = {}
+    lock = threading.Lock()
+
+    @staticmethod
+    def publish(widget: Any) -> None:
+        """Mark the progress of a widget as changed, safe to call from any thread."""
+        with ProgressUpdater.lock:
+            ProgressUpdater.pending[widget] = None
+
+    @staticmethod
+    def render() -> None:
+        """Render the progress of the shown widgets that published since the last frame."""
+        with ProgressUpdater.lock:
+            widgets = list(ProgressUpdater.pending)
+            ProgressUpdater.pending.clear()
+        hidden_widgets = []
+        for widget in widgets:
+            if not widget.winfo_exists():
+                continue
+            if widget.winfo_viewable():
+                widget.render_progress()
+            else:
+                hidden_widgets.append(widget)
+        with ProgressUpdater.lock:
+            for widget in hidden_widgets:
+                ProgressUpdater.pending.setdefault(widget, None)
+
+    @staticmethod
+    def initialize() -> None:
+        TickScheduler.add_callback(ProgressUpdater.render, interval=ProgressUpdater.frame_interval)
@@ -0,0 +1,152 @@
+import heapq
+import itertools
+from collections import deque
+from collections.abc import Hashable
+from typing import Any
+
+
+class FifoQueuePolicy:
+    """
+    Queue items in the order they were pushed, ignoring priority and group.
+
+    Every queue policy has the same methods, so ``QueueScheduler`` can use any of them.
+    None of them is thread-safe on its own, the scheduler calls them under its lock.
+    """
+
+    def __init__(self):
+        self._items: deque = deque()
+
+    def push(self, item: Any, priority: int = 0, group: Hashable | None = None) -> None:  # noqa: ARG002
+        """Add an item to the back of the queue, priority and group are only accepted for compatibility."""
+        self._items.append(item)
+
+    def pop(self) -> Any:
+        """Remove and return the next item to start."""
+        return self._items.popleft()
+
+    def remove(self, item: Any) -> bool:
+        """Remove an item, returning False if it is not queued."""
+        try:
+            self._items.remove(item)
+            return True
+        except ValueError:
+            return False
+
+    def move_to_front(self, item: Any) -> bool:
+        """Make a queued item the next one to start, returning False if it is not queued."""
+        if not self.remove(item):
+            return False
+        self._items.appendleft(item)
+        return True
+
+    def get_items(self) -> list:
+        """Return the queued items in the order they would start."""
+        return list(self._items)
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self._items
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+class FairShareQueuePolicy:
+    """
+    Start higher priority items first and share slots round-robin between groups.
+
+    Items with the same group (the videos of one playlist) are started in priority, then
+    push order. Between groups, the next slot goes to the group with the highest priority
+    head item, and ties go to the group that started an item least recently. A playlist
+    queued first therefore no longer holds back every video added after it.
+
+    Items pushed without a group, the standalone videos, share one group. Items moved to
+    the front are started before anything else, most recently moved first.
+    """
+
+    STANDALONE_GROUP = "standalone"
+
+    def __init__(self):
+        self._front: deque = deque()
+        # group -> heap of (-priority, sequence, item)
+        self._groups: dict[Hashable, list] = {}
+        # Groups in round-robin order, the next one to get a slot first
+        self._rotation: deque = deque()
+        self._item_groups: dict[Any, Hashable] = {}
+        self._sequence = itertools.count()
+
+    def push(self, item: Any, priority: int = 0, group: Hashable | None = None) -> None:
+        """Add an item behind the queued items of its group with the same or higher priority."""
+        if group is None:
+            group = FairShareQueuePolicy.STANDALONE_GROUP
+        if group not in self._groups:
+            self._groups[group] = []
+            self._rotation.append(group)
+        heapq.heappush(self._groups[group], (-priority, next(self._sequence), item))
+        self._item_groups[item] = group
+
+    def pop(self) -> Any:
+        """Remove and return the next item to start."""
+        if self._front:
+            return self._front.popleft()
+
+        best_group = None
+        best_priority = None
+        for group in self._rotation:
+            priority = self._groups[group][0][0]
+            if best_priority is None or priority < best_priority:
+                best_group, best_priority = group, priority
+
+        item = heapq.heappop(self._groups[best_group])[2]
+        del self._item_groups[item]
+        # The group goes to the back of the rotation, or away if it has nothing left
+        self._rotation.remove(best_group)
+        if self._groups[best_group]:
+            self._rotation.append(best_group)
+        else:
+            del self._groups[best_group]
+        return item
+
+    def remove(self, item: Any) -> bool:
+        """Remove an item, returning False if it is not queued."""
+        if item in self._item_groups:
+            group = self._item_groups.pop(item)
+            heap = self._groups[group]
+            heap.pop(next(index for index, entry in enumerate(heap) if entry[2] == item))
+            if heap:
+                heapq.heapify(heap)
+            else:
+                del self._groups[group]
+                self._rotation.remove(group)
+            return True
+        try:
+            self._front.remove(item)
+            return True
+        except ValueError:
+            return False
+
+    def move_to_front(self, item: Any) -> bool:
+        """Make a queued item the next one to start, returning False if it is not queued."""
+        if not self.remove(item):
+            return False
+        self._front.appendleft(item)
+        return True
+
+    def get_items(self) -> list:
+        """Return the queued items in the order they would start."""
+        ordered = list(self._front)
+        rotation = deque(self._rotation)
+        heaps = {group: sorted(heap) for group, heap in self._groups.items()}
+        # Replay pop() on sorted copies so the real heaps stay untouched
+        while rotation:
+            best_group = min(rotation, key=lambda group: heaps[group][0][0])
+            ordered.append(heaps[best_group].pop(0)[2])
+            rotation.remove(best_group)
+            if heaps[best_group]:
+                rotation.append(best_group)
+        return ordered
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self._item_groups or item in self._front
+
+    def __len__(self) -> int:
+        return len(self._item_groups) + len(self._front)
@@ -0,0 +1,187 @@
+import threading
+from collections.abc import Callable, Hashable
+from typing import Any
+
+from services.queue_policy import FairShareQueuePolicy, FifoQueuePolicy
+from utils.logger import get_logger
+
+_log = get_logger(__name__)
+
+
+class QueueScheduler:
+    """
+    Lock-protected queue and active-slot bookkeeping shared by the queue managers.
+
+    Items wait in a queue policy until ``schedule`` moves them into a free active slot and
+    starts them. The policy decides which item goes next. All state changes happen under
+    one lock, so registering, unregistering and scheduling from several threads never
+    double-start an item or lets the counts drift.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        get_max_active: Callable[[], int],
+        start_item: Callable[[Any], None],
+        policy: FairShareQueuePolicy | FifoQueuePolicy | None = None,
+    ):
+        """
+        Args:
+            name (str): Name used in log messages, e.g. "download".
+            get_max_active (Callable): Returns how many items may be active at once.
+            start_item (Callable): Starts a single item, called without the lock held.
+            policy (FairShareQueuePolicy | FifoQueuePolicy, optional): Orders the queued items.
+                Defaults to ``FairShareQueuePolicy``.
+        """
+        self.name: str = name
+        self.get_max_active: Callable[[], int] = get_max_active
+        self.start_item: Callable[[Any], None] = start_item
+        self._lock = threading.RLock()
+        self._queued: FairShareQueuePolicy | FifoQueuePolicy = policy if policy is not None else FairShareQueuePolicy()
+        self._active: list = []
+        # Slots taken by work that is not a queued item, e.g. hedged load attempts
+        self._reserved: int = 0
+        # item -> (priority, group) for queued and active items, to re-queue failed starts
+        self._registrations: dict[Any, tuple[int, Hashable | None]] = {}
+
+    def register(self, item: Any, priority: int = 0, group: Hashable | None = None) -> bool:
+        """
+        Add an item to the queue.
+
+        Args:
+            item (Any): The item to queue.
+            priority (int): Items with a higher priority start first.
+            group (Hashable, optional): Items of the same group, e.g. the videos of a playlist,
+                share their slots fairly with other groups.
+
+        Returns:
+            bool: False if the item was already queued or active.
+        """
+        with self._lock:
+            if item in self._active or item in self._queued:
+                return False
+            self._queued.push(item, priority, group)
+            self._registrations[item] = (priority, group)
+            return True
+
+    def move_to_front(self, item: Any) -> bool:
+        """
+        Make a queued item the next one to start.
+
+        Returns:
+            bool: True if the item was queued.
+        """
+        with self._lock:
+            return self._queued.move_to_front(item)
+
+    def unregister_from_queued(self, item: Any) -> bool:
+        """
+        Remove an item from the queue.
+
+        Returns:
+            bool: True if the item was queued.
+        """
+        with self._lock:
+            if not self._queued.remove(item):
+                return False
+            self._registrations.pop(item, None)
+            return True
+
+    def unregister_from_active(self, item: Any) -> bool:
+        """
+        Free the active slot of an item.
+
+        Returns:
+            bool: True if the item was active.
+        """
+        with self._lock:
+            try:
+                self._active.remove(item)
+            except ValueError:
+                return False
+            self._registrations.pop(item, None)
+            return True
+
+    def take_startable(self) -> list:
+        """
+        Move as many queued items into active slots as the limit allows.
+
+        Returns:
+            list: The items that were moved, in queue order.
+        """
+        with self._lock:
+            startable = []
+            while self._queued and len(self._active) + self._reserved < self.get_max_active():
+                item = self._queued.pop()
+                self._active.append(item)
+                startable.append(item)
+            return startable
+
+    def schedule(self) -> int:
+        """
+        Fill every free active slot and start the items placed in them.
+
+        An item that fails to start goes back to the front of the queue and is retried
+        on the next call.
+
+        Returns:
+            int: The number of items started.
+        """
+        started = 0
+        startable = self.take_startable()
+        for index, item in enumerate(startable):
+            try:
+                self.start_item(item)
+                started += 1
+            except Exception:
+                _log.exception("failed to start %s", self.name)
+                with self._lock:
+                    # Put back this item and the ones not started yet, keeping their order
+                    for pending_item in reversed(startable[index:]):
+                        if pending_item in self._active:
+                            self._active.remove(pending_item)
+                            self._queued.push(pending_item, *self._registrations[pending_item])
+                            self._queued.move_to_front(pending_item)
+                break
+        return started
+
+    def reserve_slot(self) -> bool:
+        """
+        Take a free active slot for extra work that does not go through the queue.
+
+        Returns:
+            bool: False if every slot is in use.
+        """
+        with self._lock:
+            if len(self._active) + self._reserved >= self.get_max_active():
+                return False
+            self._reserved += 1
+            return True
+
+    def release_slot(self) -> None:
+        """Give back a slot taken with ``reserve_slot``."""
+        with self._lock:
+            self._reserved = max(self._reserved - 1, 0)
+
+    def is_queued(self, item: Any) -> bool:
+        """Check if an item is waiting in the queue."""
+        with self._lock:
+            return item in self._queued
+
+    def get_queued_count(self) -> int:
+        with self._lock:
+            return len(self._queued)
+
+    def get_active_count(self) -> int:
+        with self._lock:
+            return len(self._active)
+
+    def get_queued_items(self) -> list:
+        """Return a snapshot of the queued items."""
+        with self._lock:
+            return self._queued.get_items()
+
+    def get_active_items(self) -> list:
+        """Return a snapshot of the active items."""
+        with self._lock:
+            return list(self._active)
@@ -0,0 +1,354 @@
+import asyncio
+import concurrent.futures
+import contextlib
+import math
+import os
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from typing import BinaryIO
+
+from services.async_download_engine import AsyncDownloadEngine
+from services.bandwidth_limiter import BandwidthLimiter, TokenBucket
+from services.download_journal import DownloadJournal
+from utils.logger import get_logger
+
+_log = get_logger(__name__)
+
+
+class SegmentedDownloader:
+    """
+    Downloads a single stream over several connections at once.
+
+    The target file is preallocated to the full stream size and split into byte ranges.
+    At most ``connections`` worker tasks on the ``AsyncDownloadEngine`` loop take the ranges
+    in turn and fetch each one in sub-requests of ``chunk_size`` bytes, written straight to
+    their offset in the file.
+    The owner drains the progress events with ``iter_progress``.
+
+    When a ``DownloadJournal`` is given, ranges recorded in it are kept on disk and only
+    the missing ones are requested again.
+
+    When a ``sink`` is given instead, the stream is written to it strictly in order over a
+    single connection, which is what pipes need. A pipe write blocks while ffmpeg reads
+    another input, so each sink gets its own writer thread: blocked pipe writes never take
+    the threads of the default executor that the disk writes of every download share.
+
+    A paused download makes no new requests until it is resumed. Ranged workers hold no
+    connection between sub-requests, a stream of unknown size is closed once the pause
+    lasts longer than ``pause_release_delay`` and continued with a ranged request on resume.
+
+    Every piece received is paced by ``BandwidthLimiter``, together with the optional
+    ``download_bucket`` shared by the streams of one download.
+
+    All methods must be called from the engine loop.
+    """
+
+    # Seconds a paused stream of unknown size keeps its response open, below the read timeout
+    pause_release_delay: float = 5.0
+    # Chunks written between syncing the file and recording them in the journal, at most
+    # this many chunks per worker are downloaded again after a crash
+    journal_sync_chunks: int = 8
+
+    def __init__(
+        self,
+        url: str,
+        file_path: str,
+        file_size: int,
+        connections: int = 1,
+        chunk_size: int = 2097152,
+        journal: DownloadJournal | None = None,
+        progress_queue: asyncio.Queue | None = None,
+        sink: BinaryIO | None = None,
+        download_bucket: TokenBucket | None = None,
+    ):
+        self.url: str = url
+        self.file_path: str = file_path
+        self.file_size: int = file_size
+        self.chunk_size: int = max(int(chunk_size), 1)
+        self.connections: int = max(int(connections), 1)
+        self.journal: DownloadJournal | None = journal
+        self.sink: BinaryIO | None = sink
+        self.download_bucket: TokenBucket | None = download_bucket
+        self._sink_executor: concurrent.futures.ThreadPoolExecutor | None = None
+        # Bytes already on disk from a previous attempt
+        self.resumed_bytes: int = 0
+
+        self.error: Exception | None = None
+        self._workers: list[asyncio.Task] = []
+        # Workers put (chunk_size, elapsed) tuples here, and None once they finish.
+        # Several downloaders may share one queue, see iter_combined_progress
+        self._progress_queue: asyncio.Queue = progress_queue if progress_queue is not None else asyncio.Queue()
+        self._cancel_event = asyncio.Event()
+        # Cleared while the download is paused, workers wait on it between requests
+        self._running_event = asyncio.Event()
+        self._running_event.set()
+
+    @staticmethod
+    def split_ranges(file_size: int, connections: int, chunk_size: int) -> list[tuple[int, int]]:
+        """
+        Split a file into contiguous, inclusive byte ranges, one per connection.
+
+        Range boundaries are aligned to ``chunk_size`` so every sub-request except the
+        last one of the file has the same size.
+
+        Args:
+            file_size (int): Total size of the file in bytes.
+            connections (int): Maximum number of ranges to create.
+            chunk_size (int): Size of a single sub-request in bytes.
+
+        Returns:
+            list[tuple[int, int]]: The (start, end) byte ranges, end inclusive.
+        """
+        if file_size <= 0:
+            return []
+
+        total_chunks = math.ceil(file_size / chunk_size)
+        connections = max(min(connections, total_chunks), 1)
+        chunks_per_range = math.ceil(total_chunks / connections)
+        range_size = chunks_per_range * chunk_size
+
+        ranges = []
+        for start in range(0, file_size, range_size):
+            ranges.append((start, min(start + range_size, file_size) - 1))
+        return ranges
+
+    def start(self) -> None:
+        """
+        Preallocate the target file and start the workers, at most ``connections`` of them.
+        """
+        if self.sink is not None:
+            self._sink_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="sink-writer")
+            self._start_worker(self._download_to_sink)
+            return
+
+        if self.file_size <= 0:
+            # Size is unknown, fall back to a single sequential connection
+            self._start_worker(self._download_sequential)
+            return
+
+        if self.journal is not None and self.journal.ranges:
+            missing_ranges = self.journal.missing_ranges()
+            self.resumed_bytes = self.journal.completed_bytes()
+            _log.info("resuming %r with %s bytes already on disk", self.file_path, self.resumed_bytes)
+        else:
+            with open(self.file_path, "wb") as file:
+                file.truncate(self.file_size)
+            if self.journal is not None:
+                self.journal.reset()
+            missing_ranges = [(0, self.file_size - 1)]
+
+        # A fragmented journal leaves many holes, they wait in a queue for a free worker
+        pending_ranges = deque(
+            (missing_start + start, missing_start + end)
+            for missing_start, missing_end in missing_ranges
+            for start, end in SegmentedDownloader.split_ranges(
+                missing_end - missing_start + 1, self.connections, self.chunk_size
+            )
+        )
+        for _ in range(min(self.connections, len(pending_ranges))):
+            self._start_worker(self._download_ranges, pending_ranges)
+
+    def _start_worker(self, target, *args) -> None:
+        worker = asyncio.get_running_loop().create_task(self._run_worker(target, *args))
+        # A done callback also fires for workers cancelled before they ever ran
+        worker.add_done_callback(lambda _worker: self._progress_queue.put_nowait(None))
+        self._workers.append(worker)
+
+    async def _run_worker(self, target, *args) -> None:
+        try:
+            await target(*args)
+        except Exception as error:
+            _log.error("segment download failed for %r: %s", self.file_path, error)
+            if self.error is None:
+                self.error = error
+            # No point finishing the other ranges once one of them is lost
+            self.cancel()
+
+    async def _throttle(self, size: int) -> None:
+        await BandwidthLimiter.throttle(size, self.download_bucket)
+
+    async def _download_ranges(self, pending_ranges: deque[tuple[int, int]]) -> None:
+        while pending_ranges:
+            await self._download_range(*pending_ranges.popleft())
+            if self._cancel_event.is_set():
+                return
+
+    async def _download_range(self, start: int, end: int) -> None:
+        with open(self.file_path, "r+b") as file:
+            # Written but not yet synced and recorded in the journal
+            unsynced_ranges = []
+            position = start
+            while position <= end:
+                if unsynced_ranges and (
+                    len(unsynced_ranges) >= SegmentedDownloader.journal_sync_chunks or not self._running_event.is_set()
+                ):
+                    await asyncio.to_thread(self._sync_journal, file, unsynced_ranges)
+                    unsynced_ranges = []
+                await self._running_event.wait()
+                if self._cancel_event.is_set():
+                    return
+
+                stop = min(position + self.chunk_size, end + 1) - 1
+                time_s = time.time()
+                data = await AsyncDownloadEngine.fetch_range(
+                    self.url, position, stop, self._cancel_event, self._throttle
+                )
+                time_e = time.time()
+                if not data:
+                    raise ConnectionError(f"empty response for range {position}-{stop}")
+
+                # Disk writes and journal updates stay off the loop
+                await asyncio.to_thread(self._write_at, file, position, data)
+                unsynced_ranges.append((position, position + len(data) - 1))
+                position += len(data)
+                self._progress_queue.put_nowait((len(data), time_e - time_s))
+
+            if unsynced_ranges:
+                await asyncio.to_thread(self._sync_journal, file, unsynced_ranges)
+
+    def _write_at(self, file: BinaryIO, position: int, data: bytes) -> None:
+        file.seek(position)
+        file.write(data)
+
+    def _sync_journal(self, file: BinaryIO, ranges: list[tuple[int, int]]) -> None:
+        if self.journal is None:
+            return
+        # Only record the ranges once the bytes are on disk, an OS crash may lose the page cache
+        file.flush()
+        os.fsync(file.fileno())
+        self.journal.add_ranges(ranges)
+
+    async def _download_sequential(self) -> None:
+        with open(self.file_path, "wb") as file:
+            await self._write_stream(file)
+
+    async def _download_to_sink(self) -> None:
+        try:
+            await self._download_to_sink_in_order()
+        finally:
+            # A write still blocked on the pipe ends once the muxer closes or kills ffmpeg
+            self._sink_executor.shutdown(wait=False)
+
+    async def _download_to_sink_in_order(self) -> None:
+        if self.file_size <= 0:
+            await self._write_stream(self.sink)
+            return
+
+        position = 0
+        while position < self.file_size:
+            await self._running_event.wait()
+            if self._cancel_event.is_set():
+                return
+
+            stop = min(position + self.chunk_size, self.file_size) - 1
+            time_s = time.time()
+            data = await AsyncDownloadEngine.fetch_range(self.url, position, stop, self._cancel_event, self._throttle)
+            time_e = time.time()
+            if not data:
+                raise ConnectionError(f"empty response for range {position}-{stop}")
+
+            await self._write_to_file(self.sink, data)
+            position += len(data)
+            self._progress_queue.put_nowait((len(data), time_e - time_s))
+
+    async def _write_to_file(self, file: BinaryIO, data: bytes) -> None:
+        if file is not self.sink:
+            await asyncio.to_thread(file.write, data)
+            return
+        await asyncio.get_running_loop().run_in_executor(self._sink_executor, self._write_to_sink, data)
+
+    def _write_to_sink(self, data: bytes) -> None:
+        self.sink.write(data)
+        # Nothing may linger in our buffer, ffmpeg can block on this input while waiting for it
+        self.sink.flush()
+
+    async def _write_stream(self, file: BinaryIO) -> None:
+        position = 0
+        while True:
+            released = False
+            time_s = time.time()
+            stream = AsyncDownloadEngine.iter_stream(self.url, self.chunk_size, self._throttle, start=position)
+            async with contextlib.aclosing(stream):
+                async for data in stream:
+                    time_e = time.time()
+                    await self._write_to_file(file, data)
+                    position += len(data)
+                    self._progress_queue.put_nowait((len(data), time_e - time_s))
+
+                    if not await self._wait_while_paused():
+                        released = True
+                        break
+                    if self._cancel_event.is_set():
+                        return
+                    time_s = time.time()
+            if not released:
+                return
+
+            # The response is closed, continue from the first missing byte once resumed
+            await self._running_event.wait()
+            if self._cancel_event.is_set():
+                return
+
+    async def _wait_while_paused(self) -> bool:
+        """
+        Wait until the download is resumed, for at most ``pause_release_delay`` seconds.
+
+        Returns:
+            bool: False if the download is still paused, the open response should be released.
+        """
+        if self._running_event.is_set():
+            return True
+        try:
+            await asyncio.wait_for(self._running_event.wait(), SegmentedDownloader.pause_release_delay)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    def iter_progress(self) -> AsyncIterator[tuple[int, float]]:
+        """
+        Yield ``(bytes_written, request_time)`` for each chunk written by any worker.
+
+        The iterator is exhausted once every worker has finished, whether it succeeded
+        or not. Check ``error`` afterwards to tell the two apart.
+        """
+        return SegmentedDownloader.iter_combined_progress([self])
+
+    @staticmethod
+    async def iter_combined_progress(downloaders: list["SegmentedDownloader"]) -> AsyncIterator[tuple[int, float]]:
+        """
+        Yield the progress events of several started downloaders that share one progress queue.
+
+        Args:
+            downloaders (list[SegmentedDownloader]): The downloaders, all created with the same ``progress_queue``.
+
+        Returns:
+            AsyncIterator[tuple[int, float]]: ``(bytes_written, request_time)`` for each chunk written by any worker.
+        """
+        if not downloaders:
+            return
+        progress_queue = downloaders[0]._progress_queue
+        total_workers = sum(len(downloader._workers) for downloader in downloaders)
+        finished_workers = 0
+        while finished_workers < total_workers:
+            event = await progress_queue.get()
+            if event is None:
+                finished_workers += 1
+            else:
+                yield event
+
+    def pause(self) -> None:
+        """Stop workers from starting new requests until ``resume`` is called."""
+        self._running_event.clear()
+
+    def resume(self) -> None:
+        """Let paused workers continue."""
+        self._running_event.set()
+
+    def cancel(self) -> None:
+        """Stop all workers, aborting their current request."""
+        self._cancel_event.set()
+        self._running_event.set()
+        for worker in self._workers:
+            if worker is not asyncio.current_task():
+                worker.cancel()
@@ -0,0 +1,130 @@
+import collections
+import os
+import re
+import subprocess
+import threading
+from typing import BinaryIO
+
+from utils.logger import get_logger
+
+_log = get_logger(__name__)
+
+
+class StreamingMuxer:
+    """
+    Runs ffmpeg with its inputs fed through pipes, so streams can be merged while they download.
+
+    Call ``open_inputs`` first, build the ffmpeg command with ``input_urls`` and pass it to
+    ``start``. Each writer then writes its stream, in order, to the matching file object in
+    ``inputs`` and ``close_inputs`` signals the end of the data.
+    """
+
+    def __init__(self, input_count: int = 2):
+        self.input_count: int = input_count
+        # Write ends of the pipes, one per ffmpeg input
+        self.inputs: list[BinaryIO] = []
+        # ffmpeg input urls of the read ends, e.g. "pipe:5"
+        self.input_urls: list[str] = []
+        self.process: subprocess.Popen | None = None
+        # Seconds of output ffmpeg has written so far, parsed from its "time=" output
+        self.progress: float = 0
+        self._read_fds: list[int] = []
+        self._stderr_lines: collections.deque = collections.deque(maxlen=20)
+        self._stderr_thread: threading.Thread | None = None
+
+    @staticmethod
+    def is_supported() -> bool:
+        """
+        Check if ffmpeg can be fed through inherited pipes on this platform.
+
+        Returns:
+            bool: True on POSIX systems, False on Windows.
+        """
+        return os.name == "posix"
+
+    def open_inputs(self) -> None:
+        """Create one pipe per input."""
+        for _ in range(self.input_count):
+            read_fd, write_fd = os.pipe()
+            self._read_fds.append(read_fd)
+            self.inputs.append(os.fdopen(write_fd, "wb"))
+            self.input_urls.append(f"pipe:{read_fd}")
+
+    def start(self, command: list[str]) -> None:
+        """
+        Start ffmpeg with the read ends of the pipes.
+
+        Args:
+            command (list[str]): The ffmpeg command, reading its inputs from ``input_urls``.
+        """
+        self.process = subprocess.Popen(
+            command,
+            stdin=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            universal_newlines=True,
+            pass_fds=self._read_fds,
+        )
+        # ffmpeg holds its own copies now, ours would keep the pipes from ever reaching EOF
+        for read_fd in self._read_fds:
+            os.close(read_fd)
+        self._read_fds = []
+
+        self._stderr_thread = threading.Thread(target=self._read_stderr, daemon=True)
+        self._stderr_thread.start()
+
+    def _read_stderr(self) -> None:
+        for line in self.process.stderr:
+            self._stderr_lines.append(line.rstrip())
+            time_match = re.search(r"time=(\d+):(\d+):(\d+\.\d+)", line)
+            if time_match:
+                hours, minutes, seconds = map(float, time_match.groups())
+                self.progress = hours * 3600 + minutes * 60 + seconds
+
+    def get_progress_percentage(self, duration: float) -> float:
+        """
+        Get the merge progress as a percentage of the given duration.
+
+        Args:
+            duration (float): The length of the media in seconds.
+
+        Returns:
+            float: The progress between 0 and 100.
+        """
+        if duration <= 0:
+            return 0
+        return min(self.progress / duration * 100, 100)
+
+    def is_running(self) -> bool:
+        return self.process is not None and self.process.poll() is None
+
+    def close_inputs(self) -> None:
+        """Close the write ends so ffmpeg sees the end of every stream."""
+        for pipe in self.inputs:
+            try:
+                pipe.close()
+            except Exception as error:
+                _log.warning("closing ffmpeg input pipe failed: %s", error)
+
+    def wait(self) -> int:
+        """
+        Wait for ffmpeg to finish writing the output.
+
+        Returns:
+            int: The exit code of ffmpeg.
+        """
+        return_code = self.process.wait()
+        if self._stderr_thread is not None:
+            self._stderr_thread.join()
+        if return_code != 0:
+            _log.error("streaming mux failed with exit code %s: %s", return_code, " | ".join(self._stderr_lines))
+        return return_code
+
+    def kill(self) -> None:
+        """Stop ffmpeg and release the pipes, unblocking any writer."""
+        if self.is_running():
+            self.process.kill()
+        self.close_inputs()
+        for read_fd in self._read_fds:
+            os.close(read_fd)
+        self._read_fds = []
@@ -0,0 +1,393 @@
+import concurrent.futures
+import io
+import multiprocessing
+import os
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any
+
+import requests
+from PIL import Image
+
+from utils import HttpUtility, ImageUtility
+from utils.logger import get_logger
+
+from .thumbnail_store import ThumbnailStore
+
+_log = get_logger(__name__)
+
+
+def crop_thumbnail(thumbnail: Image.Image) -> tuple[Image.Image, Image.Image]:
+    """
+    Cut a downloaded thumbnail to the shapes the app shows.
+
+    Returns:
+        tuple: The notification thumbnail and the thumbnail without the black bars of 4:3 thumbnails.
+    """
+    # getting downloaded thumbnail width and height
+    image_height = thumbnail.height
+    image_width = thumbnail.width
+
+    # og thumbnail for notifications
+    ignore_pos = int(image_height * 0.4 / 2)
+    notification_thumbnail = ImageUtility.crop_image(
+        thumbnail, start_position=(0, ignore_pos), end_position=(image_width, image_height - ignore_pos)
+    )
+
+    is_thumbnail_need_to_crop = round(image_width / 4 * 3) <= image_height
+
+    if is_thumbnail_need_to_crop:
+        ignore_pos = int(image_height * 0.25 / 2)
+        start_pos = (0, ignore_pos)
+        end_pos = (image_width, image_height - ignore_pos)
+        thumbnail = ImageUtility.crop_image(image=thumbnail, start_position=start_pos, end_position=end_pos)
+    return notification_thumbnail, thumbnail
+
+
+def add_thumbnail_effects(thumbnail: Image.Image, corner_radius: int) -> tuple[Image.Image, Image.Image]:
+    """
+    Returns:
+        tuple: The normal and hover versions of a thumbnail, with rounded corners.
+    """
+    thumbnail_hover = ImageUtility.create_image_with_hover_effect(image=thumbnail, intensity_increase=50)
+    thumbnail = ImageUtility.create_image_with_rounded_corners(thumbnail, radius=corner_radius)
+    thumbnail_hover = ImageUtility.create_image_with_rounded_corners(thumbnail_hover, radius=corner_radius)
+    return thumbnail, thumbnail_hover
+
+
+def download_thumbnail(thumbnail_urls: list[str]) -> tuple[str, bytes]:
+    """
+    Download the first thumbnail that exists from a list of urls.
+
+    Returns:
+        tuple[str, bytes]: The url downloaded and the image file.
+    """
+    for thumbnail_url in thumbnail_urls[:-1]:
+        try:
+            return thumbnail_url, ImageUtility.download_image_data(image_url=thumbnail_url)
+        except requests.HTTPError as error:
+            # Only a missing variant is worth trying the next one for
+            if error.response is None or error.response.status_code != 404:
+                raise
+    return thumbnail_urls[-1], ImageUtility.download_image_data(image_url=thumbnail_urls[-1])
+
+
+def create_thumbnails(image_data: bytes, thumbnail_size: tuple[int, int]) -> dict:
+    """
+    Make the normal and hover images shown on the video widgets from a downloaded thumbnail.
+
+    Runs in a worker process of the ``ThumbnailProcessor``, so it only takes and returns
+    plain data. Nothing is written to disk.
+
+    Args:
+        image_data (bytes): The thumbnail file, from ``download_thumbnail``.
+        thumbnail_size (tuple[int, int]): Size (width, height) of the thumbnail shown on the video widgets.
+
+    Returns:
+        dict: ``{"thumbnails": (normal, hover), "timings": {...}}``, the raw ``(mode, size, pixels)``
+            of both images and the seconds spent in each stage.
+    """
+    timings = {}
+
+    time_s = time.perf_counter()
+    thumbnail = Image.open(io.BytesIO(image_data))
+    thumbnail.load()
+    timings["decode"] = time.perf_counter() - time_s
+
+    time_s = time.perf_counter()
+    corner_radius = int(thumbnail.width / 18)
+    _notification_thumbnail, thumbnail = crop_thumbnail(thumbnail)
+    timings["crop"] = time.perf_counter() - time_s
+
+    time_s = time.perf_counter()
+    thumbnails = tuple(
+        ImageUtility.resize_image(image=image, new_size=thumbnail_size)
+        for image in add_thumbnail_effects(thumbnail, corner_radius)
+    )
+    timings["effects"] = time.perf_counter() - time_s
+
+    return {
+        "thumbnails": tuple((image.mode, image.size, image.tobytes()) for image in thumbnails),
+        "timings": timings,
+    }
+
+
+def save_thumbnail_files(image_data: bytes, paths: dict[str, str]) -> dict[str, float]:
+    """
+    Save the thumbnail files kept after the app closes, for the history and notifications.
+
+    Runs in a worker process of the ``ThumbnailProcessor``.
+
+    Args:
+        image_data (bytes): The downloaded thumbnail file.
+        paths (dict[str, str]): Where to save the files, by the name of the video attribute.
+
+    Returns:
+        dict[str, float]: The seconds spent saving.
+    """
+    time_s = time.perf_counter()
+    thumbnail = Image.open(io.BytesIO(image_data))
+    corner_radius = int(thumbnail.width / 18)
+    notification_thumbnail, thumbnail = crop_thumbnail(thumbnail)
+    thumbnail, thumbnail_hover = add_thumbnail_effects(thumbnail, corner_radius)
+
+    for image, path in (
+        (notification_thumbnail, paths["notification_thumbnail_image_path"]),
+        (thumbnail, paths["history_normal_thumbnail_image_path"]),
+        (thumbnail_hover, paths["history_hover_thumbnail_image_path"]),
+    ):
+        # Another job may save the same video, a file is only ever seen complete
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+        image.save(temporary_path, format="PNG")
+        os.replace(temporary_path, path)
+    return {"save": time.perf_counter() - time_s}
+
+
+def load_stored_thumbnails(paths: dict[str, str], thumbnail_size: tuple[int, int]) -> dict:
+    """
+    Make the images shown on the video widgets from the history thumbnails saved before.
+
+    Runs in a worker process of the ``ThumbnailProcessor``.
+
+    Returns:
+        dict: ``{"thumbnails": (normal, hover), "timings": {...}}``, like ``create_thumbnails``.
+    """
+    timings = {}
+
+    time_s = time.perf_counter()
+    images = [
+        Image.open(paths["history_normal_thumbnail_image_path"]),
+        Image.open(paths["history_hover_thumbnail_image_path"]),
+    ]
+    for image in images:
+        image.load()
+    timings["decode"] = time.perf_counter() - time_s
+
+    time_s = time.perf_counter()
+    thumbnails = [ImageUtility.resize_image(image=image, new_size=thumbnail_size) for image in images]
+    timings["effects"] = time.perf_counter() - time_s
+
+    return {
+        "thumbnails": tuple((image.mode, image.size, image.tobytes()) for image in thumbnails),
+        "timings": timings,
+    }
+
+
+class ThumbnailProcessor:
+    """
+    Creates the thumbnails of loaded videos in a pool of worker processes.
+
+    Decoding, cropping, the hover and corner effects and PNG encoding are CPU bound Pillow
+    work that would otherwise hold the GIL of the app while playlists load. Load threads
+    ``submit`` a job and wait on its future, which costs them no CPU.
+
+    Thumbnails are downloaded by a pool of threads in the app, through ``HttpUtility``, and
+    only the downloaded files are sent to the worker processes, so a slow server never keeps
+    a worker from processing. The workers are spawned rather than forked, forking the app
+    would copy its threads' locks and the Tk state into them.
+
+    The images shown on the widgets come back in memory and are never written to disk.
+    Only the files the history and notifications need are saved, later, by ``save_files``,
+    into the ``ThumbnailStore``. A video stored before is made from those files instead of
+    being downloaded again, see ``submit_stored``.
+
+    The time spent in each stage is summed up, see ``get_stage_timings``.
+    """
+
+    max_workers: int = max(min((os.cpu_count() or 1) - 1, 4), 1)
+    # More would only wait for a free connection to the image server
+    max_download_threads: int = HttpUtility.max_connections_per_host
+
+    executor: concurrent.futures.ProcessPoolExecutor | None = None
+    download_executor: concurrent.futures.ThreadPoolExecutor | None = None
+    # stage name: [total seconds, number of jobs]
+    stage_timings: dict[str, list] = {}
+    lock = threading.Lock()
+
+    @staticmethod
+    def initialize() -> None:
+        """
+        Start the worker processes and download threads if they are not running yet.
+        """
+        with ThumbnailProcessor.lock:
+            if ThumbnailProcessor.executor is None:
+                ThumbnailProcessor.executor = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=ThumbnailProcessor.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            if ThumbnailProcessor.download_executor is None:
+                ThumbnailProcessor.download_executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=ThumbnailProcessor.max_download_threads,
+                    thread_name_prefix="thumbnail-download",
+                )
+
+    @staticmethod
+    def run(function: Callable, *args: Any) -> concurrent.futures.Future:
+        ThumbnailProcessor.initialize()
+        try:
+            return ThumbnailProcessor.executor.submit(function, *args)
+        except BrokenProcessPool:
+            # A worker died, e.g. killed by the system, start a new pool for this and later jobs
+            _log.warning("thumbnail process pool broken, restarting it")
+            with ThumbnailProcessor.lock:
+                ThumbnailProcessor.executor = None
+            ThumbnailProcessor.initialize()
+            return ThumbnailProcessor.executor.submit(function, *args)
+
+    @staticmethod
+    def submit(thumbnail_urls: list[str], thumbnail_size: tuple[int, int]) -> concurrent.futures.Future:
+        """
+        Queue a thumbnail to be processed, safe to call from any thread.
+
+        Args:
+            thumbnail_urls (list[str]): The thumbnail urls to try in order.
+            thumbnail_size (tuple[int, int]): Size (width, height) of the thumbnail shown on the video widgets.
+
+        Returns:
+            concurrent.futures.Future: A future holding ``{"url": str, "image_data": bytes,
+                "thumbnails": (normal, hover)}``, the url and file downloaded and the normal
+                and hover images.
+        """
+        ThumbnailProcessor.initialize()
+        result = concurrent.futures.Future()
+
+        def download() -> None:
+            try:
+                time_s = time.perf_counter()
+                thumbnail_url, image_data = download_thumbnail(thumbnail_urls)
+                download_time = time.perf_counter() - time_s
+                if ThumbnailProcessor.executor is None:
+                    # Shut down while downloading
+                    result.cancel()
+                    return
+                downloaded = {"url": thumbnail_url, "image_data": image_data, "timings": {"download": download_time}}
+                job = ThumbnailProcessor.run(create_thumbnails, image_data, thumbnail_size)
+                ThumbnailProcessor.get_result(job, result, downloaded)
+            except Exception as error:
+                # Also when the pool was shut down between the check and the submit
+                result.set_exception(error)
+
+        ThumbnailProcessor.download_executor.submit(download)
+        return result
+
+    @staticmethod
+    def submit_stored(paths: dict[str, str], thumbnail_size: tuple[int, int]) -> concurrent.futures.Future:
+        """
+        Queue the thumbnail of a video in the ``ThumbnailStore`` to be loaded from its files.
+
+        Args:
+            paths (dict[str, str]): The paths from ``ThumbnailStore.get_paths``.
+            thumbnail_size (tuple[int, int]): Size (width, height) of the thumbnail shown on the video widgets.
+
+        Returns:
+            concurrent.futures.Future: A future holding ``{"thumbnails": (normal, hover)}``.
+        """
+        return ThumbnailProcessor.get_result(ThumbnailProcessor.run(load_stored_thumbnails, paths, thumbnail_size))
+
+    @staticmethod
+    def get_result(
+        job: concurrent.futures.Future,
+        result: concurrent.futures.Future | None = None,
+        downloaded: dict | None = None,
+    ) -> concurrent.futures.Future:
+        """
+        Turn the raw images a job returns into Pillow images once it is done.
+
+        Args:
+            job (concurrent.futures.Future): The job of a worker process.
+            result (concurrent.futures.Future | None): The future to set, a new one by default.
+            downloaded (dict | None): ``{"url": str, "image_data": bytes, "timings": {...}}`` of
+                the download the job was made from, added to its result.
+        """
+        if result is None:
+            result = concurrent.futures.Future()
+
+        def on_done(done_job: concurrent.futures.Future) -> None:
+            if done_job.cancelled():
+                # Dropped by shutdown
+                result.cancel()
+                return
+            if done_job.exception() is not None:
+                result.set_exception(done_job.exception())
+                return
+            try:
+                job_result = done_job.result()
+                timings = job_result.pop("timings")
+                if downloaded is not None:
+                    timings = {**downloaded["timings"], **timings}
+                    job_result.update(url=downloaded["url"], image_data=downloaded["image_data"])
+                ThumbnailProcessor.add_timings(timings)
+                job_result["thumbnails"] = tuple(
+                    Image.frombytes(mode, size, pixels) for mode, size, pixels in job_result["thumbnails"]
+                )
+            except Exception as error:
+                result.set_exception(error)
+                return
+            result.set_result(job_result)
+
+        job.add_done_callback(on_done)
+        return result
+
+    @staticmethod
+    def save_files(image_data: bytes, paths: dict[str, str]) -> None:
+        """
+        Save the thumbnail files for the history and notifications in the background.
+
+        Args:
+            image_data (bytes): The downloaded thumbnail file, from ``submit``.
+            paths (dict[str, str]): The paths from ``ThumbnailStore.get_paths``.
+        """
+
+        def on_done(done_job: concurrent.futures.Future) -> None:
+            if done_job.cancelled():
+                return
+            if done_job.exception() is not None:
+                _log.error("saving thumbnail files failed: %s", done_job.exception())
+                return
+            ThumbnailProcessor.add_timings(done_job.result())
+            ThumbnailStore.add(paths)
+
+        ThumbnailProcessor.run(save_thumbnail_files, image_data, paths).add_done_callback(on_done)
+
+    @staticmethod
+    def add_timings(timings: dict[str, float]) -> None:
+        _log.debug(
+            "thumbnail processed: %s",
+            ", ".join(f"{stage} {seconds * 1000:.1f} ms" for stage, seconds in timings.items()),
+        )
+        with ThumbnailProcessor.lock:
+            for stage, seconds in timings.items():
+                stage_timing = ThumbnailProcessor.stage_timings.setdefault(stage, [0.0, 0])
+                stage_timing[0] += seconds
+                stage_timing[1] += 1
+
+    @staticmethod
+    def get_stage_timings() -> dict[str, float]:
+        """
+        Get the average time of each stage per thumbnail.
+
+        Returns:
+            dict[str, float]: Seconds per thumbnail by stage, e.g. "download" or "encode".
+        """
+        with ThumbnailProcessor.lock:
+            return {
+                stage: total_seconds / count
+                for stage, (total_seconds, count) in ThumbnailProcessor.stage_timings.items()
+            }
+
+    @staticmethod
+    def shutdown() -> None:
+        """
+        Stop the worker processes and download threads, dropping the jobs that did not start yet.
+        """
+        with ThumbnailProcessor.lock:
+            executor = ThumbnailProcessor.executor
+            download_executor = ThumbnailProcessor.download_executor
+            ThumbnailProcessor.executor = None
+            ThumbnailProcessor.download_executor = None
+        if download_executor is not None:
+            download_executor.shutdown(wait=False, cancel_futures=True)
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,206 @@
+import os
+import sqlite3
+import threading
+import time
+from collections import Counter
+
+from utils import DataBaseUtility
+from utils.logger import get_logger
+
+_log = get_logger(__name__)
+
+
+class ThumbnailStore:
+    """
+    Thumbnail files kept on disk, one file per video and variant, with a reference index.
+
+    A file is named after the video id and the variant, so adding a video again reuses the
+    files saved for it before, in this session or an earlier one, instead of saving copies.
+    An SQLite index next to the history database counts the history entries using each file.
+    Files nothing refers to are deleted by ``collect_garbage`` once unused for ``ttl``
+    seconds, found through the index instead of by listing the directory.
+    """
+
+    directory = "history/thumbnails/"
+    # the variants of a video by the name of the attribute holding their path
+    variants: dict[str, str] = {
+        "notification_thumbnail_image_path": "notify",
+        "history_normal_thumbnail_image_path": "normal",
+        "history_hover_thumbnail_image_path": "hover",
+    }
+    data_base_name = "thumbnails.db"
+    data_base: str = ""
+    # Seconds an unreferenced file is kept for videos added again, like the metadata cache
+    ttl: int = 7 * 24 * 60 * 60
+    connection: sqlite3.Connection | None = None
+    # One connection is shared by the load threads
+    _lock = threading.Lock()
+
+    @staticmethod
+    def initialize(data_base_dir: str, referenced_paths: list[str]) -> None:
+        """
+        Open the index, creating it if needed.
+
+        Args:
+            data_base_dir (str): The directory of the history database.
+            referenced_paths (list[str]): The thumbnail path of every history entry, counted
+                when the index is created so the files saved before it existed are tracked too.
+        """
+        ThumbnailStore.data_base = os.path.join(data_base_dir, ThumbnailStore.data_base_name)
+        try:
+            created = not os.path.exists(ThumbnailStore.data_base)
+            if created:
+                DataBaseUtility.create_data_base(data_base_dir, ThumbnailStore.data_base_name)
+            DataBaseUtility.create_table(
+                ThumbnailStore.data_base,
+                "thumbnails",
+                "path TEXT PRIMARY KEY, refs INTEGER, last_used REAL",
+            )
+            ThumbnailStore.connection = sqlite3.connect(ThumbnailStore.data_base, check_same_thread=False)
+            with ThumbnailStore._lock:
+                ThumbnailStore.connection.execute("CREATE INDEX IF NOT EXISTS unreferenced ON thumbnails (refs)")
+                ThumbnailStore.connection.commit()
+            if created:
+                ThumbnailStore.index_existing_files(referenced_paths)
+        except sqlite3.Error as error:
+            # Files are still saved and reused, only never deleted
+            _log.error("thumbnail index unavailable: %s", error)
+            ThumbnailStore.connection = None
+
+    @staticmethod
+    def index_existing_files(referenced_paths: list[str]) -> None:
+        """
+        Index the files saved before the index existed and delete the ones nothing refers to.
+
+        This is the only time the directory is listed.
+        """
+        now = time.time()
+        references = Counter(path for path in referenced_paths if path)
+        with ThumbnailStore._lock:
+            ThumbnailStore.connection.executemany(
+                "INSERT OR REPLACE INTO thumbnails (path, refs, last_used) VALUES (?, ?, ?)",
+                [(path, count, now) for path, count in references.items()],
+            )
+            ThumbnailStore.connection.commit()
+
+        kept_file_names = {os.path.basename(path) for path in references}
+        kept_file_names.add("this directory is necessary")
+        if not os.path.isdir(ThumbnailStore.directory):
+            return
+        for file_name in os.listdir(ThumbnailStore.directory):
+            if file_name not in kept_file_names:
+                ThumbnailStore.delete_file(os.path.join(ThumbnailStore.directory, file_name))
+
+    @staticmethod
+    def get_paths(key: str) -> dict[str, str]:
+        """
+        Get where the thumbnail files of a video are stored.
+
+        Args:
+            key (str): The video id, or any other name unique to the thumbnail.
+
+        Returns:
+            dict[str, str]: The path of each variant, by the name of the attribute holding it.
+        """
+        return {
+            name: f"{ThumbnailStore.directory}{key}-{variant}.png" for name, variant in ThumbnailStore.variants.items()
+        }
+
+    @staticmethod
+    def is_stored(paths: dict[str, str]) -> bool:
+        """
+        Check if the files were saved before, marking them as used.
+
+        Args:
+            paths (dict[str, str]): The paths from ``get_paths``.
+        """
+        if ThumbnailStore.connection is None or not all(os.path.exists(path) for path in paths.values()):
+            return False
+        try:
+            with ThumbnailStore._lock:
+                updated = ThumbnailStore.connection.executemany(
+                    "UPDATE thumbnails SET last_used = ? WHERE path = ?",
+                    [(time.time(), path) for path in paths.values()],
+                ).rowcount
+                ThumbnailStore.connection.commit()
+        except sqlite3.Error as error:
+            _log.error("failed to look up thumbnails: %s", error)
+            return False
+        return updated == len(paths)
+
+    @staticmethod
+    def add(paths: dict[str, str]) -> None:
+        """
+        Index saved files, without references yet.
+
+        Args:
+            paths (dict[str, str]): The paths from ``get_paths``.
+        """
+        ThumbnailStore.execute(
+            "INSERT INTO thumbnails (path, refs, last_used) VALUES (?, 0, ?) "
+            "ON CONFLICT (path) DO UPDATE SET last_used = excluded.last_used",
+            [(path, time.time()) for path in paths.values()],
+        )
+
+    @staticmethod
+    def add_reference(path: str) -> None:
+        """Count a history entry using a file."""
+        if path:
+            ThumbnailStore.execute(
+                "INSERT INTO thumbnails (path, refs, last_used) VALUES (?, 1, ?) "
+                "ON CONFLICT (path) DO UPDATE SET refs = refs + 1, last_used = excluded.last_used",
+                [(path, time.time())],
+            )
+
+    @staticmethod
+    def release_reference(path: str) -> None:
+        """Stop counting a history entry that used a file."""
+        if path:
+            ThumbnailStore.execute(
+                "UPDATE thumbnails SET refs = MAX(refs - 1, 0), last_used = ? WHERE path = ?",
+                [(time.time(), path)],
+            )
+
+    @staticmethod
+    def execute(sql: str, parameters: list[tuple]) -> None:
+        if ThumbnailStore.connection is None:
+            return
+        try:
+            with ThumbnailStore._lock:
+                ThumbnailStore.connection.executemany(sql, parameters)
+                ThumbnailStore.connection.commit()
+        except sqlite3.Error as error:
+            _log.error("failed to update the thumbnail index: %s", error)
+
+    @staticmethod
+    def collect_garbage() -> int:
+        """
+        Delete the files no history entry refers to that were not used for ``ttl`` seconds.
+
+        Returns:
+            int: The number of files deleted.
+        """
+        if ThumbnailStore.connection is None:
+            return 0
+        try:
+            with ThumbnailStore._lock:
+                rows = ThumbnailStore.connection.execute(
+                    "SELECT path FROM thumbnails WHERE refs = 0 AND last_used < ?", (time.time() - ThumbnailStore.ttl,)
+                ).fetchall()
+                ThumbnailStore.connection.executemany("DELETE FROM thumbnails WHERE path = ?", rows)
+                ThumbnailStore.connection.commit()
+        except sqlite3.Error as error:
+            _log.error("failed to collect unused thumbnails: %s", error)
+            return 0
+        for (path,) in rows:
+            ThumbnailStore.delete_file(path)
+        return len(rows)
+
+    @staticmethod
+    def delete_file(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except OSError as error:
+            _log.warning("could not delete thumbnail %r: %s", path, error)
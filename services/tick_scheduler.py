@@ -0,0 +1,98 @@
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+from settings import GeneralSettings
+from utils.logger import get_logger
+
+_log = get_logger(__name__)
+
+
+class TickScheduler:
+    """
+    Runs periodic UI work from a single ``root.after`` loop on the Tk thread.
+
+    The loop ticks at a fixed frame rate and calls each callback once its own interval has
+    passed. Callbacks may be added and removed from any thread, they are always called on
+    the Tk thread. This replaces a sleeping thread per periodic job, and keeps Tk calls off
+    the worker threads.
+    """
+
+    frame_interval: float = 0.1
+
+    root: Any = None
+    # callback -> its interval in seconds, None to follow the update delay setting
+    callbacks: dict[Callable[[], None], float | None] = {}
+    next_runs: dict[Callable[[], None], float] = {}
+    # Called once at the next tick, see ``call_soon``
+    pending_calls: list[Callable[[], None]] = []
+    lock = threading.Lock()
+
+    @staticmethod
+    def initialize(root: Any) -> None:
+        """
+        Start ticking.
+
+        Args:
+            root: The Tk root, whose ``after`` drives the ticks.
+        """
+        TickScheduler.root = root
+        TickScheduler.schedule_tick()
+
+    @staticmethod
+    def add_callback(callback: Callable[[], None], interval: float | None = None) -> None:
+        """
+        Call a callback periodically.
+
+        Args:
+            callback (Callable): Called without arguments on the Tk thread.
+            interval (float | None): Seconds between calls, None to use the ``update_delay`` setting.
+        """
+        with TickScheduler.lock:
+            TickScheduler.callbacks[callback] = interval
+
+    @staticmethod
+    def remove_callback(callback: Callable[[], None]) -> None:
+        with TickScheduler.lock:
+            TickScheduler.callbacks.pop(callback, None)
+            TickScheduler.next_runs.pop(callback, None)
+
+    @staticmethod
+    def call_soon(callback: Callable[[], None]) -> None:
+        """
+        Call a callback once on the Tk thread, at the next tick.
+
+        Lets the download loop and other threads show a change on the widgets. Calls are
+        made in the order they were added.
+
+        Args:
+            callback (Callable): Called without arguments on the Tk thread.
+        """
+        with TickScheduler.lock:
+            TickScheduler.pending_calls.append(callback)
+
+    @staticmethod
+    def schedule_tick() -> None:
+        TickScheduler.root.after(int(TickScheduler.frame_interval * 1000), TickScheduler.tick)
+
+    @staticmethod
+    def tick() -> None:
+        """Call the pending calls and the callbacks that are due, then schedule the next tick."""
+        now = time.monotonic()
+        with TickScheduler.lock:
+            due_callbacks = TickScheduler.pending_calls
+            TickScheduler.pending_calls = []
+            for callback, interval in TickScheduler.callbacks.items():
+                if now >= TickScheduler.next_runs.get(callback, 0):
+                    due_callbacks.append(callback)
+                    if interval is None:
+                        interval = GeneralSettings.settings["update_delay"]
+                    TickScheduler.next_runs[callback] = now + interval
+        for callback in due_callbacks:
+            try:
+                callback()
+            except Exception as error:
+                # One failing job must not stop the others from ticking
+                _log.error("tick callback %s failed: %s", callback, error)
+        TickScheduler.schedule_tick()
@@ -1,8 +1,9 @@
 import os
 import queue
 import threading
-from collections.abc import Callable
+from collections.abc import Callable, Hashable
 
+from services.queue_scheduler import QueueScheduler
 from settings.general_settings import GeneralSettings
 from utils.logger import get_logger
 
@@ -22,11 +23,12 @@ class VideoConvertManager:
     else:
         FFMPEG_PATH = shutil.which("ffmpeg") or os.path.join("ffmpeg", "ffmpeg")
 
-    # Class variables to keep track of active and queued converts
-    active_convert_count: int = 0
-    queued_convert_count: int = 0
-    queued_converts: list = []
-    active_converts: list = []
+    # Queued and active converts, shared by every thread that touches the queue
+    scheduler: QueueScheduler = QueueScheduler(
+        name="convert",
+        get_max_active=lambda: GeneralSettings.settings["max_simultaneous_converts"],
+        start_item=lambda video: video.convert_video(),
+    )
     status_change_callback: Callable = None
 
     # Queue used to signal the manager thread when the queue state changes
@@ -44,19 +46,8 @@ class VideoConvertManager:
             # Block until signalled (no busy-wait)
             VideoConvertManager._signal_queue.get()
 
-            if (
-                GeneralSettings.settings["max_simultaneous_converts"] > VideoConvertManager.active_convert_count
-                and VideoConvertManager.queued_convert_count > 0
-            ):
-                try:
-                    VideoConvertManager.queued_convert_count -= 1
-                    VideoConvertManager.queued_converts[0].convert_video()
-                    VideoConvertManager.active_convert_count += 1
-                    VideoConvertManager.active_converts.append(VideoConvertManager.queued_converts.pop(0))
-                except Exception:
-                    _log.exception("failed to start convert")
-                    # Re-queue the item count so the queue stays consistent
-                    VideoConvertManager.queued_convert_count += 1
+            # Fill every free slot, not just one, in case several were freed at once
+            if VideoConvertManager.scheduler.schedule():
                 VideoConvertManager.status_change_callback()
 
     @staticmethod
@@ -65,18 +56,32 @@ class VideoConvertManager:
         VideoConvertManager._signal_queue.put(True)
 
     @staticmethod
-    def register(video) -> None:
+    def register(video, priority: int = 0, group: Hashable | None = None) -> None:
         """
         Registers a video to be converted.
 
         Adds the video to the convert queue, updates the queued convert count,
         and signals the manager thread.
+
+        Args:
+            video: The video widget.
+            priority (int): Videos with a higher priority are started first.
+            group (Hashable, optional): The playlist the video belongs to. Playlists and
+                standalone videos take turns for free slots.
         """
-        VideoConvertManager.queued_converts.append(video)
-        VideoConvertManager.queued_convert_count += 1
+        VideoConvertManager.scheduler.register(video, priority, group)
         VideoConvertManager.status_change_callback()
         VideoConvertManager._signal()
 
+    @staticmethod
+    def move_to_front(video) -> None:
+        """
+        Makes a queued video the next one to be converted.
+        """
+        if VideoConvertManager.scheduler.move_to_front(video):
+            VideoConvertManager.status_change_callback()
+            VideoConvertManager._signal()
+
     @staticmethod
     def unregister_from_queued(video) -> None:
         """
@@ -84,9 +89,7 @@ class VideoConvertManager:
 
         Removes the video from the convert queue and updates the queued convert count.
         """
-        if video in VideoConvertManager.queued_converts:
-            VideoConvertManager.queued_converts.remove(video)
-            VideoConvertManager.queued_convert_count -= 1
+        VideoConvertManager.scheduler.unregister_from_queued(video)
         VideoConvertManager.status_change_callback()
 
     @staticmethod
@@ -97,12 +100,25 @@ class VideoConvertManager:
         Removes the video from the active convert list, updates the active convert count,
         and signals the manager thread so it can start the next queued item.
         """
-        if video in VideoConvertManager.active_converts:
-            VideoConvertManager.active_converts.remove(video)
-            VideoConvertManager.active_convert_count -= 1
+        VideoConvertManager.scheduler.unregister_from_active(video)
         VideoConvertManager.status_change_callback()
         VideoConvertManager._signal()
 
+    @staticmethod
+    def get_queued_count() -> int:
+        """Returns the number of converts waiting for a free slot."""
+        return VideoConvertManager.scheduler.get_queued_count()
+
+    @staticmethod
+    def get_active_count() -> int:
+        """Returns the number of converts currently running."""
+        return VideoConvertManager.scheduler.get_active_count()
+
+    @staticmethod
+    def get_active_items() -> list:
+        """Returns a snapshot of the converts currently running."""
+        return VideoConvertManager.scheduler.get_active_items()
+
     @staticmethod
     def initialize(status_change_callback: Callable = None) -> None:
         """
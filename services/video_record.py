@@ -0,0 +1,482 @@
+import concurrent.futures
+import functools
+import threading
+import time
+import tkinter as tk
+from collections.abc import Callable, Hashable
+from typing import Any, Literal
+
+import pytubefix as pytube
+from PIL import Image, ImageTk
+
+from settings import AppearanceSettings, GeneralSettings
+from utils import DownloadInfoUtility, FileUtility, ImageUtility, ThumbnailUrlUtility
+from utils.logger import get_logger
+
+from .client_health_registry import ClientHealthRegistry
+from .hedged_request import HedgedRequest
+from .load_manager import LoadManager
+from .metadata_cache import MetadataCache
+from .thumbnail_processor import ThumbnailProcessor
+from .thumbnail_store import ThumbnailStore
+from .video_count_tracker import VideoCountTracker
+
+_log = get_logger(__name__)
+
+
+class VideoRecord:
+    """
+    Plain data model of an added video: its metadata, load state and chosen download.
+
+    Records are what the LoadManager loads, not widgets. An ``AddedVideo`` widget is only
+    a view of a record, so a playlist can keep a record per video and create widgets for
+    the page being shown. ``__slots__`` keeps a record down to a few hundred bytes.
+    """
+
+    PYTUBE_CLIENTS: list[str] = [
+        "WEB",
+        "WEB_EMBED",
+        "WEB_MUSIC",
+        "WEB_CREATOR",
+        "WEB_SAFARI",
+        "MWEB",
+        "WEB_KIDS",
+        "ANDROID",
+        "ANDROID_EMBED",
+        "ANDROID_VR",
+        "ANDROID_MUSIC",
+        "ANDROID_CREATOR",
+        "ANDROID_TESTSUITE",
+        "ANDROID_PRODUCER",
+        "ANDROID_KIDS",
+        "IOS",
+        "IOS_EMBED",
+        "IOS_MUSIC",
+        "IOS_CREATOR",
+        "IOS_KIDS",
+        "TV",
+        "TV_EMBED",
+        "MEDIA_CONNECT",
+    ]
+
+    # Width of the thumbnail on the video widgets, the history tiles and the hero image of
+    # the notifications, before scaling. The smallest variant wide enough for all is fetched.
+    thumbnail_display_widths: tuple[int, ...] = (117, 180, 364)
+    # Seconds to wait for a thumbnail before showing the default one
+    thumbnail_timeout: float = 60
+
+    # Shared by every record loaded without thumbnails
+    default_thumbnails: tuple[tk.PhotoImage, tk.PhotoImage] = (None, None)
+
+    __slots__ = (
+        "video_url",
+        "mode",
+        "queue_group",
+        "status_callback",
+        "download_callback",
+        "view",
+        "load_state",
+        "automatically_reload_count",
+        "cached",
+        # video info
+        "video_title",
+        "channel",
+        "channel_url",
+        "length",
+        "thumbnail_url",
+        "thumbnail_variant",
+        "video_stream_data",
+        "support_download_types",
+        # thumbnails
+        "original_thumbnail_image_path",
+        "notification_thumbnail_image_path",
+        "history_normal_thumbnail_image_path",
+        "history_hover_thumbnail_image_path",
+        "thumbnail_images",
+        "_thumbnails",
+        # download info
+        "download_option",
+        "download_quality",
+        "download_type",
+        "selected_download_type_info",
+    )
+
+    def __init__(
+        self,
+        video_url: str,
+        mode: Literal["video", "playlist"] = "video",
+        queue_group: Hashable | None = None,
+        status_callback: Callable | None = None,
+        download_callback: Callable | None = None,
+    ):
+        """
+        Args:
+            video_url (str): The video url.
+            mode (str): "playlist" if the video belongs to a playlist.
+            queue_group (Hashable, optional): The playlist, for fair scheduling between playlists.
+            status_callback (Callable, optional): Called with the record and its new load state.
+            download_callback (Callable, optional): Called with the record to download it.
+        """
+        self.video_url: str = video_url
+        self.mode: Literal["video", "playlist"] = mode
+        self.queue_group: Hashable | None = queue_group
+        self.status_callback: Callable | None = status_callback
+        self.download_callback: Callable | None = download_callback
+        # The widget showing the record, if any
+        self.view: Any = None
+        self.load_state: Literal["waiting", "loading", "failed", "loaded", "removed"] = "waiting"
+        self.automatically_reload_count: int = 0
+        # True once the metadata came from the metadata cache
+        self.cached: bool = False
+
+        self.video_title: str = "-------"
+        self.channel: str = "-------"
+        self.channel_url: str = "-------"
+        self.length: int = 0
+        self.thumbnail_url: str = ""
+        # the thumbnail variant fetched before, e.g. "hqdefault", None until one was
+        self.thumbnail_variant: str | None = None
+        self.video_stream_data: pytube.YouTube.streams = None
+        self.support_download_types: list[dict[str, int]] | None = None
+
+        self.original_thumbnail_image_path: str = ""
+        self.notification_thumbnail_image_path: str = ""
+        self.history_normal_thumbnail_image_path: str = ""
+        self.history_hover_thumbnail_image_path: str = ""
+        # the normal and hover images until they are turned into Tk images
+        self.thumbnail_images: tuple[Image.Image, Image.Image] | None = None
+        self._thumbnails: tuple[tk.PhotoImage, tk.PhotoImage] | None = None
+
+        self.download_option: str | None = None
+        self.download_quality: str = "720p"
+        self.download_type: Literal["Audio", "Video"] = "Video"
+        self.selected_download_type_info: dict | None = None
+
+        VideoCountTracker.add_added_video()
+
+    def register(self) -> None:
+        """Queue the record for loading."""
+        self.set_state("waiting")
+        LoadManager.register(self, group=self.queue_group)
+
+    def set_state(
+        self, state: Literal["waiting", "loading", "failed", "loaded", "removed"], notify_view: bool = True
+    ) -> None:
+        """Change the load state and tell the playlist and the view."""
+        self.load_state = state
+        if self.status_callback is not None:
+            self.status_callback(self, state)
+        if notify_view and self.view is not None:
+            self.view.show_record_state()
+
+    def load_video(self) -> None:
+        self.set_state("loading")
+        load_thread = threading.Thread(target=self.retrieve_video_data)
+        load_thread.daemon = True
+        load_thread.start()
+
+    def reload_video(self) -> None:
+        self.register()
+
+    def set_data(self, data: dict[str, Any]) -> None:
+        """Fill in the video data from a metadata cache entry or a fetch."""
+        self.video_title = data["title"]
+        self.channel = data["channel"]
+        self.length = data["length"]
+        self.channel_url = data["channel_url"]
+        self.thumbnail_url = data["thumbnail_url"]
+        self.thumbnail_variant = data.get("thumbnail_variant")
+        self.support_download_types = data["support_download_types"]
+        self.video_stream_data = data.get("video_stream_data")
+
+    def get_cache_data(self) -> dict[str, Any]:
+        """The video data as stored in the metadata cache."""
+        return {
+            "title": self.video_title,
+            "channel": self.channel,
+            "length": self.length,
+            "channel_url": self.channel_url,
+            "thumbnail_url": self.thumbnail_url,
+            "thumbnail_variant": self.thumbnail_variant,
+            "support_download_types": self.support_download_types,
+        }
+
+    def load_cached_video_data(self) -> bool:
+        """
+        Fill in the video data from the metadata cache.
+
+        The streams are left empty, the downloading video fetches them when it starts.
+
+        Returns:
+            bool: True if the video was cached.
+        """
+        video_id = MetadataCache.get_video_id(self.video_url)
+        data = MetadataCache.get(video_id) if video_id is not None else None
+        if data is None:
+            return False
+        self.set_data(data)
+        self.cached = True
+        return True
+
+    def cache_video_data(self) -> None:
+        video_id = MetadataCache.get_video_id(self.video_url)
+        if video_id is not None:
+            MetadataCache.put(video_id, self.get_cache_data())
+
+    @staticmethod
+    def fetch_data_with_client(video_url: str, client: str) -> dict[str, Any]:
+        """
+        Load the video data from YouTube with one client and report how it went.
+
+        Returns:
+            dict: The video data, applied by the caller so attempts running in parallel do
+            not overwrite each other.
+        """
+        time_s = time.time()
+        try:
+            video = pytube.YouTube(video_url, client=client)
+            stream_data = video.streams
+            data = {
+                "title": str(video.title),
+                "channel": str(video.author),
+                "length": int(video.length),
+                "channel_url": str(video.channel_url),
+                "thumbnail_url": str(video.thumbnail_url),
+                "support_download_types": DownloadInfoUtility.sort_download_qualities(
+                    DownloadInfoUtility.get_supported_download_types(stream_data)
+                ),
+                "video_stream_data": stream_data,
+            }
+        except (pytube.exceptions.AgeRestrictedError, pytube.exceptions.RegexMatchError):
+            # Fails the same way with every client
+            raise
+        except Exception as error:
+            _log.warning("loading %s with client %s failed: %s", video_url, client, error)
+            ClientHealthRegistry.record_failure(client)
+            raise
+        ClientHealthRegistry.record_success(client, time.time() - time_s)
+        return data
+
+    @staticmethod
+    def fetch_data(video_url: str, should_stop: Callable[[], bool] = lambda: False) -> dict[str, Any]:
+        """
+        Load the video data from YouTube, trying the clients that worked best lately first.
+
+        With hedged loading enabled, a client slower than its usual latency gets raced by
+        the next one in a spare load slot, and the first answer wins.
+
+        Args:
+            video_url (str): The video url.
+            should_stop (Callable): Checked before trying another client, True gives up.
+
+        Returns:
+            dict: The video data, with the streams as "video_stream_data".
+        """
+        clients = ClientHealthRegistry.get_client_order(VideoRecord.PYTUBE_CLIENTS)
+        hedged = GeneralSettings.settings["hedged_loading"]
+        return HedgedRequest.run(
+            [functools.partial(VideoRecord.fetch_data_with_client, video_url, client) for client in clients],
+            get_delay=lambda index: ClientHealthRegistry.get_latency_budget(clients[index]) if hedged else None,
+            reserve_slot=LoadManager.reserve_slot,
+            release_slot=LoadManager.release_slot,
+            fatal_errors=(pytube.exceptions.AgeRestrictedError, pytube.exceptions.RegexMatchError),
+            should_stop=should_stop,
+        )
+
+    def fetch_video_data(self) -> None:
+        """Load the video data from YouTube, see ``fetch_data``."""
+        self.set_data(VideoRecord.fetch_data(self.video_url, should_stop=lambda: self.load_state == "removed"))
+
+    def create_thumbnails(self) -> None:
+        """
+        Download the thumbnail and make the versions used by the widgets, history and notifications.
+
+        The work runs in a ThumbnailProcessor process, the load slot is freed meanwhile so the
+        metadata of the next video loads while this one waits for its thumbnail. The widget
+        images stay in memory, the history and notification files are saved in the background.
+
+        Only the smallest thumbnail variant wide enough for the largest place it is shown is
+        downloaded, and the variant is cached with the metadata.
+
+        If the thumbnail takes longer than ``thumbnail_timeout`` or its job is dropped, the
+        default thumbnails are shown instead.
+        """
+        thumbnail_size_for_video_object = (
+            int(117 * AppearanceSettings.get_scale("decimal")),
+            int(66 * AppearanceSettings.get_scale("decimal")),
+        )
+        # The files of a video added before are reused, the thumbnail is not downloaded again
+        thumbnail_paths = ThumbnailStore.get_paths(
+            MetadataCache.get_video_id(self.video_url) or FileUtility.sanitize_filename(self.thumbnail_url)
+        )
+        stored = ThumbnailStore.is_stored(thumbnail_paths)
+        if stored:
+            thumbnail_job = ThumbnailProcessor.submit_stored(thumbnail_paths, thumbnail_size_for_video_object)
+        else:
+            thumbnail_urls = ThumbnailUrlUtility.get_variant_urls(
+                self.thumbnail_url, VideoRecord.get_thumbnail_width(), self.thumbnail_variant
+            )
+            thumbnail_job = ThumbnailProcessor.submit(thumbnail_urls, thumbnail_size_for_video_object)
+        LoadManager.unregister_from_active(self)
+        try:
+            result = thumbnail_job.result(timeout=VideoRecord.thumbnail_timeout)
+        except (concurrent.futures.TimeoutError, concurrent.futures.CancelledError):
+            _log.warning("thumbnail of %s not created in time, using the default one", self.video_url)
+            self.thumbnail_images = None
+            self._thumbnails = None
+            return
+        self.thumbnail_images = result["thumbnails"]
+        self._thumbnails = None
+        if not stored:
+            ThumbnailProcessor.save_files(result["image_data"], thumbnail_paths)
+            thumbnail_variant = ThumbnailUrlUtility.get_variant(result["url"])
+            if thumbnail_variant != self.thumbnail_variant:
+                self.thumbnail_variant = thumbnail_variant
+                self.cache_video_data()
+        for name, path in thumbnail_paths.items():
+            setattr(self, name, path)
+
+    @staticmethod
+    def get_thumbnail_width() -> int:
+        """The width of the largest place a thumbnail is shown, at the current scale."""
+        return int(max(VideoRecord.thumbnail_display_widths) * AppearanceSettings.get_scale("decimal"))
+
+    @property
+    def thumbnails(self) -> tuple[tk.PhotoImage, tk.PhotoImage]:
+        """The normal and hover thumbnail images, created on first use."""
+        if self._thumbnails is None:
+            if self.thumbnail_images is not None:
+                self._thumbnails = tuple(ImageTk.PhotoImage(image) for image in self.thumbnail_images)
+                self.thumbnail_images = None
+            else:
+                self._thumbnails = VideoRecord.get_default_thumbnails()
+        return self._thumbnails
+
+    @staticmethod
+    def get_default_thumbnails() -> tuple[tk.PhotoImage, tk.PhotoImage]:
+        if VideoRecord.default_thumbnails == (None, None):
+            thumbnail_size_for_video_object = (
+                int(117 * AppearanceSettings.get_scale("decimal")),
+                int(66 * AppearanceSettings.get_scale("decimal")),
+            )
+            thumbnail = Image.open("assets/ui images/default thumbnail.png")
+            corner_radius = int(thumbnail.width / 18)
+            thumbnail_hover = ImageUtility.create_image_with_hover_effect(thumbnail, intensity_increase=50)
+            thumbnail = ImageUtility.create_image_with_rounded_corners(thumbnail, radius=corner_radius)
+            thumbnail_hover = ImageUtility.create_image_with_rounded_corners(thumbnail_hover, radius=corner_radius)
+            thumbnail = ImageUtility.resize_image(image=thumbnail, new_size=thumbnail_size_for_video_object)
+            thumbnail_hover = ImageUtility.resize_image(image=thumbnail_hover, new_size=thumbnail_size_for_video_object)
+
+            VideoRecord.default_thumbnails = (ImageTk.PhotoImage(thumbnail), ImageTk.PhotoImage(thumbnail_hover))
+
+        return VideoRecord.default_thumbnails
+
+    def retrieve_video_data(self) -> None:
+        try:
+            if not self.cached and not self.load_cached_video_data():
+                self.fetch_video_data()
+                self.cache_video_data()
+            if GeneralSettings.settings["load_thumbnail"]:
+                self.create_thumbnails()
+            self.set_loading_completed()
+            self.download_automatically()
+
+        except pytube.exceptions.AgeRestrictedError:
+            self.set_loading_failed()
+
+        except pytube.exceptions.RegexMatchError:
+            self.set_loading_failed()
+
+        except Exception as error:
+            _log.error("retrieve_video_data failed: %s", error)
+            self.set_loading_failed()
+
+    def set_loading_completed(self) -> None:
+        if self.load_state == "removed":
+            return
+        self.set_download_option(self.get_download_options()[0])
+        LoadManager.unregister_from_active(self)
+        self.set_state("loaded")
+
+    def set_loading_failed(self) -> None:
+        if self.load_state == "removed":
+            return
+
+        if GeneralSettings.settings["reload_automatically"] and self.automatically_reload_count < 5:
+            # Retried soon, the view keeps showing the loading animation
+            self.set_state("failed", notify_view=False)
+            time.sleep(1)
+            self.automatically_reload_count += 1
+            # Queued again instead of loaded on this thread, the slot may have been given up
+            # already while waiting for the thumbnail
+            LoadManager.unregister_from_active(self)
+            self.set_state("waiting", notify_view=False)
+            LoadManager.register(self, group=self.queue_group)
+        else:
+            LoadManager.unregister_from_active(self)
+            self.set_state("failed")
+
+    def remove(self) -> None:
+        """Drop the record from the load queue, for good."""
+        self.load_state = "removed"
+        LoadManager.unregister_from_active(self)
+        LoadManager.unregister_from_queued(self)
+        VideoCountTracker.remove_added_video()
+        if self.status_callback is not None:
+            self.status_callback(self, self.load_state)
+
+    def get_download_options(self) -> list[str]:
+        """The options offered in the resolution menu, e.g. "720p | 25.3 MB"."""
+        return DownloadInfoUtility.generate_download_options(self.support_download_types)
+
+    def set_download_option(self, download_option: str) -> None:
+        """
+        Choose what to download, from one of ``get_download_options``.
+
+        Args:
+            download_option (str): The chosen option.
+        """
+        self.download_option = download_option
+        self.download_quality = download_option.replace(" ", "").split("|")[0]
+        if "kbps" in self.download_quality:
+            self.download_type = "Audio"
+        elif "p" in self.download_quality:
+            self.download_type = "Video"
+
+        selected_download_index = self.get_download_options().index(download_option)
+        self.selected_download_type_info = self.support_download_types[selected_download_index]
+        if self.view is not None:
+            self.view.show_download_option()
+
+    def is_available_resolution(self, resolution: str) -> bool:
+        return any(option.split(" | ")[0].replace(" ", "") == resolution for option in self.get_download_options())
+
+    def select_download_resolution(self, selected_quality: str) -> None:
+        """Choose the option closest to a quality, e.g. "1080p" or "Audio Only"."""
+        download_options = self.get_download_options()
+        if "Audio Only" in selected_quality:
+            index = -1
+        elif self.is_available_resolution(selected_quality):
+            index = [option.split(" | ")[0].replace(" ", "") for option in download_options].index(selected_quality)
+        else:
+            available_resolutions_int = [
+                int(option.split(" | ")[0].replace(" ", "")[0:-1])
+                for option in download_options
+                if "kbps" not in option
+            ]
+
+            selected_quality_int = int(selected_quality.split(" | ")[0][0:-1])
+            for index, available_resolution_int in enumerate(available_resolutions_int):  # noqa: B007
+                if available_resolution_int <= selected_quality_int:
+                    break
+
+        self.set_download_option(download_options[index])
+
+    def select_download_quality_automatic(self) -> None:
+        self.select_download_resolution(GeneralSettings.settings["automatic_download"]["quality"])
+
+    def download_automatically(self) -> None:
+        if GeneralSettings.settings["automatic_download"]["status"] == "enable":
+            self.select_download_quality_automatic()
+            if self.mode == "video":
+                self.download_callback(self)
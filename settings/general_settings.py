@@ -70,14 +70,21 @@ class GeneralSettings:
         "language": "English",
         "load_thumbnail": True,
         "max_simultaneous_downloads": 1,
+        "max_simultaneous_downloads_auto": False,
         "max_simultaneous_converts": 1,
         "max_simultaneous_loads": 1,
+        "hedged_loading": False,
         "re_download_automatically": False,
         "reload_automatically": False,
         "update_delay": 0.5,
         "alerts": True,
         "window_geometry": "900x500-7+0",
         "chunk_size": 2097152,
+        "download_connections": 4,
+        "streaming_mux": False,
+        "download_speed_limit": 0,
+        "download_speed_limit_per_video": 0,
+        "download_speed_limit_schedule": [],
         "display_download_speed_info": False,
     }
 
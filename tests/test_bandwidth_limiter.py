@@ -0,0 +1,60 @@
+"""Tests for services/bandwidth_limiter.py."""
+
+from datetime import datetime
+
+from services.bandwidth_limiter import BandwidthLimiter, TokenBucket
+
+
+class TestTokenBucket:
+    def test_unlimited_never_waits(self):
+        bucket = TokenBucket(rate=0)
+        assert bucket.reserve(10**9, now=0) == 0
+
+    def test_waits_for_debt(self):
+        bucket = TokenBucket(rate=1000)
+        bucket.reserve(0, now=0)
+        assert bucket.reserve(500, now=0) == 0.5
+
+    def test_refills_over_time(self):
+        bucket = TokenBucket(rate=1000)
+        bucket.reserve(0, now=0)
+        bucket.reserve(1000, now=0)
+        assert bucket.reserve(500, now=1.5) == 0
+
+    def test_burst_capped_at_one_second(self):
+        bucket = TokenBucket(rate=1000)
+        bucket.reserve(0, now=0)
+        # A long idle period only stores one second worth of tokens
+        assert bucket.reserve(1000, now=100) == 0
+        assert bucket.reserve(1000, now=100) == 1
+
+    def test_average_rate(self):
+        bucket = TokenBucket(rate=1000)
+        bucket.reserve(0, now=0)
+        now = 0.0
+        for _ in range(100):
+            now += bucket.reserve(100, now=now)
+        assert 9.8 <= now <= 10
+
+
+class TestGetScheduledLimit:
+    schedule = [
+        {"start": "09:00", "end": "17:00", "limit": 1000},
+        {"start": "22:00", "end": "06:00", "limit": 0},
+    ]
+
+    def test_inside_window(self):
+        assert BandwidthLimiter.get_scheduled_limit(self.schedule, 500, datetime(2024, 1, 1, 12, 0)) == 1000
+
+    def test_window_end_is_exclusive(self):
+        assert BandwidthLimiter.get_scheduled_limit(self.schedule, 500, datetime(2024, 1, 1, 17, 0)) == 500
+
+    def test_window_past_midnight(self):
+        assert BandwidthLimiter.get_scheduled_limit(self.schedule, 500, datetime(2024, 1, 1, 2, 30)) == 0
+
+    def test_outside_windows(self):
+        assert BandwidthLimiter.get_scheduled_limit(self.schedule, 500, datetime(2024, 1, 1, 20, 0)) == 500
+
+    def test_invalid_window_ignored(self):
+        schedule = [{"start": "00:00"}, *self.schedule]
+        assert BandwidthLimiter.get_scheduled_limit(schedule, 500, datetime(2024, 1, 1, 12, 0)) == 1000
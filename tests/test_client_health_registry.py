@@ -0,0 +1,74 @@
+"""Tests for services/client_health_registry.py."""
+
+import pytest
+
+from services.client_health_registry import ClientHealthRegistry
+
+CLIENTS = ["WEB", "ANDROID", "IOS"]
+
+
+@pytest.fixture(autouse=True)
+def registry():
+    ClientHealthRegistry.reset()
+    yield ClientHealthRegistry
+    ClientHealthRegistry.reset()
+
+
+class TestClientHealthRegistry:
+    def test_keeps_given_order_without_history(self):
+        assert ClientHealthRegistry.get_client_order(CLIENTS) == CLIENTS
+
+    def test_working_client_first(self):
+        ClientHealthRegistry.record_failure("WEB")
+        ClientHealthRegistry.record_success("IOS", 1.0)
+        assert ClientHealthRegistry.get_client_order(CLIENTS) == ["IOS", "ANDROID", "WEB"]
+
+    def test_faster_client_first_on_equal_success(self):
+        ClientHealthRegistry.record_success("WEB", 3.0)
+        ClientHealthRegistry.record_success("ANDROID", 1.0)
+        assert ClientHealthRegistry.get_client_order(CLIENTS)[:2] == ["ANDROID", "WEB"]
+
+    def test_circuit_opens_after_repeated_failures(self):
+        for _ in range(ClientHealthRegistry.failure_threshold - 1):
+            ClientHealthRegistry.record_failure("WEB")
+        assert "WEB" in ClientHealthRegistry.get_client_order(CLIENTS)
+        ClientHealthRegistry.record_failure("WEB")
+        assert ClientHealthRegistry.get_client_order(CLIENTS) == ["ANDROID", "IOS"]
+        assert ClientHealthRegistry.get_counters()["WEB"]["circuit_open"]
+
+    def test_circuit_closes_after_cooldown(self, monkeypatch):
+        monkeypatch.setattr(ClientHealthRegistry, "cooldown", -1)
+        for _ in range(ClientHealthRegistry.failure_threshold):
+            ClientHealthRegistry.record_failure("WEB")
+        assert "WEB" in ClientHealthRegistry.get_client_order(CLIENTS)
+
+    def test_all_clients_open_still_returns_all(self):
+        for client in CLIENTS:
+            for _ in range(ClientHealthRegistry.failure_threshold):
+                ClientHealthRegistry.record_failure(client)
+        assert sorted(ClientHealthRegistry.get_client_order(CLIENTS)) == sorted(CLIENTS)
+
+    def test_success_resets_consecutive_failures(self):
+        ClientHealthRegistry.record_failure("WEB")
+        ClientHealthRegistry.record_failure("WEB")
+        ClientHealthRegistry.record_success("WEB", 1.0)
+        ClientHealthRegistry.record_failure("WEB")
+        counters = ClientHealthRegistry.get_counters()["WEB"]
+        assert counters["successes"] == 1
+        assert counters["failures"] == 3
+        assert counters["consecutive_failures"] == 1
+        assert not counters["circuit_open"]
+
+    def test_reset(self):
+        ClientHealthRegistry.record_success("WEB", 1.0)
+        ClientHealthRegistry.reset()
+        assert ClientHealthRegistry.get_counters() == {}
+
+    def test_latency_budget(self):
+        assert ClientHealthRegistry.get_latency_budget("WEB") == ClientHealthRegistry.default_hedge_delay
+        ClientHealthRegistry.record_success("WEB", 2.0)
+        assert ClientHealthRegistry.get_latency_budget("WEB") == 4.0
+        ClientHealthRegistry.record_success("IOS", 0.01)
+        assert ClientHealthRegistry.get_latency_budget("IOS") == ClientHealthRegistry.min_hedge_delay
+        ClientHealthRegistry.record_success("TV", 60)
+        assert ClientHealthRegistry.get_latency_budget("TV") == ClientHealthRegistry.max_hedge_delay
@@ -0,0 +1,60 @@
+"""Tests for services/concurrency_controller.py."""
+
+from services.concurrency_controller import ConcurrencyController
+
+
+def feed(controller, total_speed, samples=None, saturated=True):
+    """Feed one judging window worth of samples, splitting the speed over the active slots."""
+    for _ in range(samples or controller.settle_samples):
+        streams = [total_speed / controller.limit] * controller.limit
+        controller.add_sample(total_speed, streams, saturated)
+    return controller.limit
+
+
+class TestConcurrencyController:
+    def test_increases_while_throughput_grows(self):
+        controller = ConcurrencyController(max_limit=10)
+        assert feed(controller, 100) == 2
+        assert feed(controller, 200) == 3
+        assert feed(controller, 300) == 4
+
+    def test_respects_max_limit(self):
+        controller = ConcurrencyController(max_limit=2)
+        feed(controller, 100)
+        assert feed(controller, 200) == 2
+
+    def test_steps_back_when_extra_slot_does_not_help(self):
+        controller = ConcurrencyController(hold_samples=4)
+        feed(controller, 100)
+        feed(controller, 200)
+        assert feed(controller, 201) == 2
+        # Holds the limit before probing again
+        assert feed(controller, 200, samples=4) == 2
+
+    def test_halves_when_throughput_drops(self):
+        controller = ConcurrencyController()
+        controller.reset(8)
+        feed(controller, 800)
+        assert controller.limit == 9
+        assert feed(controller, 400) == 4
+
+    def test_halves_when_stream_speed_collapses(self):
+        controller = ConcurrencyController()
+        controller.reset(4)
+        feed(controller, 400)
+        # Total stays the same but a single download gets everything while the rest stall
+        for _ in range(controller.settle_samples):
+            controller.add_sample(400, [400, 0, 0, 0, 0], saturated=True)
+        assert controller.limit == 2
+
+    def test_ignores_samples_while_not_saturated(self):
+        controller = ConcurrencyController()
+        assert feed(controller, 100, saturated=False) == 1
+        assert feed(controller, 100, samples=2) == 1
+
+    def test_reset_clamps_limit(self):
+        controller = ConcurrencyController(min_limit=1, max_limit=5)
+        controller.reset(20)
+        assert controller.limit == 5
+        controller.reset()
+        assert controller.limit == 1
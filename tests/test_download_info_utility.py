@@ -0,0 +1,47 @@
+"""Tests for utils/download_info_utility.py."""
+
+import pytest
+
+from utils.download_info_utility import DownloadInfoUtility
+
+DOWNLOAD_TYPE = {"itag": "137", "type": "video", "reso": "1080p", "size": 100, "inbuilt_audio": False}
+
+
+class FakeStream:
+    def __init__(self, itag, res, progressive):
+        self.itag = itag
+        self.resolution = res
+        self.is_progressive = progressive
+
+
+class FakeStreamQuery:
+    def __init__(self, streams):
+        self.streams = streams
+
+    def get_by_itag(self, itag):
+        return next((stream for stream in self.streams if stream.itag == int(itag)), None)
+
+    def filter(self, type, res, progressive):  # noqa: A002
+        assert type == "video"
+        return FakeStreamQuery(
+            [stream for stream in self.streams if stream.resolution == res and stream.is_progressive == progressive]
+        )
+
+    def first(self):
+        return self.streams[0] if self.streams else None
+
+
+class TestFindVideoStream:
+    def test_by_itag(self):
+        stream = FakeStream(137, "1080p", False)
+        streams = FakeStreamQuery([FakeStream(399, "1080p", False), stream])
+        assert DownloadInfoUtility.find_video_stream(streams, DOWNLOAD_TYPE) is stream
+
+    def test_same_resolution_when_itag_missing(self):
+        stream = FakeStream(399, "1080p", False)
+        streams = FakeStreamQuery([FakeStream(18, "1080p", True), stream])
+        assert DownloadInfoUtility.find_video_stream(streams, DOWNLOAD_TYPE) is stream
+
+    def test_missing_resolution_raises(self):
+        with pytest.raises(LookupError):
+            DownloadInfoUtility.find_video_stream(FakeStreamQuery([FakeStream(18, "360p", True)]), DOWNLOAD_TYPE)
@@ -0,0 +1,69 @@
+"""Tests for services/download_journal.py."""
+
+import threading
+
+import pytest
+
+from services.download_journal import DownloadJournal
+
+
+@pytest.fixture(autouse=True)
+def active_paths(monkeypatch):
+    monkeypatch.setattr(DownloadJournal, "active_paths", set())
+
+
+def make_partial_download(tmp_path, file_name="video.mp4"):
+    file_path = str(tmp_path / file_name)
+    with open(file_path, "wb") as file:
+        file.truncate(10)
+    journal = DownloadJournal(file_path, "dQw4w9WgXcQ", itag=18, file_size=10)
+    journal.add_ranges([(0, 3)])
+    return file_path
+
+
+class TestLoad:
+    def test_same_stream_resumed(self, tmp_path):
+        journal = DownloadJournal.load(make_partial_download(tmp_path), "dQw4w9WgXcQ", 18, 10)
+        assert journal.ranges == [(0, 3)]
+        assert journal.missing_ranges() == [(4, 9)]
+
+    def test_other_video_not_resumed(self, tmp_path):
+        assert DownloadJournal.load(make_partial_download(tmp_path), "jNQXAC9IVRw", 18, 10) is None
+
+    def test_other_stream_not_resumed(self, tmp_path):
+        assert DownloadJournal.load(make_partial_download(tmp_path), "dQw4w9WgXcQ", 22, 10) is None
+
+
+class TestClaim:
+    def test_concurrent_lookups_get_distinct_files(self, tmp_path):
+        make_partial_download(tmp_path)
+        make_partial_download(tmp_path, "video (0).mp4")
+        barrier = threading.Barrier(4)
+        found = []
+
+        def find():
+            barrier.wait()
+            found.append(
+                DownloadJournal.find_resumable(str(tmp_path / "video.mp4"), "dQw4w9WgXcQ", 18, 10, acquire=True)
+            )
+
+        threads = [threading.Thread(target=find) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        claimed = [path for path in found if path is not None]
+        assert sorted(claimed) == [str(tmp_path / "video (0).mp4"), str(tmp_path / "video.mp4")]
+        assert found.count(None) == 2
+
+    def test_released_file_resumable_again(self, tmp_path):
+        file_path = make_partial_download(tmp_path)
+        assert DownloadJournal.find_resumable(file_path, "dQw4w9WgXcQ", 18, 10, acquire=True) == file_path
+        assert DownloadJournal.find_resumable(file_path, "dQw4w9WgXcQ", 18, 10) is None
+        DownloadJournal.release_path(file_path)
+        assert DownloadJournal.find_resumable(file_path, "dQw4w9WgXcQ", 18, 10) == file_path
+
+    def test_available_path_not_handed_out_twice(self, tmp_path):
+        file_path = str(tmp_path / "video.mp4")
+        assert DownloadJournal.acquire_available_path(file_path) == file_path
+        assert DownloadJournal.acquire_available_path(file_path) == str(tmp_path / "video (0).mp4")
@@ -0,0 +1,74 @@
+"""Tests for services/download_speed_tracker.py."""
+
+import pytest
+
+from services.concurrency_controller import ConcurrencyController
+from services.download_speed_tracker import DownloadSpeedTracker
+
+TICK = 2
+
+
+class FakeVideo:
+    def __init__(self):
+        self.download_state = "downloading"
+        self.total_bytes_downloaded = 0
+        self.total_download_time = 0
+
+    def get_transferred_bytes(self):
+        return self.total_bytes_downloaded
+
+    def download(self, speed):
+        self.total_bytes_downloaded += speed * TICK
+        self.total_download_time += TICK
+
+
+@pytest.fixture(autouse=True)
+def last_samples(monkeypatch):
+    monkeypatch.setattr(DownloadSpeedTracker, "last_samples", {})
+
+
+class TestRecentSpeeds:
+    def test_first_tick_has_no_speed(self):
+        assert DownloadSpeedTracker.get_recent_speeds([FakeVideo()], 0) == []
+
+    def test_speed_since_previous_tick(self):
+        video = FakeVideo()
+        DownloadSpeedTracker.get_recent_speeds([video], 0)
+        video.download(500)
+        assert DownloadSpeedTracker.get_recent_speeds([video], TICK) == [500]
+
+    def test_paused_download_starts_over(self):
+        video = FakeVideo()
+        DownloadSpeedTracker.get_recent_speeds([video], 0)
+        DownloadSpeedTracker.get_recent_speeds([], TICK)
+        video.download(500)
+        assert DownloadSpeedTracker.get_recent_speeds([video], 2 * TICK) == []
+
+    def test_controller_reacts_to_drop_after_steady_period(self):
+        controller = ConcurrencyController(hold_samples=0)
+        controller.reset(4)
+        videos = [FakeVideo() for _ in range(4)]
+        now = 0
+        DownloadSpeedTracker.get_recent_speeds(videos, now)
+
+        def tick(speed):
+            nonlocal now
+            now += TICK
+            for video in videos:
+                video.download(speed)
+            speeds = DownloadSpeedTracker.get_recent_speeds(videos, now)
+            controller.add_sample(sum(speeds), speeds, saturated=True)
+
+        # Steady for half an hour, the limit probes up and steps back
+        for _ in range(900):
+            tick(1000)
+        steady_limit = controller.limit
+        cumulative_speed = videos[0].get_transferred_bytes() / videos[0].total_download_time
+
+        for _ in range(2 * controller.settle_samples):
+            tick(100)
+            if controller.limit != steady_limit:
+                break
+        # The average since the start has barely moved, the recent speed has
+        assert videos[0].get_transferred_bytes() / videos[0].total_download_time > cumulative_speed * 0.95
+        assert controller.limit == max(steady_limit // 2, 1)
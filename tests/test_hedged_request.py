@@ -0,0 +1,129 @@
+"""Tests for services/hedged_request.py."""
+
+import threading
+import time
+
+import pytest
+
+from services.hedged_request import HedgedRequest
+
+
+class FatalError(Exception):
+    pass
+
+
+def succeed(value, delay=0.0):
+    def attempt():
+        time.sleep(delay)
+        return value
+
+    return attempt
+
+
+def fail(delay=0.0, error=RuntimeError):
+    def attempt():
+        time.sleep(delay)
+        raise error("failed")
+
+    return attempt
+
+
+class Slots:
+    """Stand-in for the load manager slots, counting reservations."""
+
+    def __init__(self, free):
+        self.free = free
+        self.reserved = 0
+        self.lock = threading.Lock()
+
+    def reserve(self):
+        with self.lock:
+            if self.free == 0:
+                return False
+            self.free -= 1
+            self.reserved += 1
+            return True
+
+    def release(self):
+        with self.lock:
+            self.free += 1
+
+
+class TestFallback:
+    def test_first_success(self):
+        assert HedgedRequest.run([succeed("a"), succeed("b")]) == "a"
+
+    def test_falls_back_after_failure(self):
+        assert HedgedRequest.run([fail(), fail(), succeed("c")]) == "c"
+
+    def test_raises_last_error(self):
+        with pytest.raises(ValueError):
+            HedgedRequest.run([fail(), fail(error=ValueError)])
+
+    def test_fatal_error_stops_fallback(self):
+        started = []
+
+        def attempt():
+            started.append(True)
+            return "b"
+
+        with pytest.raises(FatalError):
+            HedgedRequest.run([fail(error=FatalError), attempt], fatal_errors=(FatalError,))
+        assert not started
+
+    def test_should_stop(self):
+        with pytest.raises(RuntimeError):
+            HedgedRequest.run([succeed("a")], should_stop=lambda: True)
+
+    def test_no_hedge_without_delay(self):
+        slots = Slots(free=5)
+        result = HedgedRequest.run(
+            [succeed("a", delay=0.2), succeed("b")], reserve_slot=slots.reserve, release_slot=slots.release
+        )
+        assert result == "a"
+        assert slots.reserved == 0
+
+
+class TestHedging:
+    def test_slow_attempt_hedged(self):
+        slots = Slots(free=1)
+        time_s = time.monotonic()
+        result = HedgedRequest.run(
+            [succeed("slow", delay=2), succeed("fast")],
+            get_delay=lambda _index: 0.05,
+            reserve_slot=slots.reserve,
+            release_slot=slots.release,
+        )
+        assert result == "fast"
+        assert time.monotonic() - time_s < 1
+        assert slots.reserved == 1
+
+    def test_hedged_slot_released(self):
+        slots = Slots(free=1)
+        HedgedRequest.run(
+            [succeed("slow", delay=0.3), succeed("fast")],
+            get_delay=lambda _index: 0.05,
+            reserve_slot=slots.reserve,
+            release_slot=slots.release,
+        )
+        assert slots.free == 1
+
+    def test_waits_without_free_slot(self):
+        slots = Slots(free=0)
+        result = HedgedRequest.run(
+            [succeed("slow", delay=0.2), succeed("fast")],
+            get_delay=lambda _index: 0.05,
+            reserve_slot=slots.reserve,
+            release_slot=slots.release,
+        )
+        assert result == "slow"
+
+    def test_failed_hedge_keeps_waiting_for_first(self):
+        slots = Slots(free=1)
+        result = HedgedRequest.run(
+            [succeed("slow", delay=0.3), fail()],
+            get_delay=lambda _index: 0.05,
+            reserve_slot=slots.reserve,
+            release_slot=slots.release,
+        )
+        assert result == "slow"
@@ -0,0 +1,46 @@
+"""Tests for utils/http_utility.py."""
+
+import pytest
+import requests
+
+from utils.http_utility import HttpUtility
+
+
+@pytest.fixture
+def files(tmp_path, http_server, monkeypatch):
+    """A fresh client and the base url of a server with two files."""
+    monkeypatch.setattr(HttpUtility, "session", None)
+    monkeypatch.setattr(HttpUtility, "connection_stats", {})
+    (tmp_path / "a.txt").write_bytes(b"a")
+    (tmp_path / "b.txt").write_bytes(b"b")
+    yield http_server
+    HttpUtility.close()
+
+
+class TestGet:
+    def test_returns_content(self, files):
+        assert HttpUtility.get(f"{files}a.txt").content == b"a"
+
+    def test_error_status_raised(self, files):
+        with pytest.raises(requests.HTTPError) as error:
+            HttpUtility.get(f"{files}missing.txt")
+        assert error.value.response.status_code == 404
+
+    def test_session_shared(self, files):
+        HttpUtility.get(f"{files}a.txt")
+        session = HttpUtility.session
+        HttpUtility.get(f"{files}b.txt")
+        assert HttpUtility.session is session
+
+
+class TestConnectionStats:
+    def test_connection_reused(self, files):
+        for _ in range(5):
+            HttpUtility.get(f"{files}a.txt")
+        HttpUtility.get(f"{files}b.txt")
+        assert HttpUtility.get_connection_stats() == {"127.0.0.1": {"requests": 6, "connections": 1, "reused": 5}}
+
+    def test_reset(self, files):
+        HttpUtility.get(f"{files}a.txt")
+        assert HttpUtility.get_connection_stats(reset=True)["127.0.0.1"]["requests"] == 1
+        assert HttpUtility.get_connection_stats() == {}
@@ -0,0 +1,36 @@
+"""Tests for utils/image_utility.py."""
+
+from PIL import Image
+
+from utils.image_utility import ImageUtility
+
+
+class TestCreateImageWithHoverEffect:
+    def test_brightens_every_channel(self):
+        image = Image.new("RGB", (4, 3), (10, 100, 200))
+        hover_image = ImageUtility.create_image_with_hover_effect(image, 50)
+        assert hover_image.getpixel((2, 1)) == (60, 150, 250)
+
+    def test_clipped_at_white(self):
+        image = Image.new("RGB", (2, 2), (230, 250, 255))
+        assert ImageUtility.create_image_with_hover_effect(image, 50).getpixel((0, 0)) == (255, 255, 255)
+
+    def test_drops_alpha(self):
+        image = Image.new("RGBA", (2, 2), (0, 0, 0, 0))
+        hover_image = ImageUtility.create_image_with_hover_effect(image, 40)
+        assert hover_image.mode == "RGB"
+        assert hover_image.getpixel((1, 1)) == (40, 40, 40)
+
+
+class TestCreateImageWithRoundedCorners:
+    def test_corners_transparent(self):
+        image = ImageUtility.create_image_with_rounded_corners(Image.new("RGB", (40, 30), "red"), radius=8)
+        for corner in ((0, 0), (39, 0), (0, 29), (39, 29)):
+            assert image.getpixel(corner)[3] == 0
+        assert image.getpixel((20, 15))[3] == 255
+        assert image.getpixel((20, 0))[3] == 255
+
+    def test_mask_shared_between_same_sizes(self):
+        first_mask = ImageUtility.get_rounded_corner_mask((40, 30), 8)
+        assert ImageUtility.get_rounded_corner_mask((40, 30), 8) is first_mask
+        assert ImageUtility.get_rounded_corner_mask((40, 30), 6) is not first_mask
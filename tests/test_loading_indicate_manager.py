@@ -0,0 +1,64 @@
+"""Tests for services/loading_indicate_manager.py."""
+
+import pytest
+
+from services.loading_indicate_manager import LoadingIndicateManager
+
+
+class FakeWidget:
+    def __init__(self, exists=True, viewable=True):
+        self.exists = exists
+        self.viewable = viewable
+        self.dots = []
+
+    def winfo_exists(self):
+        return self.exists
+
+    def winfo_viewable(self):
+        return self.viewable
+
+    def update_loading_animation(self, dots_count):
+        self.dots.append(dots_count)
+
+
+@pytest.fixture(autouse=True)
+def widgets(monkeypatch):
+    monkeypatch.setattr(LoadingIndicateManager, "widgets", [])
+    monkeypatch.setattr(LoadingIndicateManager, "dots_count", 1)
+
+
+class TestLoadingIndicateManager:
+    def test_dots_cycle(self):
+        widget = FakeWidget()
+        LoadingIndicateManager.register_widget(widget)
+        for _ in range(5):
+            LoadingIndicateManager.tick()
+        assert widget.dots == [2, 3, 4, 1, 2]
+
+    def test_hidden_widget_skipped(self):
+        widget = FakeWidget(viewable=False)
+        LoadingIndicateManager.register_widget(widget)
+        LoadingIndicateManager.tick()
+        assert widget.dots == []
+        assert widget in LoadingIndicateManager.widgets
+
+    def test_destroyed_widget_unregistered(self):
+        widget = FakeWidget(exists=False)
+        LoadingIndicateManager.register_widget(widget)
+        LoadingIndicateManager.tick()
+        assert LoadingIndicateManager.widgets == []
+
+    def test_unregistered_widget_stops(self):
+        widget = FakeWidget()
+        LoadingIndicateManager.register_widget(widget)
+        LoadingIndicateManager.tick()
+        LoadingIndicateManager.unregister_widget(widget)
+        LoadingIndicateManager.tick()
+        assert widget.dots == [2]
+
+    def test_register_once(self):
+        widget = FakeWidget()
+        LoadingIndicateManager.register_widget(widget)
+        LoadingIndicateManager.register_widget(widget)
+        LoadingIndicateManager.tick()
+        assert widget.dots == [2]
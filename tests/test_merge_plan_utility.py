@@ -0,0 +1,53 @@
+"""Tests for utils/merge_plan_utility.py."""
+
+from utils.merge_plan_utility import MergePlanUtility
+
+
+class TestGetCodecFamily:
+    def test_strips_profile(self):
+        assert MergePlanUtility.get_codec_family("avc1.640028") == "avc1"
+
+    def test_lower_cases(self):
+        assert MergePlanUtility.get_codec_family("MP4A.40.2") == "mp4a"
+
+    def test_plain_codec(self):
+        assert MergePlanUtility.get_codec_family("opus") == "opus"
+
+    def test_none(self):
+        assert MergePlanUtility.get_codec_family(None) == ""
+
+
+class TestGetMergePlan:
+    def test_h264_with_aac_copies_into_mp4(self):
+        plan = MergePlanUtility.get_merge_plan("avc1.640028", "mp4a.40.2")
+        assert plan == {"container": "mp4", "audio_codec": "copy"}
+
+    def test_av1_with_aac_copies_into_mp4(self):
+        plan = MergePlanUtility.get_merge_plan("av01.0.08M.08", "mp4a.40.2")
+        assert plan == {"container": "mp4", "audio_codec": "copy"}
+
+    def test_vp9_with_opus_copies_into_webm(self):
+        plan = MergePlanUtility.get_merge_plan("vp9", "opus")
+        assert plan == {"container": "webm", "audio_codec": "copy"}
+
+    def test_h264_with_opus_copies_into_mkv(self):
+        plan = MergePlanUtility.get_merge_plan("avc1.4d401f", "opus")
+        assert plan == {"container": "mkv", "audio_codec": "copy"}
+
+    def test_vp9_with_aac_copies_into_mkv(self):
+        plan = MergePlanUtility.get_merge_plan("vp09.00.40.08", "mp4a.40.2")
+        assert plan == {"container": "mkv", "audio_codec": "copy"}
+
+    def test_unknown_codec_re_encodes_into_mp4(self):
+        plan = MergePlanUtility.get_merge_plan("avc1.640028", None)
+        assert plan == {"container": "mp4", "audio_codec": "aac"}
+
+
+class TestGetCodecArguments:
+    def test_copy(self):
+        arguments = MergePlanUtility.get_codec_arguments({"container": "mp4", "audio_codec": "copy"})
+        assert arguments == ["-c:v", "copy", "-c:a", "copy"]
+
+    def test_aac(self):
+        arguments = MergePlanUtility.get_codec_arguments({"container": "mp4", "audio_codec": "aac"})
+        assert arguments == ["-c:v", "copy", "-c:a", "aac"]
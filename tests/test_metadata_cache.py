@@ -0,0 +1,81 @@
+"""Tests for services/metadata_cache.py."""
+
+import os
+
+import pytest
+
+from services.metadata_cache import MetadataCache
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(MetadataCache, "data_base", os.path.join(tmp_path, MetadataCache.data_base_name))
+    MetadataCache.initialize()
+    yield MetadataCache
+    MetadataCache.connection.close()
+    MetadataCache.connection = None
+
+
+class TestGetVideoId:
+    def test_watch_url(self):
+        assert MetadataCache.get_video_id("https://www.youtube.com/watch?v=dQw4w9WgXcQ") == "dQw4w9WgXcQ"
+
+    def test_short_url(self):
+        assert MetadataCache.get_video_id("https://youtu.be/dQw4w9WgXcQ") == "dQw4w9WgXcQ"
+
+    def test_not_a_video(self):
+        assert MetadataCache.get_video_id("https://example.com") is None
+
+
+class TestMetadataCache:
+    def test_round_trip(self, cache):
+        data = {"title": "Title", "length": 212, "support_download_types": [{"itag": "18", "size": 10}]}
+        cache.put("abc", data)
+        assert cache.get("abc") == data
+
+    def test_missing(self, cache):
+        assert cache.get("abc") is None
+
+    def test_replace(self, cache):
+        cache.put("abc", {"title": "Old"})
+        cache.put("abc", {"title": "New"})
+        assert cache.get("abc") == {"title": "New"}
+
+    def test_expired(self, cache, monkeypatch):
+        cache.put("abc", {"title": "Title"})
+        monkeypatch.setattr(MetadataCache, "ttl", -1)
+        assert cache.get("abc") is None
+
+    def test_expired_entries_dropped_on_initialize(self, cache, monkeypatch):
+        cache.put("abc", {"title": "Title"})
+        monkeypatch.setattr(MetadataCache, "ttl", -1)
+        cache.connection.close()
+        cache.initialize()
+        monkeypatch.setattr(MetadataCache, "ttl", 60)
+        assert cache.get("abc") is None
+
+    def test_remove(self, cache):
+        cache.put("abc", {"title": "Title"})
+        cache.remove("abc")
+        assert cache.get("abc") is None
+
+    def test_without_connection(self):
+        assert MetadataCache.connection is None
+        MetadataCache.put("abc", {"title": "Title"})
+        assert MetadataCache.get("abc") is None
+
+    def test_get_many(self, cache):
+        cache.put("abc", {"title": "A"})
+        cache.put("def", {"title": "D"})
+        assert cache.get_many(["abc", "def", "missing"]) == {"abc": {"title": "A"}, "def": {"title": "D"}}
+
+    def test_get_many_in_batches(self, cache, monkeypatch):
+        monkeypatch.setattr(MetadataCache, "batch_size", 2)
+        for index in range(5):
+            cache.put(f"id{index}", {"title": str(index)})
+        assert len(cache.get_many([f"id{index}" for index in range(5)])) == 5
+
+    def test_get_many_skips_expired(self, cache, monkeypatch):
+        cache.put("abc", {"title": "A"})
+        monkeypatch.setattr(MetadataCache, "ttl", -1)
+        assert cache.get_many(["abc"]) == {}
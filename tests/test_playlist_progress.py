@@ -0,0 +1,82 @@
+"""Tests for services/playlist_progress.py."""
+
+import pytest
+
+from services.playlist_progress import PlaylistProgress
+
+
+class TestStateCounts:
+    def test_counts_states(self):
+        progress = PlaylistProgress()
+        progress.set_state("a", "waiting")
+        progress.set_state("b", "waiting")
+        progress.set_state("c", "downloading")
+        assert progress.get_count("waiting") == 2
+        assert progress.get_count("downloading") == 1
+        assert progress.get_count("failed") == 0
+
+    def test_state_change_moves_count(self):
+        progress = PlaylistProgress()
+        assert progress.set_state("a", "waiting") is None
+        assert progress.set_state("a", "downloading") == "waiting"
+        assert progress.get_count("waiting") == 0
+        assert progress.get_count("downloading") == 1
+
+    def test_remove(self):
+        progress = PlaylistProgress()
+        progress.set_state("a", "paused")
+        assert progress.remove("a") == "paused"
+        assert progress.get_count("paused") == 0
+        assert progress.remove("a") is None
+
+
+class TestTotals:
+    def test_adds_videos(self):
+        progress = PlaylistProgress()
+        progress.update("a", 50, 100, 2.0)
+        progress.update("b", 100, 400, 1.0)
+        assert progress.bytes_downloaded == 150
+        assert progress.file_size == 500
+        assert progress.download_time == pytest.approx(3.0)
+        assert progress.completion == pytest.approx(0.75)
+
+    def test_update_replaces_previous_report(self):
+        progress = PlaylistProgress()
+        progress.update("a", 50, 100, 2.0)
+        progress.update("a", 75, 100, 3.0)
+        assert progress.bytes_downloaded == 75
+        assert progress.file_size == 100
+        assert progress.completion == pytest.approx(0.75)
+
+    def test_restarted_download(self):
+        progress = PlaylistProgress()
+        progress.update("a", 80, 100, 4.0)
+        progress.update("a", 0, 100, 0.0)
+        assert progress.bytes_downloaded == 0
+        assert progress.download_time == 0.0
+        assert progress.completion == 0.0
+
+    def test_unknown_file_size_not_counted(self):
+        progress = PlaylistProgress()
+        progress.update("a", 0, 0, 1.5)
+        assert progress.download_time == 0.0
+        assert progress.file_size == 0
+
+    def test_resumed_bytes_left_out_of_estimate(self):
+        progress = PlaylistProgress()
+        # 60 of 100 bytes on disk from an earlier attempt, 20 more downloaded in 2 seconds
+        progress.update("a", 80, 100, 2.0, resumed_bytes=60)
+        assert progress.bytes_downloaded == 80
+        assert progress.resumed_bytes == 60
+        assert progress.get_estimated_time() == 2
+        progress.remove("a")
+        assert progress.resumed_bytes == 0
+
+    def test_remove_subtracts_video(self):
+        progress = PlaylistProgress()
+        progress.update("a", 50, 100, 2.0)
+        progress.update("b", 100, 400, 1.0)
+        progress.remove("a")
+        assert progress.bytes_downloaded == 100
+        assert progress.file_size == 400
+        assert progress.completion == pytest.approx(0.25)
@@ -0,0 +1,58 @@
+"""Tests for services/progress_updater.py."""
+
+import pytest
+
+from services.progress_updater import ProgressUpdater
+
+
+class FakeWidget:
+    def __init__(self, exists=True, viewable=True):
+        self.exists = exists
+        self.viewable = viewable
+        self.renders = 0
+
+    def winfo_exists(self):
+        return self.exists
+
+    def winfo_viewable(self):
+        return self.viewable
+
+    def render_progress(self):
+        self.renders += 1
+
+
+@pytest.fixture(autouse=True)
+def pending(monkeypatch):
+    monkeypatch.setattr(ProgressUpdater, "pending", {})
+
+
+class TestProgressUpdater:
+    def test_many_publishes_render_once(self):
+        widget = FakeWidget()
+        for _ in range(50):
+            ProgressUpdater.publish(widget)
+        ProgressUpdater.render()
+        ProgressUpdater.render()
+        assert widget.renders == 1
+
+    def test_renders_every_published_widget(self):
+        widgets = [FakeWidget() for _ in range(3)]
+        for widget in widgets:
+            ProgressUpdater.publish(widget)
+        ProgressUpdater.render()
+        assert [widget.renders for widget in widgets] == [1, 1, 1]
+
+    def test_hidden_widget_rendered_once_shown(self):
+        widget = FakeWidget(viewable=False)
+        ProgressUpdater.publish(widget)
+        ProgressUpdater.render()
+        assert widget.renders == 0
+        widget.viewable = True
+        ProgressUpdater.render()
+        assert widget.renders == 1
+
+    def test_destroyed_widget_dropped(self):
+        widget = FakeWidget(exists=False)
+        ProgressUpdater.publish(widget)
+        ProgressUpdater.render()
+        assert ProgressUpdater.pending == {}
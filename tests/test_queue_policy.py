@@ -0,0 +1,76 @@
+"""Tests for services/queue_policy.py."""
+
+from services.queue_policy import FairShareQueuePolicy, FifoQueuePolicy
+
+
+def pop_all(policy):
+    return [policy.pop() for _ in range(len(policy))]
+
+
+class TestFifoQueuePolicy:
+    def test_keeps_push_order(self):
+        policy = FifoQueuePolicy()
+        for item in ("a", "b", "c"):
+            policy.push(item, priority=len(item))
+        assert pop_all(policy) == ["a", "b", "c"]
+
+    def test_move_to_front(self):
+        policy = FifoQueuePolicy()
+        for item in ("a", "b", "c"):
+            policy.push(item)
+        assert policy.move_to_front("c")
+        assert pop_all(policy) == ["c", "a", "b"]
+
+    def test_remove_unknown_item(self):
+        assert not FifoQueuePolicy().remove("a")
+
+
+class TestFairShareQueuePolicy:
+    def test_playlist_does_not_starve_standalone_videos(self):
+        policy = FairShareQueuePolicy()
+        for number in range(5):
+            policy.push(f"playlist-{number}", group="playlist")
+        policy.push("video")
+        assert pop_all(policy)[:3] == ["playlist-0", "video", "playlist-1"]
+
+    def test_round_robin_between_playlists(self):
+        policy = FairShareQueuePolicy()
+        for number in range(2):
+            policy.push(f"a-{number}", group="a")
+        for number in range(2):
+            policy.push(f"b-{number}", group="b")
+        assert pop_all(policy) == ["a-0", "b-0", "a-1", "b-1"]
+
+    def test_higher_priority_first(self):
+        policy = FairShareQueuePolicy()
+        policy.push("low", group="a")
+        policy.push("normal", group="b")
+        policy.push("high", priority=5, group="a")
+        assert pop_all(policy) == ["high", "normal", "low"]
+
+    def test_move_to_front(self):
+        policy = FairShareQueuePolicy()
+        for number in range(3):
+            policy.push(number, group="playlist")
+        assert policy.move_to_front(2)
+        assert pop_all(policy) == [2, 0, 1]
+
+    def test_remove(self):
+        policy = FairShareQueuePolicy()
+        for number in range(3):
+            policy.push(number, group="playlist")
+        assert policy.remove(1)
+        assert not policy.remove(1)
+        assert 1 not in policy
+        assert pop_all(policy) == [0, 2]
+
+    def test_get_items_matches_pop_order(self):
+        policy = FairShareQueuePolicy()
+        for number in range(3):
+            policy.push(f"a-{number}", group="a")
+        policy.push("b-0", priority=1, group="b")
+        policy.push("video")
+        policy.move_to_front("a-2")
+        items = policy.get_items()
+        assert items == pop_all(policy)
+        assert len(policy) == 0
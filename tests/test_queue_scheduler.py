@@ -0,0 +1,164 @@
+"""Tests for services/queue_scheduler.py."""
+
+import queue
+import threading
+from collections import Counter
+
+from services.queue_scheduler import QueueScheduler
+
+
+class FakeJob:
+    def __init__(self, number):
+        self.number = number
+
+
+def make_scheduler(max_active, started):
+    return QueueScheduler("job", lambda: max_active, started.append)
+
+
+class TestRegister:
+    def test_queues_item(self):
+        scheduler = make_scheduler(1, [])
+        assert scheduler.register(FakeJob(0))
+        assert scheduler.get_queued_count() == 1
+
+    def test_rejects_duplicate(self):
+        scheduler = make_scheduler(1, [])
+        job = FakeJob(0)
+        scheduler.register(job)
+        assert not scheduler.register(job)
+        assert scheduler.get_queued_count() == 1
+
+    def test_is_queued_until_started(self):
+        scheduler = make_scheduler(1, [])
+        job = FakeJob(0)
+        assert not scheduler.is_queued(job)
+        scheduler.register(job)
+        assert scheduler.is_queued(job)
+        scheduler.schedule()
+        assert not scheduler.is_queued(job)
+
+    def test_unregister_unknown_item(self):
+        scheduler = make_scheduler(1, [])
+        assert not scheduler.unregister_from_queued(FakeJob(0))
+        assert not scheduler.unregister_from_active(FakeJob(0))
+
+
+class TestSchedule:
+    def test_fills_every_free_slot(self):
+        started = []
+        scheduler = make_scheduler(3, started)
+        jobs = [FakeJob(number) for number in range(5)]
+        for job in jobs:
+            scheduler.register(job)
+        assert scheduler.schedule() == 3
+        assert started == jobs[:3]
+        assert scheduler.get_active_count() == 3
+        assert scheduler.get_queued_items() == jobs[3:]
+
+    def test_freed_slot_starts_next_item(self):
+        started = []
+        scheduler = make_scheduler(1, started)
+        first, second = FakeJob(0), FakeJob(1)
+        scheduler.register(first)
+        scheduler.register(second)
+        scheduler.schedule()
+        scheduler.unregister_from_active(first)
+        assert scheduler.schedule() == 1
+        assert started == [first, second]
+
+    def test_failed_start_goes_back_to_front(self):
+        def start_item(job):
+            raise RuntimeError("boom")
+
+        scheduler = QueueScheduler("job", lambda: 2, start_item)
+        jobs = [FakeJob(number) for number in range(3)]
+        for job in jobs:
+            scheduler.register(job)
+        assert scheduler.schedule() == 0
+        assert scheduler.get_active_count() == 0
+        assert scheduler.get_queued_items() == jobs
+
+
+class TestReservedSlots:
+    def test_reserve_takes_free_slot(self):
+        started = []
+        scheduler = make_scheduler(2, started)
+        assert scheduler.reserve_slot()
+        jobs = [FakeJob(number) for number in range(2)]
+        for job in jobs:
+            scheduler.register(job)
+        assert scheduler.schedule() == 1
+        assert not scheduler.reserve_slot()
+
+    def test_release_frees_slot(self):
+        started = []
+        scheduler = make_scheduler(1, started)
+        assert scheduler.reserve_slot()
+        scheduler.register(FakeJob(0))
+        assert scheduler.schedule() == 0
+        scheduler.release_slot()
+        assert scheduler.schedule() == 1
+
+
+class TestConcurrency:
+    def test_stress_register_and_unregister(self):
+        max_active = 4
+        thread_count = 16
+        jobs_per_thread = 500
+        lock = threading.Lock()
+        start_counts = Counter()
+        peak_active = 0
+        cancelled = []
+        running = queue.Queue()
+
+        def start_item(job):
+            nonlocal peak_active
+            with lock:
+                start_counts[job] += 1
+                peak_active = max(peak_active, scheduler.get_active_count())
+            running.put(job)
+
+        scheduler = QueueScheduler("job", lambda: max_active, start_item)
+
+        def producer(offset):
+            for number in range(jobs_per_thread):
+                job = FakeJob(offset + number)
+                scheduler.register(job)
+                # Cancel some jobs while they are still waiting
+                if number % 7 == 0 and scheduler.unregister_from_queued(job):
+                    cancelled.append(job)
+                scheduler.schedule()
+
+        def finisher():
+            while True:
+                job = running.get()
+                if job is None:
+                    return
+                scheduler.unregister_from_active(job)
+                scheduler.schedule()
+
+        finishers = [threading.Thread(target=finisher) for _ in range(4)]
+        producers = [
+            threading.Thread(target=producer, args=(index * jobs_per_thread,)) for index in range(thread_count)
+        ]
+        for thread in finishers + producers:
+            thread.start()
+        for thread in producers:
+            thread.join()
+
+        # Drain whatever is still queued once the producers are done
+        while scheduler.get_queued_count() or scheduler.get_active_count():
+            scheduler.schedule()
+        for _ in finishers:
+            running.put(None)
+        for thread in finishers:
+            thread.join()
+
+        assert all(count == 1 for count in start_counts.values())
+        assert peak_active <= max_active
+        assert scheduler.get_queued_count() == 0
+        assert scheduler.get_active_count() == 0
+        # Every job was either started exactly once or cancelled before it could start
+        assert len(start_counts) + len(cancelled) == thread_count * jobs_per_thread
+        assert not set(cancelled) & set(start_counts)
@@ -0,0 +1,147 @@
+"""Tests for services/segmented_downloader.py."""
+
+import asyncio
+import io
+import threading
+
+import pytest
+
+from services.async_download_engine import AsyncDownloadEngine
+from services.download_journal import DownloadJournal
+from services.segmented_downloader import SegmentedDownloader
+
+DATA = b"abcdef"
+
+
+@pytest.fixture
+def streams(monkeypatch):
+    """Serve DATA as a stream of unknown size, recording where each response starts and ends."""
+    opened = []
+    closed = []
+
+    async def iter_stream(url, chunk_size, throttle=None, start=0):
+        opened.append(start)
+        try:
+            for position in range(start, len(DATA), chunk_size):
+                yield DATA[position : position + chunk_size]
+                await asyncio.sleep(0)
+        finally:
+            closed.append(start)
+
+    monkeypatch.setattr(AsyncDownloadEngine, "iter_stream", iter_stream)
+    return opened, closed
+
+
+async def download_paused(pause_time: float) -> tuple[bytes, list[int]]:
+    sink = io.BytesIO()
+    downloader = SegmentedDownloader(url="https://example.com", file_path="", file_size=0, chunk_size=2, sink=sink)
+    downloader.pause()
+    downloader.start()
+    await asyncio.sleep(pause_time)
+    downloader.resume()
+    sizes = [size async for size, _request_time in downloader.iter_progress()]
+    return sink.getvalue(), sizes
+
+
+class TestSplitRanges:
+    def test_aligned_to_chunks(self):
+        assert SegmentedDownloader.split_ranges(10, 2, 3) == [(0, 5), (6, 9)]
+
+    def test_empty_file(self):
+        assert SegmentedDownloader.split_ranges(0, 4, 3) == []
+
+
+class TestPausedStream:
+    def test_short_pause_keeps_response(self, streams, monkeypatch):
+        monkeypatch.setattr(SegmentedDownloader, "pause_release_delay", 10.0)
+        data, sizes = asyncio.run(download_paused(0.05))
+        assert data == DATA
+        assert sizes == [2, 2, 2]
+        assert streams[0] == [0]
+
+    def test_long_pause_releases_response(self, streams, monkeypatch):
+        monkeypatch.setattr(SegmentedDownloader, "pause_release_delay", 0.01)
+        data, sizes = asyncio.run(download_paused(0.2))
+        assert data == DATA
+        assert sizes == [2, 2, 2]
+        # The first response was closed during the pause and the rest fetched from byte 2
+        assert streams == ([0, 2], [0, 2])
+
+
+class RecordingSink(io.BytesIO):
+    """A sink recording the threads it is written from."""
+
+    def __init__(self):
+        super().__init__()
+        self.threads = set()
+
+    def write(self, data):
+        self.threads.add(threading.current_thread().name)
+        return super().write(data)
+
+
+class TestSink:
+    def test_written_in_order_from_own_thread(self, monkeypatch):
+        async def fetch_range(url, start, stop, cancel_event, throttle):
+            return DATA[start : stop + 1]
+
+        monkeypatch.setattr(AsyncDownloadEngine, "fetch_range", fetch_range)
+
+        async def download() -> RecordingSink:
+            sink = RecordingSink()
+            downloader = SegmentedDownloader(
+                url="https://example.com", file_path="", file_size=len(DATA), chunk_size=2, sink=sink
+            )
+            downloader.start()
+            sizes = [size async for size, _request_time in downloader.iter_progress()]
+            assert sizes == [2, 2, 2]
+            return sink
+
+        sink = asyncio.run(download())
+        assert sink.getvalue() == DATA
+        assert len(sink.threads) == 1
+        assert sink.threads.pop().startswith("sink-writer")
+
+
+class TestResume:
+    def test_holes_share_the_connections(self, tmp_path, monkeypatch):
+        data = bytes(range(20))
+        requested = []
+
+        async def fetch_range(url, start, stop, cancel_event, throttle):
+            requested.append((start, stop))
+            return data[start : stop + 1]
+
+        monkeypatch.setattr(AsyncDownloadEngine, "fetch_range", fetch_range)
+        file_path = str(tmp_path / "video.mp4")
+        with open(file_path, "wb") as file:
+            file.write(bytes(20))
+        # every other byte is missing, ten holes
+        kept = [(index, index) for index in range(0, 20, 2)]
+        with open(file_path, "r+b") as file:
+            for start, _end in kept:
+                file.seek(start)
+                file.write(data[start : start + 1])
+        journal = DownloadJournal(file_path, video_id="dQw4w9WgXcQ", itag=18, file_size=20, ranges=kept)
+
+        async def download() -> int:
+            downloader = SegmentedDownloader(
+                url="https://example.com",
+                file_path=file_path,
+                file_size=20,
+                connections=3,
+                chunk_size=4,
+                journal=journal,
+            )
+            downloader.start()
+            workers = len(downloader._workers)
+            sizes = [size async for size, _request_time in downloader.iter_progress()]
+            assert sum(sizes) == 10
+            assert downloader.error is None
+            return workers
+
+        assert asyncio.run(download()) == 3
+        assert len(requested) == 10
+        with open(file_path, "rb") as file:
+            assert file.read() == data
+        assert journal.missing_ranges() == []
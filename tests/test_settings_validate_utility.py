@@ -73,3 +73,17 @@ class TestValidateChunkSizeValue:
 
     def test_non_numeric(self):
         assert SettingsValidateUtility.validate_chunk_size_value("abcKB") is False
+
+
+class TestValidateSpeedLimitValue:
+    def test_valid_limit(self):
+        assert SettingsValidateUtility.validate_speed_limit_value("512") is True
+
+    def test_zero_is_unlimited(self):
+        assert SettingsValidateUtility.validate_speed_limit_value("0") is True
+
+    def test_negative(self):
+        assert SettingsValidateUtility.validate_speed_limit_value("-1") is False
+
+    def test_non_numeric(self):
+        assert SettingsValidateUtility.validate_speed_limit_value("fast") is False
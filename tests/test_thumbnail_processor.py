@@ -0,0 +1,149 @@
+"""Tests for services/thumbnail_processor.py."""
+
+import concurrent.futures
+import os
+
+import pytest
+import requests
+from PIL import Image
+
+from services.thumbnail_processor import (
+    ThumbnailProcessor,
+    create_thumbnails,
+    download_thumbnail,
+    save_thumbnail_files,
+)
+from services.thumbnail_store import ThumbnailStore
+from utils.http_utility import HttpUtility
+from utils.image_utility import ImageUtility
+
+THUMBNAIL_SIZE = (117, 66)
+
+
+@pytest.fixture
+def thumbnail_url(tmp_path, monkeypatch, http_server):
+    """A 4:3 thumbnail served over HTTP, with the save directories in a temporary folder."""
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("temp/thumbnails")
+    os.makedirs("history/thumbnails")
+    Image.new("RGB", (480, 360), (20, 40, 60)).save(tmp_path / "hqdefault.jpg")
+    return f"{http_server}hqdefault.jpg"
+
+
+class TestDownloadThumbnail:
+    def test_missing_variant_falls_back(self, thumbnail_url):
+        url, _image_data = download_thumbnail([thumbnail_url.replace("hqdefault", "maxresdefault"), thumbnail_url])
+        assert url == thumbnail_url
+
+    def test_other_http_errors_raised(self, thumbnail_url, monkeypatch):
+        def download_failing(image_url):
+            response = requests.Response()
+            response.status_code = 503
+            raise requests.HTTPError(response=response)
+
+        monkeypatch.setattr(ImageUtility, "download_image_data", download_failing)
+        with pytest.raises(requests.HTTPError):
+            download_thumbnail([thumbnail_url, thumbnail_url])
+
+
+class TestCreateThumbnails:
+    @pytest.fixture
+    def image_data(self, thumbnail_url):
+        return download_thumbnail([thumbnail_url])[1]
+
+    def test_images_in_memory(self, image_data):
+        result = create_thumbnails(image_data, THUMBNAIL_SIZE)
+        normal, hover = (Image.frombytes(*thumbnail) for thumbnail in result["thumbnails"])
+        assert normal.size == hover.size == THUMBNAIL_SIZE
+        assert normal.mode == "RGBA"
+        assert hover.getpixel((58, 33))[0] > normal.getpixel((58, 33))[0]
+        assert os.listdir("temp/thumbnails") == []
+
+    def test_reports_stage_timings(self, image_data):
+        timings = create_thumbnails(image_data, THUMBNAIL_SIZE)["timings"]
+        assert list(timings) == ["decode", "crop", "effects"]
+        assert all(seconds >= 0 for seconds in timings.values())
+
+
+class TestSaveThumbnailFiles:
+    def test_saves_history_and_notification_files(self, thumbnail_url):
+        _url, image_data = download_thumbnail([thumbnail_url])
+        paths = {
+            "notification_thumbnail_image_path": "temp/thumbnails/notify.png",
+            "history_normal_thumbnail_image_path": "history/thumbnails/normal.png",
+            "history_hover_thumbnail_image_path": "history/thumbnails/hover.png",
+        }
+        save_thumbnail_files(image_data, paths)
+        assert Image.open("temp/thumbnails/notify.png").size == (480, 216)
+        # 4:3 thumbnails lose their black bars
+        assert Image.open("history/thumbnails/normal.png").size == (480, 270)
+        assert Image.open("history/thumbnails/hover.png").mode == "RGBA"
+
+
+class TestThumbnailProcessor:
+    @pytest.fixture(autouse=True)
+    def processor(self, monkeypatch):
+        monkeypatch.setattr(ThumbnailProcessor, "max_workers", 1)
+        monkeypatch.setattr(ThumbnailProcessor, "stage_timings", {})
+        monkeypatch.setattr(HttpUtility, "connection_stats", {})
+        yield
+        ThumbnailProcessor.shutdown()
+
+    def test_processes_in_worker(self, thumbnail_url):
+        result = ThumbnailProcessor.submit([thumbnail_url], THUMBNAIL_SIZE).result(timeout=60)
+        assert [thumbnail.size for thumbnail in result["thumbnails"]] == [THUMBNAIL_SIZE, THUMBNAIL_SIZE]
+        assert set(ThumbnailProcessor.get_stage_timings()) == {"download", "decode", "crop", "effects"}
+        # downloaded by the app, only the file is sent to the worker
+        assert result["url"] == thumbnail_url
+        assert HttpUtility.get_connection_stats()["127.0.0.1"]["requests"] == 1
+
+    def test_failure_raised_from_result(self, thumbnail_url):
+        job = ThumbnailProcessor.submit([thumbnail_url.replace("hqdefault", "missing")], THUMBNAIL_SIZE)
+        with pytest.raises(OSError):
+            job.result(timeout=60)
+
+    def test_submit_failure_raised_from_result(self, thumbnail_url, monkeypatch):
+        def run_failing(function, *args):
+            raise RuntimeError("cannot schedule new futures after shutdown")
+
+        monkeypatch.setattr(ThumbnailProcessor, "run", run_failing)
+        job = ThumbnailProcessor.submit([thumbnail_url], THUMBNAIL_SIZE)
+        with pytest.raises(RuntimeError):
+            job.result(timeout=60)
+
+    def test_cancelled_job_cancels_result(self):
+        job = concurrent.futures.Future()
+        result = ThumbnailProcessor.get_result(job)
+        job.cancel()
+        assert result.cancelled()
+
+    def test_bad_job_result_raised_from_result(self):
+        job = concurrent.futures.Future()
+        result = ThumbnailProcessor.get_result(job)
+        job.set_result({"thumbnails": ()})
+        with pytest.raises(KeyError):
+            result.result(timeout=1)
+
+    def test_files_saved_in_background(self, thumbnail_url, monkeypatch):
+        added = []
+        monkeypatch.setattr(ThumbnailStore, "add", added.append)
+        image_data = ThumbnailProcessor.submit([thumbnail_url], THUMBNAIL_SIZE).result(timeout=60)["image_data"]
+        paths = ThumbnailStore.get_paths("dQw4w9WgXcQ")
+        ThumbnailProcessor.save_files(image_data, paths)
+        ThumbnailProcessor.executor.shutdown(wait=True)
+        assert all(os.path.exists(path) for path in paths.values())
+        assert added == [paths]
+        assert sorted(os.listdir("history/thumbnails")) == [
+            "dQw4w9WgXcQ-hover.png",
+            "dQw4w9WgXcQ-normal.png",
+            "dQw4w9WgXcQ-notify.png",
+        ]
+
+    def test_stored_thumbnails_match_new_ones(self, thumbnail_url):
+        result = ThumbnailProcessor.submit([thumbnail_url], THUMBNAIL_SIZE).result(timeout=60)
+        paths = ThumbnailStore.get_paths("dQw4w9WgXcQ")
+        save_thumbnail_files(result["image_data"], paths)
+        stored_result = ThumbnailProcessor.submit_stored(paths, THUMBNAIL_SIZE).result(timeout=60)
+        assert [image.tobytes() for image in stored_result["thumbnails"]] == [
+            image.tobytes() for image in result["thumbnails"]
+        ]
@@ -0,0 +1,109 @@
+"""Tests for services/thumbnail_store.py."""
+
+import os
+import time
+
+import pytest
+
+from services.thumbnail_store import ThumbnailStore
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    """An empty store in a temporary folder."""
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("history/thumbnails")
+    monkeypatch.setattr(ThumbnailStore, "connection", None)
+    ThumbnailStore.initialize(str(tmp_path / "data"), [])
+    yield ThumbnailStore
+    ThumbnailStore.connection.close()
+
+
+def save(paths):
+    for path in paths.values():
+        with open(path, "wb") as file:
+            file.write(b"png")
+
+
+def get_refs(path):
+    row = ThumbnailStore.connection.execute("SELECT refs FROM thumbnails WHERE path = ?", (path,)).fetchone()
+    return None if row is None else row[0]
+
+
+class TestThumbnailStore:
+    def test_paths_by_video_and_variant(self, store):
+        assert store.get_paths("abc") == {
+            "notification_thumbnail_image_path": "history/thumbnails/abc-notify.png",
+            "history_normal_thumbnail_image_path": "history/thumbnails/abc-normal.png",
+            "history_hover_thumbnail_image_path": "history/thumbnails/abc-hover.png",
+        }
+
+    def test_stored_once_saved_and_indexed(self, store):
+        paths = store.get_paths("abc")
+        assert not store.is_stored(paths)
+        save(paths)
+        assert not store.is_stored(paths)
+        store.add(paths)
+        assert store.is_stored(paths)
+
+    def test_deleted_file_not_stored(self, store):
+        paths = store.get_paths("abc")
+        save(paths)
+        store.add(paths)
+        os.remove(paths["history_hover_thumbnail_image_path"])
+        assert not store.is_stored(paths)
+
+    def test_references_counted(self, store):
+        paths = store.get_paths("abc")
+        store.add(paths)
+        normal_path = paths["history_normal_thumbnail_image_path"]
+        store.add_reference(normal_path)
+        store.add_reference(normal_path)
+        assert get_refs(normal_path) == 2
+        store.release_reference(normal_path)
+        assert get_refs(normal_path) == 1
+
+
+class TestCollectGarbage:
+    def test_deletes_unreferenced_after_ttl(self, store, monkeypatch):
+        paths = store.get_paths("abc")
+        save(paths)
+        store.add(paths)
+        store.add_reference(paths["history_normal_thumbnail_image_path"])
+        assert store.collect_garbage() == 0
+
+        monkeypatch.setattr(time, "time", lambda: 10**12)
+        assert store.collect_garbage() == 2
+        assert os.listdir("history/thumbnails") == ["abc-normal.png"]
+        assert get_refs(paths["history_hover_thumbnail_image_path"]) is None
+
+    def test_released_files_collected(self, store, monkeypatch):
+        paths = store.get_paths("abc")
+        save(paths)
+        store.add(paths)
+        for path in paths.values():
+            store.add_reference(path)
+            store.release_reference(path)
+        monkeypatch.setattr(time, "time", lambda: 10**12)
+        assert store.collect_garbage() == 3
+        assert os.listdir("history/thumbnails") == []
+
+
+class TestIndexExistingFiles:
+    def test_indexes_history_files_and_deletes_the_rest(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        os.makedirs("history/thumbnails")
+        for file_name in ("old-normal.png", "old-hover.png", "orphan.png", "this directory is necessary"):
+            (tmp_path / "history/thumbnails" / file_name).write_bytes(b"png")
+        referenced_paths = ["history/thumbnails/old-normal.png", "history/thumbnails/old-hover.png"] * 2
+
+        ThumbnailStore.initialize(str(tmp_path / "data"), referenced_paths)
+        try:
+            assert sorted(os.listdir("history/thumbnails")) == [
+                "old-hover.png",
+                "old-normal.png",
+                "this directory is necessary",
+            ]
+            assert get_refs("history/thumbnails/old-normal.png") == 2
+        finally:
+            ThumbnailStore.connection.close()
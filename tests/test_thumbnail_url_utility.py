@@ -0,0 +1,56 @@
+"""Tests for utils/thumbnail_url_utility.py."""
+
+from utils.thumbnail_url_utility import ThumbnailUrlUtility
+
+BASE_URL = "https://i.ytimg.com/vi/dQw4w9WgXcQ/"
+
+
+class TestGetVariant:
+    def test_known_variant(self):
+        assert ThumbnailUrlUtility.get_variant(f"{BASE_URL}sddefault.jpg?sqp=abc&rs=def") == "sddefault"
+
+    def test_unknown_variant(self):
+        assert ThumbnailUrlUtility.get_variant(f"{BASE_URL}hq720.jpg") is None
+
+    def test_other_url(self):
+        assert ThumbnailUrlUtility.get_variant("https://example.com/maxresdefault.jpg") is None
+
+
+class TestChooseVariant:
+    def test_smallest_wide_enough(self):
+        assert ThumbnailUrlUtility.choose_variant(117) == "default"
+        assert ThumbnailUrlUtility.choose_variant(180) == "mqdefault"
+        assert ThumbnailUrlUtility.choose_variant(364) == "hqdefault"
+        assert ThumbnailUrlUtility.choose_variant(480) == "hqdefault"
+
+    def test_largest_when_none_is_wide_enough(self):
+        assert ThumbnailUrlUtility.choose_variant(4000) == "maxresdefault"
+
+
+class TestGetVariantUrls:
+    def test_chosen_variant_then_larger_then_original(self):
+        original_url = f"{BASE_URL}maxresdefault.jpg?sqp=abc"
+        assert ThumbnailUrlUtility.get_variant_urls(original_url, 546) == [
+            f"{BASE_URL}sddefault.jpg",
+            f"{BASE_URL}maxresdefault.jpg",
+            original_url,
+        ]
+
+    def test_original_not_repeated(self):
+        original_url = f"{BASE_URL}maxresdefault.jpg"
+        assert ThumbnailUrlUtility.get_variant_urls(original_url, 1000) == [original_url]
+
+    def test_cached_variant_skips_missing_ones(self):
+        urls = ThumbnailUrlUtility.get_variant_urls(f"{BASE_URL}hqdefault.jpg", 546, cached_variant="maxresdefault")
+        assert urls[0] == f"{BASE_URL}maxresdefault.jpg"
+
+    def test_cached_variant_too_small_ignored(self):
+        urls = ThumbnailUrlUtility.get_variant_urls(f"{BASE_URL}hqdefault.jpg", 546, cached_variant="mqdefault")
+        assert urls[0] == f"{BASE_URL}sddefault.jpg"
+
+    def test_webp_kept(self):
+        urls = ThumbnailUrlUtility.get_variant_urls("https://i.ytimg.com/vi_webp/dQw4w9WgXcQ/maxresdefault.webp", 300)
+        assert urls[0] == "https://i.ytimg.com/vi_webp/dQw4w9WgXcQ/mqdefault.webp"
+
+    def test_other_url_kept(self):
+        assert ThumbnailUrlUtility.get_variant_urls("file:///tmp/hqdefault.jpg", 300) == ["file:///tmp/hqdefault.jpg"]
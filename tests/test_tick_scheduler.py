@@ -0,0 +1,101 @@
+"""Tests for services/tick_scheduler.py."""
+
+import pytest
+
+from services import tick_scheduler
+from services.tick_scheduler import TickScheduler
+from settings import GeneralSettings
+
+
+class FakeRoot:
+    def __init__(self):
+        self.scheduled = []
+
+    def after(self, delay, callback):
+        self.scheduled.append((delay, callback))
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def root(monkeypatch):
+    monkeypatch.setattr(GeneralSettings, "settings", {"update_delay": 0.5})
+    monkeypatch.setattr(TickScheduler, "callbacks", {})
+    monkeypatch.setattr(TickScheduler, "next_runs", {})
+    monkeypatch.setattr(TickScheduler, "pending_calls", [])
+    root = FakeRoot()
+    TickScheduler.initialize(root)
+    return root
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(tick_scheduler.time, "monotonic", clock.monotonic)
+    return clock
+
+
+class TestTickScheduler:
+    def test_schedules_first_tick(self, root):
+        assert root.scheduled == [(100, TickScheduler.tick)]
+
+    def test_call_soon_runs_once_in_order(self):
+        calls = []
+        TickScheduler.call_soon(lambda: calls.append(1))
+        TickScheduler.call_soon(lambda: calls.append(2))
+        TickScheduler.tick()
+        TickScheduler.tick()
+        assert calls == [1, 2]
+
+    def test_tick_calls_callbacks_and_reschedules(self, root):
+        calls = []
+        TickScheduler.add_callback(lambda: calls.append(1))
+        TickScheduler.tick()
+        assert calls == [1]
+        assert len(root.scheduled) == 2
+
+    def test_removed_callback_not_called(self):
+        calls = []
+
+        def callback():
+            calls.append(1)
+
+        TickScheduler.add_callback(callback)
+        TickScheduler.remove_callback(callback)
+        TickScheduler.tick()
+        assert calls == []
+
+    def test_failing_callback_keeps_ticking(self, root):
+        calls = []
+
+        def failing():
+            raise RuntimeError("failed")
+
+        TickScheduler.add_callback(failing)
+        TickScheduler.add_callback(lambda: calls.append(1))
+        TickScheduler.tick()
+        assert calls == [1]
+        assert len(root.scheduled) == 2
+
+    def test_callback_interval(self, clock):
+        calls = []
+        TickScheduler.add_callback(lambda: calls.append(clock.now), interval=0.25)
+        for _ in range(6):
+            TickScheduler.tick()
+            clock.now += 0.1
+        assert calls == pytest.approx([100.0, 100.3])
+
+    def test_default_interval_follows_setting(self, clock):
+        calls = []
+        TickScheduler.add_callback(lambda: calls.append(clock.now))
+        GeneralSettings.settings["update_delay"] = 0.25
+        for _ in range(5):
+            TickScheduler.tick()
+            clock.now += 0.125
+        assert calls == pytest.approx([100.0, 100.25, 100.5])
@@ -0,0 +1,189 @@
+"""Tests for services/video_record.py."""
+
+import concurrent.futures
+
+import pytest
+
+from services.load_manager import LoadManager
+from services.queue_scheduler import QueueScheduler
+from services.thumbnail_processor import ThumbnailProcessor
+from services.thumbnail_store import ThumbnailStore
+from services.video_count_tracker import VideoCountTracker
+from services.video_record import VideoRecord
+from settings import AppearanceSettings, GeneralSettings
+
+DOWNLOAD_TYPES = [
+    {"type": "video", "reso": "1080p", "size": 300 * 1024 * 1024},
+    {"type": "video", "reso": "720p", "size": 200 * 1024 * 1024},
+    {"type": "video", "reso": "360p", "size": 50 * 1024 * 1024},
+    {"type": "audio", "bitrate": "128kbps", "size": 5 * 1024 * 1024},
+]
+
+
+class FakeView:
+    def __init__(self):
+        self.states = []
+        self.download_options = []
+        self.record = None
+
+    def show_record_state(self):
+        self.states.append(self.record.load_state)
+
+    def show_download_option(self):
+        self.download_options.append(self.record.download_option)
+
+
+@pytest.fixture(autouse=True)
+def trackers(monkeypatch):
+    monkeypatch.setattr(VideoCountTracker, "status_call_back_function", lambda *counts: None)
+    monkeypatch.setattr(VideoCountTracker, "total_added_video_count", 0)
+    monkeypatch.setattr(LoadManager, "status_change_callback", lambda: None)
+
+
+def make_record(**kwargs):
+    record = VideoRecord("https://www.youtube.com/watch?v=dQw4w9WgXcQ", **kwargs)
+    record.support_download_types = DOWNLOAD_TYPES
+    return record
+
+
+class TestVideoRecord:
+    def test_has_no_instance_dict(self):
+        assert not hasattr(make_record(), "__dict__")
+
+    def test_counts_added_videos(self):
+        record = make_record()
+        assert VideoCountTracker.total_added_video_count == 1
+        record.remove()
+        assert VideoCountTracker.total_added_video_count == 0
+        assert record.load_state == "removed"
+
+    def test_state_reported_to_playlist_and_view(self):
+        states = []
+        record = make_record(status_callback=lambda video, state: states.append((video, state)))
+        view = FakeView()
+        view.record = record
+        record.view = view
+        record.set_state("loading")
+        assert states == [(record, "loading")]
+        assert view.states == ["loading"]
+
+    def test_set_data(self):
+        record = make_record()
+        record.set_data(
+            {
+                "title": "Title",
+                "channel": "Channel",
+                "length": 212,
+                "channel_url": "https://www.youtube.com/@channel",
+                "thumbnail_url": "https://i.ytimg.com/vi/dQw4w9WgXcQ/hqdefault.jpg",
+                "support_download_types": DOWNLOAD_TYPES,
+            }
+        )
+        assert record.get_cache_data()["title"] == "Title"
+        assert record.video_stream_data is None
+        # cached before the variant was
+        assert record.thumbnail_variant is None
+
+    def test_thumbnail_width_fits_largest_consumer(self, monkeypatch):
+        monkeypatch.setattr(AppearanceSettings, "get_scale", lambda _unit: 1.5)
+        assert VideoRecord.get_thumbnail_width() == int(max(VideoRecord.thumbnail_display_widths) * 1.5)
+
+    def test_completed_selects_first_option(self):
+        record = make_record()
+        record.set_loading_completed()
+        assert record.load_state == "loaded"
+        assert record.download_quality == "1080p"
+        assert record.download_type == "Video"
+        assert record.selected_download_type_info == DOWNLOAD_TYPES[0]
+
+    def test_completed_ignored_after_remove(self):
+        record = make_record()
+        record.remove()
+        record.set_loading_completed()
+        assert record.load_state == "removed"
+
+
+class TestSelectDownloadResolution:
+    def test_available_resolution(self):
+        record = make_record()
+        record.select_download_resolution("720p")
+        assert record.selected_download_type_info == DOWNLOAD_TYPES[1]
+
+    def test_next_lower_resolution(self):
+        record = make_record()
+        record.select_download_resolution("480p")
+        assert record.download_quality == "360p"
+
+    def test_audio_only(self):
+        record = make_record()
+        record.select_download_resolution("Audio Only")
+        assert record.download_type == "Audio"
+        assert record.selected_download_type_info == DOWNLOAD_TYPES[3]
+
+    def test_view_follows_selection(self):
+        record = make_record()
+        view = FakeView()
+        view.record = record
+        record.view = view
+        record.select_download_resolution("360p")
+        assert view.download_options == [record.download_option]
+
+
+class TestCreateThumbnails:
+    @pytest.fixture
+    def record(self, monkeypatch):
+        monkeypatch.setattr(AppearanceSettings, "get_scale", lambda _unit: 1)
+        monkeypatch.setattr(VideoRecord, "thumbnail_timeout", 0.01)
+        monkeypatch.setattr(ThumbnailStore, "is_stored", lambda paths: False)
+        record = make_record()
+        record.thumbnail_url = "https://i.ytimg.com/vi/dQw4w9WgXcQ/hqdefault.jpg"
+        record.thumbnail_variant = None
+        return record
+
+    def test_lost_job_falls_back_to_default(self, record, monkeypatch):
+        monkeypatch.setattr(ThumbnailProcessor, "submit", lambda urls, size: concurrent.futures.Future())
+        record.create_thumbnails()
+        assert record.thumbnail_images is None
+        assert record.history_normal_thumbnail_image_path == ""
+
+    def test_cancelled_job_falls_back_to_default(self, record, monkeypatch):
+        def submit_cancelled(urls, size):
+            job = concurrent.futures.Future()
+            job.cancel()
+            return job
+
+        monkeypatch.setattr(ThumbnailProcessor, "submit", submit_cancelled)
+        record.create_thumbnails()
+        assert record.thumbnail_images is None
+
+
+class TestLoadingFailed:
+    @pytest.fixture
+    def scheduler(self, monkeypatch):
+        started = []
+        scheduler = QueueScheduler(name="load", get_max_active=lambda: 1, start_item=started.append)
+        monkeypatch.setattr(LoadManager, "scheduler", scheduler)
+        monkeypatch.setattr(LoadManager, "_signal", lambda: None)
+        monkeypatch.setitem(GeneralSettings.settings, "reload_automatically", True)
+        monkeypatch.setattr("services.video_record.time.sleep", lambda seconds: None)
+        return scheduler
+
+    def test_reload_queued_after_slot_given_up(self, scheduler):
+        busy = make_record()
+        scheduler.register(busy)
+        scheduler.schedule()
+        # the record gave up its slot while waiting for the thumbnail
+        record = make_record()
+        record.set_loading_failed()
+        assert scheduler.get_active_items() == [busy]
+        assert scheduler.get_queued_count() == 1
+        assert record.load_state == "waiting"
+        assert record.automatically_reload_count == 1
+
+    def test_reload_frees_own_slot(self, scheduler):
+        record = make_record()
+        scheduler.register(record)
+        scheduler.schedule()
+        record.set_loading_failed()
+        assert scheduler.get_active_count() == 0
+        assert scheduler.get_queued_count() == 1
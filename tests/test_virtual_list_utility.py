@@ -0,0 +1,40 @@
+"""Tests for utils/virtual_list_utility.py."""
+
+from utils.virtual_list_utility import VirtualListUtility
+
+
+class TestGetLineHeights:
+    def test_one_column(self):
+        assert VirtualListUtility.get_line_heights([70, 86, 70], spacing=4) == [74, 90, 74]
+
+    def test_tallest_row_of_line(self):
+        assert VirtualListUtility.get_line_heights([100, 120, 100, 90, 95], columns=2) == [120, 100, 95]
+
+    def test_empty(self):
+        assert VirtualListUtility.get_line_heights([], columns=3) == []
+
+
+class TestGetVisibleLines:
+    def test_top_of_list(self):
+        assert VirtualListUtility.get_visible_lines([100] * 10, 0, 250) == (0, 3, 0, 700)
+
+    def test_middle_of_list(self):
+        assert VirtualListUtility.get_visible_lines([100] * 10, 350, 550) == (3, 6, 300, 400)
+
+    def test_line_ending_at_view_top_hidden(self):
+        assert VirtualListUtility.get_visible_lines([100] * 10, 300, 400) == (3, 4, 300, 600)
+
+    def test_bottom_of_list(self):
+        assert VirtualListUtility.get_visible_lines([100] * 10, 850, 1200) == (8, 10, 800, 0)
+
+    def test_view_below_list(self):
+        assert VirtualListUtility.get_visible_lines([100] * 3, 500, 700) == (3, 3, 300, 0)
+
+    def test_view_above_list(self):
+        assert VirtualListUtility.get_visible_lines([100] * 3, -200, -100) == (0, 0, 0, 300)
+
+    def test_mixed_heights(self):
+        assert VirtualListUtility.get_visible_lines([50, 200, 50, 50], 100, 260) == (1, 3, 50, 50)
+
+    def test_empty(self):
+        assert VirtualListUtility.get_visible_lines([], 0, 500) == (0, 0, 0, 0)
@@ -4,7 +4,11 @@ from .date_time_utility import DateTimeUtility as DateTimeUtility
 from .download_info_utility import DownloadInfoUtility as DownloadInfoUtility
 from .file_utility import FileUtility as FileUtility
 from .gui_utils import GuiUtils as GuiUtils
+from .http_utility import HttpUtility as HttpUtility
 from .image_utility import ImageUtility as ImageUtility
 from .json_utility import JsonUtility as JsonUtility
+from .merge_plan_utility import MergePlanUtility as MergePlanUtility
 from .settings_validate_utility import SettingsValidateUtility as SettingsValidateUtility
+from .thumbnail_url_utility import ThumbnailUrlUtility as ThumbnailUrlUtility
 from .value_convert_utility import ValueConvertUtility as ValueConvertUtility
+from .virtual_list_utility import VirtualListUtility as VirtualListUtility
@@ -1,7 +1,6 @@
 from typing import cast
 
-import requests
-
+from .http_utility import HttpUtility
 from .json_utility import JsonUtility
 from .logger import get_logger
 
@@ -22,7 +21,7 @@ class DataRetrieveUtility:
         """
         contributors = []
         try:
-            data = requests.get(DataRetrieveUtility.CONTRIBUTORS_TEXT_URL, timeout=5).text
+            data = HttpUtility.get(DataRetrieveUtility.CONTRIBUTORS_TEXT_URL).text
             for contributor_data in data.split("\n"):
                 try:
                     profile_url, username = contributor_data.split("@%@")
@@ -49,7 +48,7 @@ class DataRetrieveUtility:
             string: The latest version number.
         """
         try:
-            data = requests.get(DataRetrieveUtility.VERSION_FILE_URL, timeout=5).text.strip()
+            data = HttpUtility.get(DataRetrieveUtility.VERSION_FILE_URL).text.strip()
             # Extract the version number from the string "VERSION = '2.0.2'"
             # Split at "=" and remove extra characters like spaces and quotes
             version = data.split("=")[1].strip().strip("'")
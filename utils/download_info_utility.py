@@ -134,6 +134,33 @@ class DownloadInfoUtility:
 
         return supported_download_types
 
+    @staticmethod
+    def find_video_stream(video_streams: pytubefix.StreamQuery, download_type_info: dict[str, Any]) -> pytubefix.Stream:
+        """
+        Find the video stream of a download type, from ``get_supported_download_types``.
+
+        Streams fetched again, e.g. with another client, may not have the itag the download
+        type was made with, a stream of the same resolution and kind is taken then.
+
+        Args:
+            video_streams (pytubefix.StreamQuery): video streams.
+            download_type_info (dict): The download type of a video.
+
+        Returns:
+            pytubefix.Stream: The stream.
+
+        Raises:
+            LookupError: If there is no such stream.
+        """
+        stream = video_streams.get_by_itag(download_type_info["itag"])
+        if stream is None:
+            stream = video_streams.filter(
+                type="video", res=download_type_info["reso"], progressive=download_type_info["inbuilt_audio"]
+            ).first()
+        if stream is None:
+            raise LookupError(f"no {download_type_info['reso']} video stream")
+        return stream
+
     @staticmethod
     def generate_download_options(download_types: list[dict[str, Any]]) -> list[str]:
         """
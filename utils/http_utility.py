@@ -0,0 +1,144 @@
+import threading
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.retry import Retry
+
+
+class _CountingPoolMixin:
+    """Counts the requests sent and connections opened to the host of a connection pool."""
+
+    host: str
+
+    def _new_conn(self) -> Any:
+        HttpUtility.count(self.host, "connections")
+        return super()._new_conn()
+
+    def urlopen(self, *args: Any, **kwargs: Any) -> Any:
+        HttpUtility.count(self.host, "requests")
+        return super().urlopen(*args, **kwargs)
+
+
+class _CountingHTTPConnectionPool(_CountingPoolMixin, HTTPConnectionPool):
+    pass
+
+
+class _CountingHTTPSConnectionPool(_CountingPoolMixin, HTTPSConnectionPool):
+    pass
+
+
+class _PooledAdapter(HTTPAdapter):
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _CountingHTTPConnectionPool,
+            "https": _CountingHTTPSConnectionPool,
+        }
+
+
+class HttpUtility:
+    """
+    Shared HTTP client for the small fetches of the app: thumbnails, profile images and the
+    version and contributors files. Video streams are downloaded by the AsyncDownloadEngine.
+
+    One ``requests`` session keeps the connections to each host alive, so loading a playlist
+    reuses a few connections to the image CDN instead of opening one per thumbnail. At most
+    ``max_connections_per_host`` requests run at once per host, more wait for a free
+    connection. Failed connections and busy or failing servers are retried with backoff.
+
+    The requests sent and connections opened are counted per host, see ``get_connection_stats``.
+    """
+
+    # (connect, read) seconds
+    timeout: tuple[float, float] = (5, 15)
+    max_connections_per_host: int = 6
+    # Hosts whose connections are kept, the least recently used host is dropped first
+    max_hosts: int = 10
+    retries: Retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=("GET", "HEAD"),
+        raise_on_status=False,
+    )
+
+    session: requests.Session | None = None
+    # host: {"requests": int, "connections": int}
+    connection_stats: dict[str, dict[str, int]] = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def get_session() -> requests.Session:
+        with HttpUtility._lock:
+            if HttpUtility.session is None:
+                adapter = _PooledAdapter(
+                    pool_connections=HttpUtility.max_hosts,
+                    pool_maxsize=HttpUtility.max_connections_per_host,
+                    pool_block=True,
+                    max_retries=HttpUtility.retries,
+                )
+                session = requests.Session()
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                HttpUtility.session = session
+            return HttpUtility.session
+
+    @staticmethod
+    def get(url: str, **kwargs: Any) -> requests.Response:
+        """
+        Send a GET request through the shared session, safe to call from any thread.
+
+        Args:
+            url (str): The url.
+            **kwargs: Passed on to ``requests.Session.get``, e.g. ``timeout``.
+
+        Returns:
+            requests.Response: The response, with its content read.
+
+        Raises:
+            requests.RequestException: If the request failed or the status is an error,
+                ``requests.HTTPError`` then.
+        """
+        kwargs.setdefault("timeout", HttpUtility.timeout)
+        response = HttpUtility.get_session().get(url, **kwargs)
+        response.raise_for_status()
+        return response
+
+    @staticmethod
+    def count(host: str, name: str, count: int = 1) -> None:
+        with HttpUtility._lock:
+            host_stats = HttpUtility.connection_stats.setdefault(host, {"requests": 0, "connections": 0})
+            host_stats[name] += count
+
+    @staticmethod
+    def get_connection_stats(reset: bool = False) -> dict[str, dict[str, int]]:
+        """
+        Get how often the connections to each host were reused.
+
+        Args:
+            reset (bool): Start counting again from zero.
+
+        Returns:
+            dict: ``{host: {"requests": int, "connections": int, "reused": int}}``, the
+                requests sent, including retries, the connections opened and the requests
+                sent on a connection opened before.
+        """
+        with HttpUtility._lock:
+            connection_stats = {
+                host: {**host_stats, "reused": max(host_stats["requests"] - host_stats["connections"], 0)}
+                for host, host_stats in HttpUtility.connection_stats.items()
+            }
+            if reset:
+                HttpUtility.connection_stats = {}
+        return connection_stats
+
+    @staticmethod
+    def close() -> None:
+        """Close the kept connections."""
+        with HttpUtility._lock:
+            session = HttpUtility.session
+            HttpUtility.session = None
+        if session is not None:
+            session.close()
@@ -0,0 +1,71 @@
+from typing import Literal
+
+
+class MergePlanUtility:
+    """
+    Decide how ffmpeg should merge a video-only and an audio-only stream.
+
+    Streams are copied whenever the output container can hold both codecs, so merging
+    only costs disk I/O. Audio is re-encoded to AAC only when the codecs are unknown.
+    """
+
+    MP4_VIDEO_CODECS = ("avc1", "av01", "hev1", "hvc1")
+    MP4_AUDIO_CODECS = ("mp4a",)
+    WEBM_VIDEO_CODECS = ("vp8", "vp9", "vp09", "av01")
+    WEBM_AUDIO_CODECS = ("opus", "vorbis")
+
+    @staticmethod
+    def get_codec_family(codec: str | None) -> str:
+        """
+        Get the codec family from a codec string.
+
+        Args:
+            codec (str | None): The codec string, e.g. "avc1.640028" or "opus".
+
+        Returns:
+            str: The lower case family, e.g. "avc1", or an empty string if the codec is unknown.
+        """
+        if not codec:
+            return ""
+        return codec.strip().split(".")[0].lower()
+
+    @staticmethod
+    def get_merge_plan(video_codec: str | None, audio_codec: str | None) -> dict[str, str]:
+        """
+        Pick the output container and audio handling for merging two streams.
+
+        Args:
+            video_codec (str | None): The codec of the video-only stream.
+            audio_codec (str | None): The codec of the audio-only stream.
+
+        Returns:
+            dict: ``{"container": "mp4" | "webm" | "mkv", "audio_codec": "copy" | "aac"}``.
+        """
+        video_family = MergePlanUtility.get_codec_family(video_codec)
+        audio_family = MergePlanUtility.get_codec_family(audio_codec)
+
+        container: Literal["mp4", "webm", "mkv"]
+        if not video_family or not audio_family:
+            # Nothing to go on, keep the old behaviour that always produces a playable mp4
+            return {"container": "mp4", "audio_codec": "aac"}
+        if video_family in MergePlanUtility.MP4_VIDEO_CODECS and audio_family in MergePlanUtility.MP4_AUDIO_CODECS:
+            container = "mp4"
+        elif video_family in MergePlanUtility.WEBM_VIDEO_CODECS and audio_family in MergePlanUtility.WEBM_AUDIO_CODECS:
+            container = "webm"
+        else:
+            # Matroska takes any codec pair without re-encoding
+            container = "mkv"
+        return {"container": container, "audio_codec": "copy"}
+
+    @staticmethod
+    def get_codec_arguments(merge_plan: dict[str, str]) -> list[str]:
+        """
+        Get the ffmpeg codec arguments for a merge plan.
+
+        Args:
+            merge_plan (dict): A plan returned by ``get_merge_plan``.
+
+        Returns:
+            list[str]: The ``-c:v`` and ``-c:a`` arguments.
+        """
+        return ["-c:v", "copy", "-c:a", merge_plan["audio_codec"]]
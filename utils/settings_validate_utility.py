@@ -126,3 +126,19 @@ class SettingsValidateUtility:
         max_size = 11 * 1024 * 1024  # 11MB in bytes
 
         return min_size <= size_in_bytes <= max_size
+
+    @staticmethod
+    def validate_speed_limit_value(value: str) -> bool:
+        """
+        Validate a download speed limit entered by the user.
+
+        Args:
+            value (str): The limit in KB/s, 0 means unlimited.
+
+        Returns:
+            bool: True if the value is a whole number of at least 0, False otherwise.
+        """
+        try:
+            return int(value) >= 0
+        except ValueError:
+            return False
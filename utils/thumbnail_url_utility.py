@@ -0,0 +1,87 @@
+import re
+
+# https://i.ytimg.com/vi/<video id>/<variant>.jpg, optionally with a signature query
+_THUMBNAIL_URL_PATTERN = re.compile(
+    r"^(https?://i\d?\.ytimg\.com/vi(?:_webp)?/[^/]+/)([a-z0-9_]+)(\.jpg|\.webp)(\?.*)?$"
+)
+
+
+class ThumbnailUrlUtility:
+    """
+    Thumbnail variants of YouTube videos.
+
+    YouTube serves every thumbnail in a few fixed sizes under the same path, only the file
+    name differs. ``sddefault`` and ``maxresdefault`` are missing for some videos, the
+    smaller ones always exist.
+    """
+
+    # Width of each variant, smallest first
+    variants: dict[str, int] = {
+        "default": 120,
+        "mqdefault": 320,
+        "hqdefault": 480,
+        "sddefault": 640,
+        "maxresdefault": 1280,
+    }
+
+    @staticmethod
+    def get_variant(thumbnail_url: str) -> str | None:
+        """
+        Get the variant of a thumbnail url.
+
+        Returns:
+            str | None: The variant name, e.g. "hqdefault", or None for other urls.
+        """
+        match = _THUMBNAIL_URL_PATTERN.match(thumbnail_url)
+        if match is None or match.group(2) not in ThumbnailUrlUtility.variants:
+            return None
+        return match.group(2)
+
+    @staticmethod
+    def get_variant_url(thumbnail_url: str, variant: str) -> str:
+        """
+        Get the url of another variant of a thumbnail.
+
+        The signature query only holds for the variant it was made for and is dropped.
+        """
+        match = _THUMBNAIL_URL_PATTERN.match(thumbnail_url)
+        return f"{match.group(1)}{variant}{match.group(3)}"
+
+    @staticmethod
+    def choose_variant(required_width: int) -> str:
+        """
+        Get the smallest variant at least as wide as needed, or the largest one if none is.
+        """
+        for variant, width in ThumbnailUrlUtility.variants.items():
+            if width >= required_width:
+                return variant
+        return variant
+
+    @staticmethod
+    def get_variant_urls(thumbnail_url: str, required_width: int, cached_variant: str | None = None) -> list[str]:
+        """
+        Get the urls to try, in order, to fetch a thumbnail at least as wide as needed.
+
+        Args:
+            thumbnail_url (str): The thumbnail url of the video.
+            required_width (int): The width of the largest place the thumbnail is shown.
+            cached_variant (str | None): The variant fetched for the video before, tried first
+                if it is wide enough, so a missing variant is not asked for again.
+
+        Returns:
+            list[str]: The chosen variant and the larger ones in case it is missing, then the
+                original url. Only the original url if it is not a YouTube thumbnail.
+        """
+        if _THUMBNAIL_URL_PATTERN.match(thumbnail_url) is None:
+            return [thumbnail_url]
+
+        variant_names = list(ThumbnailUrlUtility.variants)
+        first_variant = ThumbnailUrlUtility.choose_variant(required_width)
+        candidates = variant_names[variant_names.index(first_variant) :]
+        if cached_variant in candidates:
+            candidates = candidates[candidates.index(cached_variant) :]
+
+        urls = [ThumbnailUrlUtility.get_variant_url(thumbnail_url, variant) for variant in candidates]
+        if thumbnail_url not in urls:
+            urls.append(thumbnail_url)
+        return urls
@@ -0,0 +1,61 @@
+from collections.abc import Sequence
+
+
+class VirtualListUtility:
+    """
+    Layout math of a virtualized list.
+
+    Rows are laid out in lines of ``columns`` rows. Only the lines overlapping the viewport
+    are shown, the lines above and below are replaced by spacers of the same height so the
+    scroll position and the scrollbar stay the same as with every row shown.
+    """
+
+    @staticmethod
+    def get_line_heights(row_heights: Sequence[int], columns: int = 1, spacing: int = 0) -> list[int]:
+        """
+        Get the height of each line of rows.
+
+        Args:
+            row_heights (Sequence[int]): The height of every row, in list order.
+            columns (int): The number of rows in a line.
+            spacing (int): The space taken around each line, e.g. the padding above and below.
+
+        Returns:
+            list[int]: The height of each line, its tallest row plus the spacing.
+        """
+        columns = max(columns, 1)
+        return [max(row_heights[index : index + columns]) + spacing for index in range(0, len(row_heights), columns)]
+
+    @staticmethod
+    def get_visible_lines(
+        line_heights: Sequence[int], view_top: float, view_bottom: float
+    ) -> tuple[int, int, int, int]:
+        """
+        Get the lines overlapping a part of the list.
+
+        Args:
+            line_heights (Sequence[int]): The height of each line, from ``get_line_heights``.
+            view_top (float): The top of the visible part, in pixels from the top of the list.
+            view_bottom (float): The bottom of the visible part.
+
+        Returns:
+            tuple: ``(first, last, space_above, space_below)``, the lines ``first`` up to but
+                not including ``last`` are visible, ``space_above`` and ``space_below`` are the
+                heights of the lines before and after them.
+        """
+        total_height = sum(line_heights)
+        first = len(line_heights)
+        last = len(line_heights)
+        space_above = total_height
+        offset = 0
+        for index, height in enumerate(line_heights):
+            if first == len(line_heights) and offset + height > view_top:
+                first = index
+                space_above = offset
+            if offset >= view_bottom:
+                last = index
+                break
+            offset += height
+        last = max(last, first)
+        space_below = total_height - space_above - sum(line_heights[first:last])
+        return first, last, space_above, space_below
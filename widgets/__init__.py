@@ -1,5 +1,5 @@
 from .components import AccentColorButton, ContributorProfileWidget
-from .core_widgets import AlertWindow, ContextMenu, SettingPanel, TrayMenu
+from .core_widgets import AlertWindow, ContextMenu, SettingPanel, TrayMenu, VirtualList
 from .history_widgets import HistoryPanel, HistoryVideo
 from .play_list import AddedPlayList, DownloadedPlayList, DownloadingPlayList
 from .setting_panels import AboutPanel, AppearancePanel, DownloadsPanel, GeneralPanel, NavigationPanel, NetworkPanel
@@ -12,6 +12,7 @@ __all__ = [
     "ContextMenu",
     "SettingPanel",
     "TrayMenu",
+    "VirtualList",
     "HistoryPanel",
     "HistoryVideo",
     "AddedPlayList",
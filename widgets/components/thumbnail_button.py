@@ -1,11 +1,8 @@
-import threading
-import time
 import tkinter as tk
 from tkinter import PhotoImage
 from typing import Any, Literal
 
 from services import LoadingIndicateManager
-from settings import GeneralSettings
 
 
 class ThumbnailButton(tk.Button):
@@ -23,8 +20,6 @@ class ThumbnailButton(tk.Button):
         from widgets.video.added_video import AddedVideo
 
         self.master: AddedVideo = master
-        self.loading_animation_state: Literal["enabled", "disabled", None] = None
-        self.loading_animation_running: bool = False
         self.thumbnails = thumbnails
 
         super().__init__(
@@ -39,28 +34,19 @@ class ThumbnailButton(tk.Button):
             command=command,
         )
 
-    def run_loading_animation_thread(self):
-        self.configure(image="")
-        self.loading_animation_running = True
-        if self.loading_animation_state != "disabled":
-            self.loading_animation_state = "enabled"
-            while self.master.load_state != "removed":
-                self.configure(text="." * LoadingIndicateManager.dots_count)
-                time.sleep(GeneralSettings.settings["update_delay"])
-                if self.loading_animation_state == "disabled" and self.master.load_state != "removed":
-                    break
-        self.loading_animation_running = False
-
     def run_loading_animation(self):
-        self.loading_animation_state = "enabled"
-        loading_animation_thread = threading.Thread(target=self.run_loading_animation_thread)
-        loading_animation_thread.daemon = True
-        loading_animation_thread.start()
+        """Show the loading dots until the loading is done, ticked by the LoadingIndicateManager."""
+        LoadingIndicateManager.register_widget(self)
+
+    def update_loading_animation(self, dots_count: int):
+        # A removed video stops its animation
+        if self.master.load_state == "removed":
+            LoadingIndicateManager.unregister_widget(self)
+            return
+        self.configure(text="." * dots_count, image="")
 
     def stop_loading_animation(self):
-        self.loading_animation_state = "disabled"
-        while self.loading_animation_running:
-            time.sleep(GeneralSettings.settings["update_delay"])
+        LoadingIndicateManager.unregister_widget(self)
 
     def configure_thumbnail(self, thumbnails: list[PhotoImage]):
         self.stop_loading_animation()
@@ -81,8 +67,6 @@ class ThumbnailButton(tk.Button):
         """Destructor"""
         self.stop_loading_animation()
 
-        del self.loading_animation_state
-        del self.loading_animation_running
         del self.thumbnails
 
         self.destroy()
@@ -2,5 +2,6 @@ from .alert_window import AlertWindow
 from .context_menu import ContextMenu
 from .setting_panel import SettingPanel
 from .tray_menu import TrayMenu
+from .virtual_list import VirtualList
 
-__all__ = ["AlertWindow", "ContextMenu", "SettingPanel", "TrayMenu"]
+__all__ = ["AlertWindow", "ContextMenu", "SettingPanel", "TrayMenu", "VirtualList"]
@@ -54,6 +54,10 @@ class ContextMenu(ctk.CTkFrame):
         for option_button in self.option_buttons:
             option_button.bind(event, event_command)
 
+    def set_option_state(self, option_text: str, state: str) -> None:
+        """Enable ("normal") or disable ("disabled") an option, by its language key."""
+        self.option_buttons[self.options_texts.index(option_text)].configure(state=state)
+
     def set_open(self):
         self.is_open = True
 
@@ -0,0 +1,252 @@
+import tkinter
+from collections.abc import Callable
+from typing import Any
+
+import customtkinter as ctk
+
+from utils import VirtualListUtility
+
+
+class VirtualList(ctk.CTkScrollableFrame):
+    """
+    Scrollable frame that only shows the rows inside the viewport.
+
+    An item is either a widget created with the list as master, which is its own row and
+    only gets un-gridded while it is out of view, or a data item whose row is made by
+    ``create_row``. Rows of data items are recycled: a row scrolled out of view goes back
+    to the pool and is bound to the next data item scrolled into view, so only about a
+    screen of them exists at any time.
+
+    The lines of rows above and below the viewport are replaced by two spacers of the same
+    height, which keeps the scroll position and scrollbar as if every row was shown.
+    """
+
+    def __init__(
+        self,
+        master: Any = None,
+        # make a row showing a data item, only needed for data items
+        create_row: Callable[[Any], tkinter.Misc] = None,
+        # show another data item on a recycled row
+        bind_row: Callable[[tkinter.Misc, Any], None] = None,
+        # called when a row goes back to the pool
+        release_row: Callable[[tkinter.Misc], None] = lambda _row: None,
+        columns: int = 1,
+        padx: int = 0,
+        pady: int = 2,
+        sticky: str = "ew",
+        # height of a data item row until one was measured
+        row_height: int = 70,
+        **kwargs,
+    ):
+        self.top_spacer: tkinter.Frame | None = None
+        self.bottom_spacer: tkinter.Frame | None = None
+
+        super().__init__(master=master, **kwargs)
+
+        self.create_row = create_row
+        self.bind_row = bind_row
+        self.release_row = release_row
+        self.columns = columns
+        self.padx = padx
+        self.pady = pady
+        self.sticky = sticky
+        self.row_height = row_height
+
+        self.items: list[Any] = []
+        # rows showing data items, by item id as data items need not be hashable
+        self.item_rows: dict[int, tkinter.Misc] = {}
+        self.row_items: dict[tkinter.Misc, Any] = {}
+        self.row_pool: list[tkinter.Misc] = []
+        self.shown_items: list[Any] = []
+        self.shown_layout: tuple = ()
+        self.refresh_scheduled = False
+
+        self.top_spacer = tkinter.Frame(master=self, height=0, highlightthickness=0, bd=0)
+        self.bottom_spacer = tkinter.Frame(master=self, height=0, highlightthickness=0, bd=0)
+        self.set_spacers_color()
+        self.configure_column_weight()
+
+        # Every scroll, resize and content size change goes through the scroll command
+        self._parent_canvas.configure(yscrollcommand=self.on_view_change)
+
+    def on_view_change(self, first: str, last: str) -> None:
+        self._scrollbar.set(first, last)
+        self.schedule_refresh()
+
+    def configure(self, **kwargs) -> None:
+        super().configure(**kwargs)
+        if "fg_color" in kwargs:
+            self.set_spacers_color()
+
+    def set_spacers_color(self) -> None:
+        if self.top_spacer is not None:
+            bg_color = tkinter.Frame.cget(self, "bg")
+            self.top_spacer.configure(bg=bg_color)
+            self.bottom_spacer.configure(bg=bg_color)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # items
+
+    def add_item(self, item: Any, index: int | None = None) -> None:
+        """
+        Add an item to the list.
+
+        Args:
+            item (Any): A widget created with the list as master, or a data item.
+            index (int | None): Where to insert the item, None to append it.
+        """
+        if index is None:
+            self.items.append(item)
+        else:
+            self.items.insert(index, item)
+        if isinstance(item, tkinter.Misc):
+            # A widget destroying itself, e.g. with its remove button, leaves the list
+            tkinter.Misc.bind(item, "<Destroy>", lambda event: self.on_row_destroyed(event, item), add="+")
+        self.schedule_refresh()
+
+    def remove_item(self, item: Any) -> None:
+        """
+        Remove an item from the list. A widget item is only un-gridded, not destroyed.
+        """
+        if self.hide_item(item):
+            self.shown_items = [shown_item for shown_item in self.shown_items if shown_item is not item]
+        self.items = [list_item for list_item in self.items if list_item is not item]
+        self.schedule_refresh()
+
+    def move_item(self, item: Any, index: int) -> None:
+        """Move an item to another place in the list."""
+        self.items = [list_item for list_item in self.items if list_item is not item]
+        self.items.insert(index, item)
+        self.schedule_refresh()
+
+    def get_item(self, row: tkinter.Misc) -> Any:
+        """Get the item a row is showing."""
+        return self.row_items.get(row, row)
+
+    def set_columns(self, columns: int) -> None:
+        """Set the number of rows laid out next to each other."""
+        columns = max(columns, 1)
+        if columns != self.columns:
+            self.columns = columns
+            self.configure_column_weight()
+            self.schedule_refresh()
+
+    def configure_column_weight(self) -> None:
+        # A single column of stretched rows fills the width, like rows packed with fill="x"
+        self.grid_columnconfigure(0, weight=1 if self.columns == 1 and self.sticky == "ew" else 0)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # rows
+
+    def on_row_destroyed(self, event: tkinter.Event, row: tkinter.Misc) -> None:
+        if str(event.widget) != str(row):
+            return
+        item = self.row_items.pop(row, row)
+        if row in self.row_pool:
+            self.row_pool.remove(row)
+        self.item_rows.pop(id(item), None)
+        self.items = [list_item for list_item in self.items if list_item is not item]
+        self.shown_items = [shown_item for shown_item in self.shown_items if shown_item is not item]
+        self.schedule_refresh()
+
+    def show_item(self, item: Any) -> tkinter.Misc:
+        """Get a row showing the item, from the pool if there is a free one."""
+        if isinstance(item, tkinter.Misc):
+            return item
+        row = self.item_rows.get(id(item))
+        if row is not None:
+            return row
+        if self.row_pool:
+            row = self.row_pool.pop()
+            self.bind_row(row, item)
+        else:
+            row = self.create_row(item)
+            tkinter.Misc.bind(row, "<Destroy>", lambda event: self.on_row_destroyed(event, row), add="+")
+        self.item_rows[id(item)] = row
+        self.row_items[row] = item
+        return row
+
+    def hide_item(self, item: Any) -> bool:
+        """
+        Take the row of an item out of the layout, a data item row goes back to the pool.
+
+        Returns:
+            bool: True if the item was shown.
+        """
+        if isinstance(item, tkinter.Misc):
+            if item.winfo_exists() and item.winfo_manager() == "grid":
+                item.grid_forget()
+                return True
+            return False
+        row = self.item_rows.pop(id(item), None)
+        if row is None:
+            return False
+        self.row_items.pop(row, None)
+        row.grid_forget()
+        self.release_row(row)
+        self.row_pool.append(row)
+        return True
+
+    def get_item_height(self, item: Any) -> int:
+        if isinstance(item, tkinter.Misc):
+            return item.winfo_reqheight()
+        row = self.item_rows.get(id(item))
+        if row is not None:
+            # Rows of data items all look alike, measure one for the ones not shown
+            self.row_height = row.winfo_reqheight()
+        return self.row_height
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # layout
+
+    def schedule_refresh(self) -> None:
+        if self.refresh_scheduled or not self.winfo_exists():
+            return
+        self.refresh_scheduled = True
+        self.after_idle(self.refresh)
+
+    def refresh(self) -> None:
+        """Show the rows of the items inside the viewport and hide the others."""
+        self.refresh_scheduled = False
+        if not self.winfo_exists():
+            return
+
+        row_heights = [self.get_item_height(item) for item in self.items]
+        line_heights = VirtualListUtility.get_line_heights(row_heights, self.columns, spacing=self.pady * 2)
+
+        # Keep half a screen of rows above and below, so scrolling does not show gaps
+        view_top = self._parent_canvas.canvasy(0)
+        view_height = self._parent_canvas.winfo_height()
+        first, last, space_above, space_below = VirtualListUtility.get_visible_lines(
+            line_heights, view_top - view_height / 2, view_top + view_height * 1.5
+        )
+        visible_items = self.items[first * self.columns : last * self.columns]
+
+        layout = (self.columns, space_above, space_below, [id(item) for item in visible_items])
+        if layout == self.shown_layout:
+            return
+        self.shown_layout = layout
+
+        visible_ids = {id(item) for item in visible_items}
+        for item in self.shown_items:
+            if id(item) not in visible_ids:
+                self.hide_item(item)
+
+        self.place_spacer(self.top_spacer, 0, space_above)
+        for index, item in enumerate(visible_items):
+            self.show_item(item).grid(
+                row=index // self.columns + 1,
+                column=index % self.columns,
+                padx=self.padx,
+                pady=self.pady,
+                sticky=self.sticky,
+            )
+        self.place_spacer(self.bottom_spacer, (len(visible_items) - 1) // self.columns + 2, space_below)
+        self.shown_items = visible_items
+
+    def place_spacer(self, spacer: tkinter.Frame, row: int, height: int) -> None:
+        if height > 0:
+            spacer.configure(height=height)
+            spacer.grid(row=row, column=0, columnspan=self.columns, sticky="ew")
+        else:
+            spacer.grid_forget()
@@ -16,6 +16,9 @@ _log = get_logger(__name__)
 
 
 class HistoryObject(ctk.CTkFrame):
+    # resized thumbnail files by source path and width, cards are rebound while scrolling
+    resized_thumbnail_paths: dict[tuple[str, int], str] = {}
+
     def __init__(
         self,
         master: ctk.CTkFrame = None,
@@ -72,6 +75,10 @@ class HistoryObject(ctk.CTkFrame):
         ThemeManager.register_widget(self)
 
     def get_resized_thumbnail(self, thumbnail_path: str):
+        key = (thumbnail_path, int(self.width))
+        if key in HistoryObject.resized_thumbnail_paths and os.path.exists(HistoryObject.resized_thumbnail_paths[key]):
+            return HistoryObject.resized_thumbnail_paths[key]
+
         thumbnail_size_for_video_history_object = (int(self.width) - 5, int(self.width / 16 * 9))
 
         thumbnail_image = Image.open(thumbnail_path)
@@ -82,12 +89,26 @@ class HistoryObject(ctk.CTkFrame):
         thumbnail_path = FileUtility.get_available_file_name("temp/thumbnails/history.png")
         thumbnail_image.save(FileUtility.get_available_file_name(thumbnail_path))
 
+        HistoryObject.resized_thumbnail_paths[key] = thumbnail_path
         return thumbnail_path
 
     def get_default_thumbnail(self): ...
 
     def configure_default_thumbnails(self): ...
 
+    def set_entry(self, entry: dict) -> None:
+        """
+        Show another history entry, used when the history list recycles the card.
+
+        Args:
+            entry (dict): The constructor arguments of the entry, e.g. ``no``, ``title`` and ``url``.
+        """
+        for key, value in entry.items():
+            setattr(self, key, value)
+        self.default_thumbnail_used = False
+        self.set_data()
+        self.set_widgets_texts()
+
     def set_data(self):
         if os.path.exists(self.thumbnail_path_normal) and self.thumbnail_path_normal != "":
             self.thumbnail_normal = PhotoImage(file=self.get_resized_thumbnail(self.thumbnail_path_normal))
@@ -6,6 +6,7 @@ import customtkinter as ctk
 
 from services import HistoryManager, LanguageManager, ThemeManager
 from settings import AppearanceSettings
+from widgets.core_widgets.virtual_list import VirtualList
 
 from .history_playlist import HistoryPlaylist
 from .history_video import HistoryVideo
@@ -21,6 +22,17 @@ class HistoryPanel(ctk.CTkFrame):
 
         super().__init__(master=master)
 
+        scale = AppearanceSettings.get_scale("decimal")
+        self.history_video_width = 180 * scale
+        self.history_video_grid_pad_y = 2 * scale
+        self.history_video_grid_pad_x = 2 * scale
+        self.videos_per_row = 0
+
+        self.history_playlist_width = 180 * scale
+        self.history_playlist_grid_pad_y = 2 * scale
+        self.history_playlist_grid_pad_x = 2 * scale
+        self.playlists_per_row = 0
+
         self.videos_button = ctk.CTkButton(
             master=self, text="Videos", command=lambda: self.place_nav_frame(self.videos_scrollable_frame, "videos")
         )
@@ -30,8 +42,23 @@ class HistoryPanel(ctk.CTkFrame):
             command=lambda: self.place_nav_frame(self.playlists_scrollable_frame, "playlists"),
         )
 
-        self.videos_scrollable_frame = ctk.CTkScrollableFrame(master=self)
-        self.playlists_scrollable_frame = ctk.CTkScrollableFrame(master=self)
+        # History entries are plain dicts, the lists only create cards for the rows in view
+        self.videos_scrollable_frame = VirtualList(
+            master=self,
+            create_row=self.create_history_video,
+            bind_row=lambda history_video, entry: history_video.set_entry(entry),
+            padx=self.history_video_grid_pad_x,
+            pady=self.history_video_grid_pad_y,
+            sticky="",
+        )
+        self.playlists_scrollable_frame = VirtualList(
+            master=self,
+            create_row=self.create_history_playlist,
+            bind_row=lambda history_playlist, entry: history_playlist.set_entry(entry),
+            padx=self.history_playlist_grid_pad_x,
+            pady=self.history_playlist_grid_pad_y,
+            sticky="",
+        )
 
         self.videos_history_frame_info_label = ctk.CTkLabel(
             master=self,
@@ -45,19 +72,8 @@ class HistoryPanel(ctk.CTkFrame):
         self.playlists_frame_info_label_placed = False
         self.videos_frame_info_label_placed = False
 
-        scale = AppearanceSettings.get_scale("decimal")
-        self.history_video_width = 180 * scale
-        self.history_video_grid_pad_y = 2 * scale
-        self.history_video_grid_pad_x = 2 * scale
-        self.videos_per_row = 0
-
-        self.history_playlist_width = 180 * scale
-        self.history_playlist_grid_pad_y = 2 * scale
-        self.history_playlist_grid_pad_x = 2 * scale
-        self.playlists_per_row = 0
-
-        self.histoy_videos_widgets = []
-        self.histoy_playlists_widgets = []
+        self.history_videos: list[dict] = []
+        self.history_playlists: list[dict] = []
 
         self.video_add_to_download_callback = video_add_to_download_callback
         self.playlist_add_to_download_callback = playlist_add_to_download_callback
@@ -78,26 +94,30 @@ class HistoryPanel(ctk.CTkFrame):
 
         self.place_nav_frame(self.videos_scrollable_frame, "videos")
 
+    def create_history_video(self, entry: dict) -> HistoryVideo:
+        return HistoryVideo(
+            master=self.videos_scrollable_frame,
+            width=self.history_video_width,
+            add_to_download_callback=self.video_add_to_download_callback,
+            remove_callback=self.remove_history_video,
+            **entry,
+        )
+
     def bring_video_to_top(self, no: int, url: str):
-        for index, history_video in enumerate(self.histoy_videos_widgets):
-            if history_video.url == url:
-                history_video.no = no
-                if index != 0:
-                    history_video_temp = history_video
-                    self.histoy_videos_widgets.remove(history_video)
-                    self.histoy_videos_widgets.insert(0, history_video_temp)
-                    self.place_history_videos()
+        for history_video in self.history_videos:
+            if history_video["url"] == url:
+                history_video["no"] = no
+                self.history_videos.remove(history_video)
+                self.history_videos.insert(0, history_video)
+                self.videos_scrollable_frame.move_item(history_video, 0)
                 break
 
     def remove_history_video(self, history_video: HistoryVideo):
-        is_last_video = history_video == self.histoy_videos_widgets[-1]
-        history_video.grid_forget()
-        self.histoy_videos_widgets.remove(history_video)
-        if not is_last_video:
-            self.place_history_videos()
+        entry = self.videos_scrollable_frame.get_item(history_video)
+        self.history_videos.remove(entry)
+        self.videos_scrollable_frame.remove_item(entry)
 
-        HistoryManager.remove_from_video_history(history_video.no)
-        history_video.destroy()
+        HistoryManager.remove_from_video_history(entry["no"])
 
     def add_hisory_video(
         self,
@@ -114,107 +134,78 @@ class HistoryPanel(ctk.CTkFrame):
         if is_duplicated:
             self.bring_video_to_top(no=no, url=url)
         else:
-            if len(self.histoy_videos_widgets) == HistoryManager.max_history:
-                self.histoy_videos_widgets.pop().destroy()
-            self.histoy_videos_widgets.insert(
-                0,
-                (
-                    HistoryVideo(
-                        master=self.videos_scrollable_frame,
-                        no=no,
-                        width=self.history_video_width,
-                        channel=channel,
-                        title=title,
-                        url=url,
-                        thumbnail_path_normal=thumbnail_normal_path,
-                        thumbnail_path_hover=thumbnail_hover_path,
-                        download_date=download_date,
-                        length=video_length,
-                        add_to_download_callback=self.video_add_to_download_callback,
-                        remove_callback=self.remove_history_video,
-                    )
-                ),
-            )
-
-        self.place_history_videos()
-
-    def place_history_videos(self) -> None:
-        self.place_forget_videos()
+            if len(self.history_videos) == HistoryManager.max_history:
+                self.videos_scrollable_frame.remove_item(self.history_videos.pop())
+            entry = {
+                "no": no,
+                "channel": channel,
+                "title": title,
+                "url": url,
+                "thumbnail_path_normal": thumbnail_normal_path,
+                "thumbnail_path_hover": thumbnail_hover_path,
+                "download_date": download_date,
+                "length": video_length,
+            }
+            self.history_videos.insert(0, entry)
+            self.videos_scrollable_frame.add_item(entry, index=0)
 
         ## Place forget innfo label if there is any history videos
-        if len(self.histoy_videos_widgets) > 0:
-            self.place_forget_nav_labels(except_label="playlists")
-
-        row = 0
-        column = 0
-        for history_video in self.histoy_videos_widgets:
-            if not column < self.videos_per_row:
-                row += 1
-                column = 0
-            history_video.grid(
-                row=row, column=column, padx=self.history_video_grid_pad_x, pady=self.history_video_grid_pad_y
-            )
-            column += 1
-
-    def place_forget_videos(self) -> None:
-        for history_video in self.histoy_videos_widgets:
-            history_video.grid_forget()
+        self.place_forget_nav_labels(except_label="playlists")
 
     def configure_old_history_videos(self) -> None:
         for video_date in HistoryManager.videos_history_data:
-            self.histoy_videos_widgets.append(
-                HistoryVideo(
-                    master=self.videos_scrollable_frame,
-                    width=self.history_video_width,
-                    no=video_date[0],
-                    channel=video_date[1],
-                    title=video_date[2],
-                    url=video_date[3],
-                    thumbnail_path_normal=video_date[4],
-                    thumbnail_path_hover=video_date[5],
-                    length=video_date[6],
-                    download_date=video_date[7],
-                    add_to_download_callback=self.video_add_to_download_callback,
-                    remove_callback=self.remove_history_video,
-                )
-            )
+            entry = {
+                "no": video_date[0],
+                "channel": video_date[1],
+                "title": video_date[2],
+                "url": video_date[3],
+                "thumbnail_path_normal": video_date[4],
+                "thumbnail_path_hover": video_date[5],
+                "length": video_date[6],
+                "download_date": video_date[7],
+            }
+            self.history_videos.append(entry)
+            self.videos_scrollable_frame.add_item(entry)
         self.configure_video_count_per_row()
-        self.place_history_videos()
+        if len(self.history_videos) > 0:
+            self.place_forget_nav_labels(except_label="playlists")
 
     def configure_history_videos(self) -> None:
-        previous_video_count_per_row = self.videos_per_row
         self.configure_video_count_per_row()
-        if previous_video_count_per_row != self.videos_per_row:
-            self.place_history_videos()
 
     def configure_video_count_per_row(self) -> None:
         total_required_width_for_video = self.history_video_width + self.history_video_grid_pad_x
         self.videos_per_row = math.floor(
             (self.videos_scrollable_frame.cget("width") - 12) / total_required_width_for_video
         )
+        self.videos_scrollable_frame.set_columns(self.videos_per_row)
 
     # ------------------------------------------------------------------------------------------------------------------
     # ------------------------------------------------------------------------------------------------------------------
+    def create_history_playlist(self, entry: dict) -> HistoryPlaylist:
+        return HistoryPlaylist(
+            master=self.playlists_scrollable_frame,
+            width=self.history_playlist_width,
+            add_to_download_callback=self.playlist_add_to_download_callback,
+            remove_callback=self.remove_history_playlist,
+            **entry,
+        )
+
     def bring_playlist_to_top(self, no: int, url: str):
-        for index, history_playlist in enumerate(self.histoy_playlists_widgets):
-            if history_playlist.url == url:
-                history_playlist.no = no
-                if index != 0:
-                    history_playlist_temp = history_playlist
-                    self.histoy_playlists_widgets.remove(history_playlist)
-                    self.histoy_playlists_widgets.insert(0, history_playlist_temp)
-                    self.place_history_playlists()
+        for history_playlist in self.history_playlists:
+            if history_playlist["url"] == url:
+                history_playlist["no"] = no
+                self.history_playlists.remove(history_playlist)
+                self.history_playlists.insert(0, history_playlist)
+                self.playlists_scrollable_frame.move_item(history_playlist, 0)
                 break
 
     def remove_history_playlist(self, history_playlist: HistoryPlaylist):
-        is_last_video = history_playlist == self.histoy_playlists_widgets[-1]
-        history_playlist.grid_forget()
-        self.histoy_playlists_widgets.remove(history_playlist)
-        if not is_last_video:
-            self.place_history_playlists()
+        entry = self.playlists_scrollable_frame.get_item(history_playlist)
+        self.history_playlists.remove(entry)
+        self.playlists_scrollable_frame.remove_item(entry)
 
-        HistoryManager.remove_from_playlist_history(history_playlist.no)
-        history_playlist.destroy()
+        HistoryManager.remove_from_playlist_history(entry["no"])
 
     def add_hisory_playlist(
         self,
@@ -231,83 +222,51 @@ class HistoryPanel(ctk.CTkFrame):
         if is_duplicated:
             self.bring_playlist_to_top(no=no, url=url)
         else:
-            if len(self.histoy_playlists_widgets) == HistoryManager.max_history:
-                self.histoy_playlists_widgets.pop().destroy()
-            self.histoy_playlists_widgets.insert(
-                0,
-                (
-                    HistoryPlaylist(
-                        master=self.playlists_scrollable_frame,
-                        no=no,
-                        width=self.history_video_width,
-                        channel=channel,
-                        title=title,
-                        url=url,
-                        thumbnail_path_normal=thumbnail_normal_path,
-                        thumbnail_path_hover=thumbnail_hover_path,
-                        download_date=download_date,
-                        add_to_download_callback=self.playlist_add_to_download_callback,
-                        videos_count=video_count,
-                        remove_callback=self.remove_history_playlist,
-                    )
-                ),
-            )
-            self.place_history_playlists()
-
-    def place_history_playlists(self) -> None:
-        self.place_forget_playlists()
-
-        ## Place forget innfo label if there is any history videos
-        if len(self.histoy_playlists_widgets) > 0:
+            if len(self.history_playlists) == HistoryManager.max_history:
+                self.playlists_scrollable_frame.remove_item(self.history_playlists.pop())
+            entry = {
+                "no": no,
+                "channel": channel,
+                "title": title,
+                "url": url,
+                "thumbnail_path_normal": thumbnail_normal_path,
+                "thumbnail_path_hover": thumbnail_hover_path,
+                "download_date": download_date,
+                "videos_count": video_count,
+            }
+            self.history_playlists.insert(0, entry)
+            self.playlists_scrollable_frame.add_item(entry, index=0)
+
+            ## Place forget innfo label if there is any history playlists
             self.place_forget_nav_labels(except_label="videos")
 
-        row = 0
-        column = 0
-        for history_playlist in self.histoy_playlists_widgets:
-            if not column < self.playlists_per_row:
-                row += 1
-                column = 0
-            history_playlist.grid(
-                row=row, column=column, padx=self.history_playlist_grid_pad_x, pady=self.history_playlist_grid_pad_y
-            )
-            column += 1
-
-    def place_forget_playlists(self) -> None:
-        for history_playlist in self.histoy_playlists_widgets:
-            history_playlist.grid_forget()
-
     def configure_old_history_playlists(self) -> None:
         for playlist_date in HistoryManager.playlists_history_data:
-            self.histoy_playlists_widgets.append(
-                HistoryPlaylist(
-                    master=self.playlists_scrollable_frame,
-                    width=self.history_playlist_width,
-                    no=playlist_date[0],
-                    channel=playlist_date[1],
-                    title=playlist_date[2],
-                    url=playlist_date[3],
-                    thumbnail_path_normal=playlist_date[4],
-                    thumbnail_path_hover=playlist_date[5],
-                    videos_count=playlist_date[6],
-                    download_date=playlist_date[7],
-                    add_to_download_callback=self.playlist_add_to_download_callback,
-                    remove_callback=self.remove_history_playlist,
-                )
-            )
+            entry = {
+                "no": playlist_date[0],
+                "channel": playlist_date[1],
+                "title": playlist_date[2],
+                "url": playlist_date[3],
+                "thumbnail_path_normal": playlist_date[4],
+                "thumbnail_path_hover": playlist_date[5],
+                "videos_count": playlist_date[6],
+                "download_date": playlist_date[7],
+            }
+            self.history_playlists.append(entry)
+            self.playlists_scrollable_frame.add_item(entry)
         self.configure_playlist_count_per_row()
-        self.place_history_playlists()
+        if len(self.history_playlists) > 0:
+            self.place_forget_nav_labels(except_label="videos")
 
     def configure_history_playlists(self) -> None:
-        previous_playlist_count_per_row = self.playlists_per_row
         self.configure_playlist_count_per_row()
-        if previous_playlist_count_per_row != self.playlists_per_row:
-            self.place_history_playlists()
 
     def configure_playlist_count_per_row(self) -> None:
         total_required_width_for_playlist = self.history_playlist_width + self.history_playlist_grid_pad_x
         self.playlists_per_row = math.floor(
             (self.playlists_scrollable_frame.cget("width") - 12) / total_required_width_for_playlist
         )
+        self.playlists_scrollable_frame.set_columns(self.playlists_per_row)
 
     # ------------------------------------------------------------------------------------------------------------------
     # ------------------------------------------------------------------------------------------------------------------
@@ -319,13 +278,13 @@ class HistoryPanel(ctk.CTkFrame):
     def place_nav_label(self, frame_name: Literal["videos", "playlists"]) -> None:
         self.place_forget_nav_labels()
 
-        if frame_name == "videos" and len(self.histoy_videos_widgets) == 0:
+        if frame_name == "videos" and len(self.history_videos) == 0:
             self.videos_history_frame_info_label.place(
                 y=self.cget("height") / 2 + 45, x=self.cget("width") / 2, anchor="center"
             )
             self.videos_frame_info_label_placed = True
 
-        elif frame_name == "playlists" and len(self.histoy_playlists_widgets) == 0:
+        elif frame_name == "playlists" and len(self.history_playlists) == 0:
             self.playlists_history_frame_info_label.place(
                 y=self.cget("height") / 2 + 45, x=self.cget("width") / 2, anchor="center"
             )
@@ -4,7 +4,7 @@ from typing import Literal
 import customtkinter as ctk
 import pytubefix
 
-from services import LanguageManager, ThemeManager
+from services import LanguageManager, MetadataCache, ThemeManager, VideoRecord
 from settings import AppearanceSettings, GeneralSettings
 from utils import GuiUtils
 from utils.logger import get_logger
@@ -47,10 +47,12 @@ class AddedPlayList(PlayList):
         # state
         self.load_state: Literal[None, "waiting", "loading", "failed", "loaded"] = "loading"
         # vars for state track
-        self.waiting_videos: list[AddedVideo] = []
-        self.loading_videos: list[AddedVideo] = []
-        self.failed_videos: list[AddedVideo] = []
-        self.loaded_videos: list[AddedVideo] = []
+        self.waiting_videos: list[VideoRecord] = []
+        self.loading_videos: list[VideoRecord] = []
+        self.failed_videos: list[VideoRecord] = []
+        self.loaded_videos: list[VideoRecord] = []
+        # widgets of the videos on the page being shown, the other videos are records only
+        self.video_widgets: dict[VideoRecord, AddedVideo] = {}
         self.automatic_downloaded: bool = False
 
         self.available_resolutions: list[str] = ["highest_quality", "lowest_quality", "audio_only"]
@@ -77,28 +79,58 @@ class AddedPlayList(PlayList):
             self.indicate_loading_failure()
 
     def load_videos(self):
-        for video_url in self.playlist.video_urls:
-            video = AddedVideo(
-                root=self.root,
-                master=self.playlist_videos_frame,
-                width=self.playlist_videos_frame.winfo_width() - 20,
-                height=70 * AppearanceSettings.get_scale("decimal"),
-                video_url=video_url,
-                video_download_button_click_callback=self.video_download_button_click_callback,
+        video_urls = list(self.playlist.video_urls)
+        # Look up every video in the metadata cache with a few queries instead of one per video
+        video_ids = {video_url: MetadataCache.get_video_id(video_url) for video_url in video_urls}
+        cached_data = MetadataCache.get_many([video_id for video_id in video_ids.values() if video_id is not None])
+
+        for video_url in video_urls:
+            record = VideoRecord(
+                video_url,
                 mode="playlist",
+                queue_group=self,
                 # videos state track
-                video_load_status_callback=self.videos_status_track,
+                status_callback=self.videos_status_track,
+                download_callback=self.video_download_button_click_callback,
             )
-            if self.last_viewed_index < PlayList.max_videos_per_page:
-                video.pack(fill="x", padx=(20, 0), pady=(1, 0))
-                self.last_viewed_index += 1
-            self.videos.append(video)
+            data = cached_data.get(video_ids[video_url])
+            if data is not None:
+                record.set_data(data)
+                record.cached = True
+            self.videos.append(record)
+            record.register()
 
         self.configure_videos_tab_view()
         self.view_btn.configure(state="normal")
 
+    def get_video_height(self) -> int:
+        return 70 * AppearanceSettings.get_scale("decimal")
+
+    def pack_video(self, index: int):
+        record = self.videos[index]
+        if record in self.video_widgets:
+            return
+        video = AddedVideo(
+            root=self.root,
+            master=self.playlist_videos_frame,
+            width=self.playlist_videos_frame.winfo_width() - 20,
+            height=self.get_video_height(),
+            mode="playlist",
+            record=record,
+        )
+        video.pack(fill="x", padx=(20, 0), pady=(1, 0))
+        self.video_widgets[record] = video
+
+    def pack_forgot_videos(self):
+        # Widgets are only kept for the page being shown
+        for record, video in self.video_widgets.items():
+            # A widget being removed by the user has already let go of its record
+            if record.view is video:
+                video.release()
+        self.video_widgets.clear()
+
     def videos_status_track(
-        self, video: AddedVideo, state: Literal["waiting", "loading", "loaded", "failed", "removed"]
+        self, video: VideoRecord, state: Literal["waiting", "loading", "loaded", "failed", "removed"]
     ):
         if state == "removed":
             self.videos.remove(video)
@@ -161,7 +193,7 @@ class AddedPlayList(PlayList):
         for video in self.loaded_videos:
             for resolution in [
                 int(reso.split(" | ")[0].replace(" ", "")[0:-1])
-                for reso in video.resolution_select_menu.cget("values")
+                for reso in video.get_download_options()
                 if "kbps" not in reso
             ]:
                 if resolution not in available_resolutions:
@@ -272,12 +304,10 @@ class AddedPlayList(PlayList):
     def configure_download_resolution(self, selected_resolution):
         for video in self.loaded_videos:
             video.select_download_resolution(selected_resolution)
-            video.configure_download_resolution(video.resolution_select_menu.get())
 
     def configure_resolution_automatic_download_for_videos(self):
         for video in self.loaded_videos:
             video.select_download_quality_automatic()
-            video.configure_download_resolution(video.resolution_select_menu.get())
 
     # create widgets
     def create_widgets(self):
@@ -475,6 +505,7 @@ class AddedPlayList(PlayList):
         del self.loading_videos
         del self.failed_videos
         del self.loaded_videos
+        del self.video_widgets
 
         del self.automatic_downloaded
         del self.available_resolutions
@@ -495,8 +526,9 @@ class AddedPlayList(PlayList):
     def kill(self):
         self.pack_forget()
 
+        self.pack_forgot_videos()
         for video in self.videos:
-            video.video_load_status_callback = GuiUtils.do_nothing
-            video.kill()
+            video.status_callback = GuiUtils.do_nothing
+            video.remove()
 
         super().kill()
@@ -3,11 +3,17 @@ from typing import Literal
 
 import customtkinter as ctk
 
-from services import LanguageManager, NotificationManager, ThemeManager
+from services import (
+    LanguageManager,
+    NotificationManager,
+    PlaylistProgress,
+    ProgressUpdater,
+    ThemeManager,
+    VideoRecord,
+)
 from settings import AppearanceSettings, GeneralSettings
-from utils import DownloadInfoUtility, GuiUtils, ValueConvertUtility
+from utils import GuiUtils, ValueConvertUtility
 from widgets.play_list.play_list import PlayList
-from widgets.video.added_video import AddedVideo
 from widgets.video.downloading_video import DownloadingVideo
 
 
@@ -25,7 +31,7 @@ class DownloadingPlayList(PlayList):
         channel: str = "---------",
         playlist_video_count: int = 0,
         # videos of playlist
-        videos: list[AddedVideo] = None,
+        videos: list[VideoRecord] = None,
         playlist_original_video_count: int = 0,
         # playlist download completed callback utils
         playlist_download_complete_callback: Callable = None,
@@ -44,21 +50,13 @@ class DownloadingPlayList(PlayList):
 
         # callback utils
         self.playlist_download_complete_callback = playlist_download_complete_callback
-        self.added_videos: list[AddedVideo] = videos
+        self.added_videos: list[VideoRecord] = videos
 
-        # vars for state track
-        self.waiting_videos: list[DownloadingVideo] = []
-        self.downloading_videos: list[DownloadingVideo] = []
-        self.paused_videos: list[DownloadingVideo] = []
-        self.failed_videos: list[DownloadingVideo] = []
+        # vars for state track, the downloaded videos are handed over to the downloaded playlist
+        self.progress = PlaylistProgress()
         self.downloaded_videos: list[DownloadingVideo] = []
-        self.converting_videos: list[DownloadingVideo] = []
         self.download_state: Literal["waiting", "downloading", "downloaded", "failed", "converting"] = "waiting"
 
-        self.total_download_size: int = 0
-        self.current_download_size: int = 0
-        self.current_taken_time: float = 0.0
-
         super().__init__(
             root=root,
             master=master,
@@ -107,6 +105,7 @@ class DownloadingPlayList(PlayList):
                 # videos state, download progress track
                 video_download_status_callback=self.videos_status_track,
                 video_download_progress_callback=self.videos_progress_track,
+                queue_group=self,
             )
             if self.last_viewed_index < PlayList.max_videos_per_page:
                 video.pack(fill="x", padx=(20, 0), pady=(1, 0))
@@ -127,130 +126,69 @@ class DownloadingPlayList(PlayList):
             self.playlist_video_count -= 1
             if len(self.videos) == 0:
                 self.kill()
-            else:
-                if video in self.downloading_videos:
-                    self.downloading_videos.remove(video)
-                if video in self.failed_videos:
-                    self.failed_videos.remove(video)
-                if video in self.waiting_videos:
-                    self.waiting_videos.remove(video)
-                if video in self.downloaded_videos:
-                    self.downloaded_videos.remove(video)
-                if video in self.paused_videos:
-                    self.paused_videos.remove(video)
-                if video in self.converting_videos:
-                    self.converting_videos.remove(video)
-        elif state == "failed":
-            self.failed_videos.append(video)
-            if video in self.downloading_videos:
-                self.downloading_videos.remove(video)
-            if video in self.paused_videos:
-                self.paused_videos.remove(video)
-            if video in self.waiting_videos:
-                self.waiting_videos.remove(video)
-            if video in self.converting_videos:
-                self.converting_videos.remove(video)
-            self.show_notification(self.failed_videos[-1])
-        elif state == "downloading":
-            self.downloading_videos.append(video)
-            if video in self.waiting_videos:
-                self.waiting_videos.remove(video)
-            if video in self.failed_videos:
-                self.failed_videos.remove(video)
-            if video in self.paused_videos:
-                self.paused_videos.remove(video)
-            if video in self.converting_videos:
-                self.converting_videos.remove(video)
-        elif state == "paused":
-            self.paused_videos.append(video)
-            if video in self.downloading_videos:
-                self.downloading_videos.remove(video)
-        elif state == "waiting":
-            self.waiting_videos.append(video)
-            if video in self.downloading_videos:
-                self.downloading_videos.remove(video)
-            if video in self.downloaded_videos:
-                self.downloaded_videos.remove(video)
-            if video in self.failed_videos:
-                self.failed_videos.remove(video)
-            if video in self.converting_videos:
-                self.converting_videos.remove(video)
-        elif state == "converting":
-            self.converting_videos.append(video)
-            if video in self.waiting_videos:
-                self.waiting_videos.remove(video)
-            if video in self.downloading_videos:
-                self.downloading_videos.remove(video)
+                return
+            previous_state = self.progress.remove(video)
+            ProgressUpdater.publish(self)
+        else:
+            previous_state = self.progress.set_state(video, state)
+
+        if previous_state == "downloaded" and state != "downloaded":
+            self.downloaded_videos.remove(video)
+        if state == "failed":
+            self.show_notification(video)
         elif state == "downloaded":
             self.downloaded_videos.append(video)
-            if video in self.downloading_videos:
-                self.downloading_videos.remove(video)
-            if video in self.converting_videos:
-                self.converting_videos.remove(video)
-            self.show_notification(self.downloaded_videos[-1])
-            if video in self.waiting_videos:
-                self.waiting_videos.remove(video)
-
-        # if len is 0 that means all videos are remove :D
-        if len(self.videos) != 0:
-            self.videos_status_counts_label.configure(
-                text=f"{LanguageManager.data['failed']} : {len(self.failed_videos)} |   "
-                f"{LanguageManager.data['waiting']} : {len(self.waiting_videos)} |   "
-                f"{LanguageManager.data['downloading']} : {len(self.downloading_videos)} |   "
-                f"{LanguageManager.data['converting']} : {len(self.converting_videos)} |   "
-                f"{LanguageManager.data['paused']} : {len(self.paused_videos)} |   "
-                f"{LanguageManager.data['downloaded']} : {len(self.downloaded_videos)}",
-            )
-            self.playlist_video_count_label.configure(text=self.playlist_video_count)
+            self.show_notification(video)
 
-            if len(self.failed_videos) != 0:
-                self.indicate_downloading_failure()
+        self.videos_status_counts_label.configure(
+            text=f"{LanguageManager.data['failed']} : {self.progress.get_count('failed')} |   "
+            f"{LanguageManager.data['waiting']} : {self.progress.get_count('waiting')} |   "
+            f"{LanguageManager.data['downloading']} : {self.progress.get_count('downloading')} |   "
+            f"{LanguageManager.data['converting']} : {self.progress.get_count('converting')} |   "
+            f"{LanguageManager.data['paused']} : {self.progress.get_count('paused')} |   "
+            f"{LanguageManager.data['downloaded']} : {self.progress.get_count('downloaded')}",
+        )
+        self.playlist_video_count_label.configure(text=self.playlist_video_count)
+
+        if self.progress.get_count("failed") != 0:
+            self.indicate_downloading_failure()
+        else:
+            # if all videos waiting
+            if self.progress.get_count("waiting") == self.playlist_video_count:
+                self.indicate_waiting()
             else:
-                # if all videos waiting
-                if len(self.waiting_videos) == self.playlist_video_count:
-                    self.indicate_waiting()
-                else:
-                    self.indicate_downloading()
-            if (
-                len(self.downloading_videos) == 0
-                and len(self.waiting_videos) == 0
-                and len(self.failed_videos) == 0
-                and len(self.paused_videos) == 0
-                and len(self.converting_videos) == 0
-            ):
-                self.set_downloading_completed()
-
-    def videos_progress_track(self):
-        total_completion: float = 0
-        total_bytes_downloaded: float = 0
-        total_bytes_to_download: float = 0
-        total_download_time: float = 0
-        for video in self.videos:
-            if video.file_size != 0:
-                total_completion += video.total_bytes_downloaded / video.file_size
-                total_bytes_downloaded += video.total_bytes_downloaded
-                total_bytes_to_download += video.file_size
-                total_download_time += video.total_download_time
-        avg_completion = total_completion / self.playlist_video_count
-        self.set_playlist_download_progress(avg_completion, total_bytes_downloaded, total_bytes_to_download)
-        self.set_estimated_time(total_bytes_to_download, total_download_time, total_bytes_downloaded)
-
-        self.total_download_size = total_bytes_to_download
-        self.current_download_size = total_bytes_downloaded
-        self.current_taken_time = total_download_time
+                self.indicate_downloading()
+        if all(
+            self.progress.get_count(unfinished_state) == 0
+            for unfinished_state in ("downloading", "waiting", "failed", "paused", "converting")
+        ):
+            self.set_downloading_completed()
+
+    def videos_progress_track(self, video: DownloadingVideo):
+        """
+        Add the latest counters of a video to the playlist totals, safe to call from any thread.
+        The totals are shown once per frame by ``render_progress``.
+        """
+        self.progress.update(
+            video, video.total_bytes_downloaded, video.file_size, video.total_download_time, video.resumed_bytes
+        )
+        ProgressUpdater.publish(self)
+
+    def render_progress(self):
+        """
+        Show the playlist totals, called by the ProgressUpdater on the Tk thread.
+        """
+        if self.playlist_video_count == 0:
+            return
+        avg_completion = self.progress.completion / self.playlist_video_count
+        self.set_playlist_download_progress(avg_completion, self.progress.bytes_downloaded, self.progress.file_size)
+        self.set_estimated_time(self.progress.get_estimated_time())
 
     def get_total_download_size(self):
-        total_bytes_to_download: float = 0
-        for video in self.videos:
-            if video.file_size != 0:
-                total_bytes_to_download += video.file_size
-        return total_bytes_to_download
+        return self.progress.file_size
 
     def get_total_download_time_taken(self):
-        total_download_time: float = 0
-        for video in self.videos:
-            total_download_time += video.total_download_time
-        return total_download_time
+        return self.progress.download_time
 
     def set_playlist_download_progress(self, progress, total_bytes_downloaded, total_bytes_to_download):
         self.total_download_size_progress_label.configure(
@@ -260,7 +198,7 @@ class DownloadingPlayList(PlayList):
         self.download_percentage_label.configure(text=f"{round(progress * 100, 2)} %")
 
     def re_download_videos(self):
-        if len(self.downloading_videos) == 0:
+        if self.progress.get_count("downloading") == 0:
             self.indicate_waiting()
         else:
             self.indicate_downloading()
@@ -345,11 +283,11 @@ class DownloadingPlayList(PlayList):
         super().set_widgets_texts()
         self.status_label.configure(text=LanguageManager.data[self.download_state])
         self.videos_status_counts_label.configure(
-            text=f"{LanguageManager.data['failed']} : {len(self.failed_videos)} |   "
-            f"{LanguageManager.data['waiting']} : {len(self.waiting_videos)} |   "
-            f"{LanguageManager.data['downloading']} : {len(self.downloading_videos)} |   "
-            f"{LanguageManager.data['paused']} : {len(self.paused_videos)} |   "
-            f"{LanguageManager.data['downloaded']} : {len(self.downloaded_videos)}",
+            text=f"{LanguageManager.data['failed']} : {self.progress.get_count('failed')} |   "
+            f"{LanguageManager.data['waiting']} : {self.progress.get_count('waiting')} |   "
+            f"{LanguageManager.data['downloading']} : {self.progress.get_count('downloading')} |   "
+            f"{LanguageManager.data['paused']} : {self.progress.get_count('paused')} |   "
+            f"{LanguageManager.data['downloaded']} : {self.progress.get_count('downloaded')}",
         )
 
         total_download_size = ValueConvertUtility.convert_size(self.get_total_download_size(), decimal_points=2)
@@ -358,12 +296,9 @@ class DownloadingPlayList(PlayList):
         if not self.get_total_download_size():
             self.estimated_remaining_time_label.configure(text=f"{LanguageManager.data['calculating']}")
         else:
-            self.set_estimated_time(self.total_download_size, self.current_taken_time, self.current_download_size)
+            self.set_estimated_time(self.progress.get_estimated_time())
 
-    def set_estimated_time(self, total_download_size, current_taken_time, current_download_size):
-        eta_time = DownloadInfoUtility.get_estimated_time(
-            total_download_size, current_taken_time, current_download_size
-        )
+    def set_estimated_time(self, eta_time):
         self.estimated_remaining_time_label.configure(
             text=f"{LanguageManager.data['eta']}: {ValueConvertUtility.convert_time(eta_time)}"
         )
@@ -475,10 +410,7 @@ class DownloadingPlayList(PlayList):
         del self.playlist_download_complete_callback
         del self.added_videos
 
-        del self.waiting_videos
-        del self.downloading_videos
-        del self.paused_videos
-        del self.failed_videos
+        del self.progress
         del self.downloaded_videos
         del self.download_state
         del self.total_download_size_progress_label
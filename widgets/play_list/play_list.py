@@ -180,6 +180,14 @@ class PlayList(ctk.CTkFrame):
         print(" End :",self.last_viewed_index)
         """
 
+    def get_video_height(self) -> int:
+        """Height of a video row on a page."""
+        return self.videos[0].height
+
+    def pack_video(self, index: int):
+        """Show the video at ``index`` on the current page."""
+        self.videos[index].pack(fill="x", padx=(20, 0), pady=(1, 0))
+
     def configure_videos_tab_view(self):
         self.current_viewing_page -= 1
         self.total_videos_tab_count = math.ceil(len(self.videos) / PlayList.max_videos_per_page) - 1
@@ -193,12 +201,12 @@ class PlayList(ctk.CTkFrame):
 
         if len(self.videos) > PlayList.max_videos_per_page:
             self.playlist_item_frame.configure(
-                height=5 * (self.videos[0].height + 1) + 1 + 40 * AppearanceSettings.get_scale("decimal")
+                height=5 * (self.get_video_height() + 1) + 1 + 40 * AppearanceSettings.get_scale("decimal")
             )
-            self.playlist_videos_frame.configure(height=5 * (self.videos[0].height + 1))
+            self.playlist_videos_frame.configure(height=5 * (self.get_video_height() + 1))
         elif len(self.videos) != 0:
-            self.playlist_item_frame.configure(height=len(self.videos) * (self.videos[0].height + 1))
-            self.playlist_videos_frame.configure(height=len(self.videos) * (self.videos[0].height + 1))
+            self.playlist_item_frame.configure(height=len(self.videos) * (self.get_video_height() + 1))
+            self.playlist_videos_frame.configure(height=len(self.videos) * (self.get_video_height() + 1))
 
         self.view_next_videos()
 
@@ -215,7 +223,7 @@ class PlayList(ctk.CTkFrame):
             (self.current_viewing_page * PlayList.max_videos_per_page) + PlayList.max_videos_per_page,
         ):
             try:
-                self.videos[i].pack(fill="x", padx=(20, 0), pady=(1, 0))
+                self.pack_video(i)
             except Exception as error:
                 _log.debug("view_next_videos: index %d out of range: %s", i, error)
 
@@ -245,7 +253,7 @@ class PlayList(ctk.CTkFrame):
             self.current_viewing_page * PlayList.max_videos_per_page + PlayList.max_videos_per_page,
         ):
             try:
-                self.videos[i].pack(fill="x", padx=(20, 0), pady=(1, 0))
+                self.pack_video(i)
             except Exception as error:
                 _log.debug("view_previous_videos: index %d out of range: %s", i, error)
 
@@ -4,7 +4,7 @@ from typing import Any
 
 import customtkinter as ctk
 
-from services import DownloadManager, LanguageManager, ThemeManager
+from services import DownloadManager, LanguageManager, StreamingMuxer, ThemeManager
 from settings import AppearanceSettings, GeneralSettings
 from utils import FileUtility, SettingsValidateUtility, ValueConvertUtility
 
@@ -128,6 +128,54 @@ class DownloadsPanel(ctk.CTkFrame):
             master=self,
         )
 
+        # -------------------------------------------------------------
+        self.download_connections_label = ctk.CTkLabel(
+            master=self,
+        )
+
+        self.dash6_label = ctk.CTkLabel(
+            master=self,
+            text=":",
+        )
+
+        self.download_connections_change_slider = ctk.CTkSlider(
+            master=self,
+            command=self.change_download_connections,
+            from_=1,
+            to=16,
+            number_of_steps=15,
+        )
+
+        self.download_connections_value_label = ctk.CTkLabel(
+            master=self,
+        )
+
+        # -------------------------------------------------------------
+        self.streaming_mux_label = ctk.CTkLabel(
+            master=self,
+        )
+
+        self.dash7_label = ctk.CTkLabel(
+            master=self,
+            text=":",
+        )
+
+        self.streaming_mux_switch_state = ctk.BooleanVar(value=None)
+        self.streaming_mux_switch = ctk.CTkSwitch(
+            master=self,
+            text="",
+            command=self.change_streaming_mux,
+            onvalue=True,
+            offvalue=False,
+            variable=self.streaming_mux_switch_state,
+            # ffmpeg can't be fed through pipes on Windows, videos are merged after downloading there
+            state="normal" if StreamingMuxer.is_supported() else "disabled",
+        )
+        self.streaming_mux_info_label = ctk.CTkLabel(
+            master=self,
+            justify="left",
+        )
+
         # -------------------------------------------------------------
 
         self.apply_changes_button = ctk.CTkButton(
@@ -145,6 +193,8 @@ class DownloadsPanel(ctk.CTkFrame):
         self.create_sep_path_for_videos_audios_state_changed: bool = False
         self.create_sep_path_for_playlists_state_changed: bool = False
         self.chunk_size_changed: bool = False
+        self.download_connections_changed: bool = False
+        self.streaming_mux_state_changed: bool = False
 
         # track values validity
         self.download_path_valid: bool = True
@@ -176,6 +226,14 @@ class DownloadsPanel(ctk.CTkFrame):
         self.change_chunk_size(DownloadManager.default_chunk_size)
         self.chunk_size_change_slider.set(DownloadManager.default_chunk_size)
 
+        self.download_connections_change_slider.set(DownloadManager.default_download_connections)
+        self.change_download_connections(DownloadManager.default_download_connections)
+
+        if DownloadManager.default_streaming_mux and StreamingMuxer.is_supported():
+            self.streaming_mux_switch.select()
+        else:
+            self.streaming_mux_switch.deselect()
+
         self.apply_downloads_settings()
 
     def apply_downloads_settings(self):
@@ -204,6 +262,10 @@ class DownloadsPanel(ctk.CTkFrame):
         )
         GeneralSettings.settings["create_sep_path_for_playlists"] = self.create_sep_path_for_playlists_switch.get()
         GeneralSettings.settings["chunk_size"] = int(self.chunk_size_change_slider.get())
+        GeneralSettings.settings["download_connections"] = int(self.download_connections_change_slider.get())
+        self.download_connections_changed = False
+        GeneralSettings.settings["streaming_mux"] = self.streaming_mux_switch.get()
+        self.streaming_mux_state_changed = False
         self.general_settings_change_callback()
         self.apply_changes_button.configure(state="disabled")
         if self.chunk_size_changed:
@@ -233,6 +295,8 @@ class DownloadsPanel(ctk.CTkFrame):
                 self.create_sep_path_for_playlists_state_changed,
                 self.create_sep_path_for_qualities_state_changed,
                 self.chunk_size_changed,
+                self.download_connections_changed,
+                self.streaming_mux_state_changed,
             )
         ) and all((self.download_path_valid, self.chunk_size_valid)):
             self.apply_changes_button.configure(state="normal")
@@ -250,6 +314,15 @@ class DownloadsPanel(ctk.CTkFrame):
             self.chunk_size_changed = False
         self.set_apply_button_state()
 
+    def change_download_connections(self, connections: int | float) -> None:
+        connections = int(connections)
+        self.download_connections_value_label.configure(text=str(connections))
+        if connections != GeneralSettings.settings["download_connections"]:
+            self.download_connections_changed = True
+        else:
+            self.download_connections_changed = False
+        self.set_apply_button_state()
+
     def validate_chunk_size_value(self, _event):
         if self.chunk_size_entry_previous_value == self.chunk_size_value_entry.get():
             return
@@ -312,6 +385,13 @@ class DownloadsPanel(ctk.CTkFrame):
             self.create_sep_path_for_qualities_state_changed = False
         self.set_apply_button_state()
 
+    def change_streaming_mux(self):
+        if GeneralSettings.settings["streaming_mux"] != self.streaming_mux_switch.get():
+            self.streaming_mux_state_changed = True
+        else:
+            self.streaming_mux_state_changed = False
+        self.set_apply_button_state()
+
     def configure_values(self):
         self.download_path_entry.insert(0, GeneralSettings.settings["download_directory"])
 
@@ -339,6 +419,15 @@ class DownloadsPanel(ctk.CTkFrame):
             f"{ValueConvertUtility.convert_size(GeneralSettings.settings['chunk_size'], decimal_points=3)}",
         )
 
+        self.download_connections_change_slider.set(GeneralSettings.settings["download_connections"])
+        self.download_connections_value_label.configure(text=str(GeneralSettings.settings["download_connections"]))
+
+        if GeneralSettings.settings["streaming_mux"] and StreamingMuxer.is_supported():
+            self.streaming_mux_switch.select()
+            self.streaming_mux_switch_state.set(True)
+        else:
+            self.streaming_mux_switch_state.set(False)
+
     def bind_widgets_events(self):
         self.download_path_entry.bind("<KeyRelease>", self.download_path_validate)
         self.chunk_size_value_entry.bind("<KeyRelease>", self.validate_chunk_size_value)
@@ -410,6 +499,20 @@ class DownloadsPanel(ctk.CTkFrame):
 
         self.create_sep_path_for_playlists_switch.bind("<Enter>", on_mouse_enter_create_sep_path_for_playlists_switch)
         self.create_sep_path_for_playlists_switch.bind("<Leave>", on_mouse_leave_create_sep_path_for_playlists_switch)
+        # ---------------------------------------------------------------------------
+
+        def on_mouse_enter_streaming_mux_switch(event_):
+            self.streaming_mux_switch.configure(
+                button_color=ThemeManager.get_color_based_on_theme("secondary_hover"),
+            )
+
+        def on_mouse_leave_streaming_mux_switch(event_):
+            self.streaming_mux_switch.configure(
+                button_color=ThemeManager.get_color_based_on_theme("secondary"),
+            )
+
+        self.streaming_mux_switch.bind("<Enter>", on_mouse_enter_streaming_mux_switch)
+        self.streaming_mux_switch.bind("<Leave>", on_mouse_leave_streaming_mux_switch)
 
     def set_widgets_colors(self):
         self.configure(fg_color=ThemeManager.get_color_based_on_theme("background"))
@@ -477,6 +580,24 @@ class DownloadsPanel(ctk.CTkFrame):
             border_color=ThemeManager.get_color_based_on_theme("border"),
         )
 
+        self.download_connections_label.configure(text_color=ThemeManager.get_color_based_on_theme("text_normal"))
+        self.dash6_label.configure(text_color=ThemeManager.get_color_based_on_theme("text_normal"))
+        self.download_connections_change_slider.configure(
+            button_color=ThemeManager.get_color_based_on_theme("secondary"),
+            button_hover_color=ThemeManager.get_color_based_on_theme("secondary_hover"),
+            fg_color=ThemeManager.get_color_based_on_theme("primary"),
+        )
+        self.download_connections_value_label.configure(text_color=ThemeManager.get_color_based_on_theme("text_normal"))
+
+        self.streaming_mux_label.configure(text_color=ThemeManager.get_color_based_on_theme("text_normal"))
+        self.dash7_label.configure(text_color=ThemeManager.get_color_based_on_theme("text_normal"))
+        self.streaming_mux_switch.configure(
+            button_color=ThemeManager.get_color_based_on_theme("secondary"),
+            button_hover_color=ThemeManager.get_color_based_on_theme("secondary_hover"),
+            fg_color=ThemeManager.get_color_based_on_theme("primary"),
+        )
+        self.streaming_mux_info_label.configure(text_color=ThemeManager.get_color_based_on_theme("text_muted"))
+
         self.apply_changes_button.configure(
             text_color=ThemeManager.get_color_based_on_theme("background"),
         )
@@ -494,9 +615,13 @@ class DownloadsPanel(ctk.CTkFrame):
         self.create_sep_path_for_videos_audios_switch.configure(progress_color=ThemeManager.get_accent_color("normal"))
         self.create_sep_path_for_qualities_switch.configure(progress_color=ThemeManager.get_accent_color("normal"))
         self.create_sep_path_for_playlists_switch.configure(progress_color=ThemeManager.get_accent_color("normal"))
+        self.streaming_mux_switch.configure(progress_color=ThemeManager.get_accent_color("normal"))
         self.chunk_size_change_slider.configure(
             progress_color=ThemeManager.get_accent_color("normal"),
         )
+        self.download_connections_change_slider.configure(
+            progress_color=ThemeManager.get_accent_color("normal"),
+        )
 
         self.apply_changes_button.configure(
             fg_color=ThemeManager.get_accent_color("normal"),
@@ -541,12 +666,24 @@ class DownloadsPanel(ctk.CTkFrame):
         self.chunk_size_change_slider.grid(row=7, column=2, pady=(pady, 0), sticky="w")
         self.chunk_size_value_entry.grid(row=7, column=2, padx=(200 * scale, 0), pady=(pady, 0), sticky="w")
 
+        self.download_connections_label.grid(row=8, column=0, padx=(100, 0), pady=(pady, 0), sticky="w")
+        self.dash6_label.grid(row=8, column=1, padx=(30, 30), pady=(pady, 0), sticky="w")
+        self.download_connections_change_slider.grid(row=8, column=2, pady=(pady, 0), sticky="w")
+        self.download_connections_value_label.grid(row=8, column=2, padx=(200 * scale, 0), pady=(pady, 0), sticky="w")
+
+        self.streaming_mux_label.grid(row=9, column=0, padx=(100, 0), pady=(pady, 0), sticky="w")
+        self.dash7_label.grid(row=9, column=1, padx=(30, 30), pady=(pady, 0), sticky="w")
+        self.streaming_mux_switch.grid(row=9, column=2, padx=(0, 0), pady=(pady, 0), sticky="w")
+        self.streaming_mux_info_label.grid(
+            row=10, column=0, columnspan=4, padx=(100 + (20 * scale), 0), pady=(10, 0), sticky="w"
+        )
+
         self.apply_changes_button.grid(
-            row=8, column=2, columnspan=2, pady=(pady, 0), padx=(20 + 200 * scale, 0), sticky="w"
+            row=11, column=2, columnspan=2, pady=(pady, 0), padx=(20 + 200 * scale, 0), sticky="w"
         )
 
         self.settings_reset_button.grid(
-            row=9, column=2, columnspan=2, pady=(pady + 20 * scale, 0), padx=(20 + 200 * scale, 0), sticky="w"
+            row=12, column=2, columnspan=2, pady=(pady + 20 * scale, 0), padx=(20 + 200 * scale, 0), sticky="w"
         )
 
     def set_widgets_sizes(self):
@@ -558,8 +695,11 @@ class DownloadsPanel(ctk.CTkFrame):
         self.create_sep_path_for_videos_audios_switch.configure(switch_width=36 * scale, switch_height=18 * scale)
         self.create_sep_path_for_qualities_switch.configure(switch_width=36 * scale, switch_height=18 * scale)
         self.create_sep_path_for_playlists_switch.configure(switch_width=36 * scale, switch_height=18 * scale)
+        self.streaming_mux_switch.configure(switch_width=36 * scale, switch_height=18 * scale)
         self.chunk_size_change_slider.configure(width=180 * scale, height=18 * scale)
         self.chunk_size_value_entry.configure(width=80 * scale, height=24 * scale)
+        self.download_connections_change_slider.configure(width=180 * scale, height=18 * scale)
+        self.download_connections_value_label.configure(height=24 * scale)
 
         self.apply_changes_button.configure(width=80 * scale, height=24 * scale)
         self.settings_reset_button.configure(width=80 * scale, height=24 * scale)
@@ -583,6 +723,12 @@ class DownloadsPanel(ctk.CTkFrame):
             text=LanguageManager.data["playlist-specific_directories_info"]
         )
         self.chunk_size_label.configure(text=LanguageManager.data["chunk_size"])
+        self.download_connections_label.configure(text=LanguageManager.data["download_connections"])
+        self.streaming_mux_label.configure(text=LanguageManager.data["streaming_mux"])
+        if StreamingMuxer.is_supported():
+            self.streaming_mux_info_label.configure(text=LanguageManager.data["streaming_mux_info"])
+        else:
+            self.streaming_mux_info_label.configure(text=LanguageManager.data["streaming_mux_unsupported_info"])
         self.apply_changes_button.configure(text=LanguageManager.data["apply"])
         self.settings_reset_button.configure(text=LanguageManager.data["reset"])
 
@@ -603,6 +749,10 @@ class DownloadsPanel(ctk.CTkFrame):
         self.dash4_label.configure(font=title_font)
         self.chunk_size_label.configure(font=title_font)
         self.dash5_label.configure(font=title_font)
+        self.download_connections_label.configure(font=title_font)
+        self.dash6_label.configure(font=title_font)
+        self.streaming_mux_label.configure(font=title_font)
+        self.dash7_label.configure(font=title_font)
 
         value_font = ("Segoe UI", 13 * scale, "normal")
         self.download_path_entry.configure(font=value_font)
@@ -610,6 +760,8 @@ class DownloadsPanel(ctk.CTkFrame):
         self.create_sep_path_for_qualities_info_label.configure(font=value_font)
         self.create_sep_path_for_playlists_info_label.configure(font=value_font)
         self.chunk_size_value_entry.configure(font=value_font)
+        self.download_connections_value_label.configure(font=value_font)
+        self.streaming_mux_info_label.configure(font=value_font)
 
         button_font2 = ("Segoe UI", 30 * scale, "bold")
         self.download_path_choose_button.configure(font=button_font2)
@@ -3,7 +3,7 @@ from typing import Any
 
 import customtkinter as ctk
 
-from services import DownloadManager, LanguageManager, ThemeManager
+from services import AsyncDownloadEngine, BandwidthLimiter, DownloadManager, LanguageManager, ThemeManager
 from settings import AppearanceSettings, GeneralSettings
 from utils import SettingsValidateUtility
 
@@ -32,6 +32,16 @@ class NetworkPanel(ctk.CTkFrame):
             text="(1-10)",
         )
 
+        # Race a slow load against the next client in a spare load slot
+        self.hedged_loading_switch_state = ctk.BooleanVar(value=None)
+        self.hedged_loading_switch = ctk.CTkSwitch(
+            master=self,
+            command=self.change_hedged_loading,
+            onvalue=True,
+            offvalue=False,
+            variable=self.hedged_loading_switch_state,
+        )
+
         # ----------------------------------------------------------------------
         self.simultaneous_download_label = ctk.CTkLabel(
             master=self,
@@ -50,6 +60,16 @@ class NetworkPanel(ctk.CTkFrame):
             text="(1-10)",
         )
 
+        # Let the download manager pick the count from the measured throughput
+        self.simultaneous_download_auto_switch_state = ctk.BooleanVar(value=None)
+        self.simultaneous_download_auto_switch = ctk.CTkSwitch(
+            master=self,
+            command=self.change_simultaneous_download_auto,
+            onvalue=True,
+            offvalue=False,
+            variable=self.simultaneous_download_auto_switch_state,
+        )
+
         # ----------------------------------------------------------------------
         self.simultaneous_convert_label = ctk.CTkLabel(
             master=self,
@@ -167,6 +187,40 @@ class NetworkPanel(ctk.CTkFrame):
 
         # -------------------------------------------------------------
 
+        self.download_speed_limit_label = ctk.CTkLabel(
+            master=self,
+        )
+        self.dash9_label = ctk.CTkLabel(
+            master=self,
+            text=":",
+        )
+        self.download_speed_limit_entry = ctk.CTkEntry(
+            master=self,
+            justify="right",
+        )
+        self.download_speed_limit_unit_label = ctk.CTkLabel(
+            master=self,
+        )
+
+        # -------------------------------------------------------------
+
+        self.download_speed_limit_per_video_label = ctk.CTkLabel(
+            master=self,
+        )
+        self.dash10_label = ctk.CTkLabel(
+            master=self,
+            text=":",
+        )
+        self.download_speed_limit_per_video_entry = ctk.CTkEntry(
+            master=self,
+            justify="right",
+        )
+        self.download_speed_limit_per_video_unit_label = ctk.CTkLabel(
+            master=self,
+        )
+
+        # -------------------------------------------------------------
+
         self.apply_changes_button = ctk.CTkButton(
             master=self,
             state="disabled",
@@ -181,16 +235,22 @@ class NetworkPanel(ctk.CTkFrame):
         self.automatic_download_state_changed: bool = False
         self.automatic_download_quality_changed: bool = False
         self.simultaneous_download_count_changed: bool = False
+        self.simultaneous_download_auto_state_changed: bool = False
         self.simultaneous_convert_count_changed: bool = False
         self.simultaneous_load_count_changed: bool = False
+        self.hedged_loading_state_changed: bool = False
         self.load_thumbnail_state_changed: bool = False
         self.reload_automatically_state_changed: bool = False
         self.re_download_automatically_state_changed: bool = False
+        self.download_speed_limit_changed: bool = False
+        self.download_speed_limit_per_video_changed: bool = False
 
         # track values validity
         self.simultaneous_load_count_valid: bool = True
         self.simultaneous_download_count_valid: bool = True
         self.simultaneous_convert_count_valid: bool = True
+        self.download_speed_limit_valid: bool = True
+        self.download_speed_limit_per_video_valid: bool = True
 
         self.general_settings_change_callback = general_settings_change_callback
         self.set_widgets_accent_color()
@@ -208,6 +268,7 @@ class NetworkPanel(ctk.CTkFrame):
     def reset_settings(self):
         self.simultaneous_load_entry.delete(0, "end")
         self.simultaneous_load_entry.insert("end", 1)
+        self.hedged_loading_switch.deselect()
 
         self.simultaneous_download_entry.delete(0, "end")
         self.simultaneous_download_entry.insert("end", 1)
@@ -216,6 +277,8 @@ class NetworkPanel(ctk.CTkFrame):
         self.simultaneous_convert_entry.insert("end", 1)
 
         self.automatic_download_switch.deselect()
+        self.simultaneous_download_auto_switch.deselect()
+        self.simultaneous_download_entry.configure(state="normal")
 
         self.automatic_download_quality_combo_box.configure(state="normal")
         self.automatic_download_quality_combo_box.set("1080p")
@@ -225,28 +288,70 @@ class NetworkPanel(ctk.CTkFrame):
         self.reload_automatically_switch.deselect()
         self.re_download_automatically_switch.deselect()
 
+        self.download_speed_limit_entry.delete(0, "end")
+        self.download_speed_limit_entry.insert("end", 0)
+
+        self.download_speed_limit_per_video_entry.delete(0, "end")
+        self.download_speed_limit_per_video_entry.insert("end", 0)
+
         self.apply_network_settings()
 
     def apply_network_settings(self):
         GeneralSettings.settings["max_simultaneous_loads"] = int(self.simultaneous_load_entry.get())
+        GeneralSettings.settings["hedged_loading"] = self.hedged_loading_switch_state.get()
         GeneralSettings.settings["max_simultaneous_downloads"] = int(self.simultaneous_download_entry.get())
+        if (
+            GeneralSettings.settings["max_simultaneous_downloads_auto"]
+            != self.simultaneous_download_auto_switch_state.get()
+        ):
+            # Start probing from the manual count
+            DownloadManager.concurrency_controller.reset(GeneralSettings.settings["max_simultaneous_downloads"])
+        GeneralSettings.settings["max_simultaneous_downloads_auto"] = self.simultaneous_download_auto_switch_state.get()
         GeneralSettings.settings["max_simultaneous_converts"] = int(self.simultaneous_convert_entry.get())
         GeneralSettings.settings["automatic_download"]["status"] = self.automatic_download_switch_state.get()
         GeneralSettings.settings["automatic_download"]["quality"] = self.automatic_download_quality_combo_box.get()
         GeneralSettings.settings["load_thumbnail"] = self.load_thumbnail_switch_state.get()
         GeneralSettings.settings["reload_automatically"] = self.reload_automatically_switch_state.get()
         GeneralSettings.settings["re_download_automatically"] = self.re_download_automatically_switch_state.get()
+        # limits are entered in KB/s and stored in bytes/s
+        GeneralSettings.settings["download_speed_limit"] = int(self.download_speed_limit_entry.get()) * 1024
+        GeneralSettings.settings["download_speed_limit_per_video"] = (
+            int(self.download_speed_limit_per_video_entry.get()) * 1024
+        )
+        AsyncDownloadEngine.call_soon(BandwidthLimiter.refresh)
         self.general_settings_change_callback()
         self.apply_changes_button.configure(state="disabled")
 
         self.automatic_download_state_changed = False
         self.automatic_download_quality_changed = False
         self.simultaneous_download_count_changed = False
+        self.simultaneous_download_auto_state_changed = False
         self.simultaneous_load_count_changed = False
+        self.hedged_loading_state_changed = False
         self.simultaneous_convert_count_changed = False
         self.load_thumbnail_state_changed = False
         self.reload_automatically_state_changed = False
         self.re_download_automatically_state_changed = False
+        self.download_speed_limit_changed = False
+        self.download_speed_limit_per_video_changed = False
+
+    def change_hedged_loading(self):
+        if GeneralSettings.settings["hedged_loading"] != self.hedged_loading_switch.get():
+            self.hedged_loading_state_changed = True
+        else:
+            self.hedged_loading_state_changed = False
+        self.set_apply_button_state()
+
+    def change_simultaneous_download_auto(self):
+        if GeneralSettings.settings["max_simultaneous_downloads_auto"] != self.simultaneous_download_auto_switch.get():
+            self.simultaneous_download_auto_state_changed = True
+        else:
+            self.simultaneous_download_auto_state_changed = False
+        if self.simultaneous_download_auto_switch_state.get():
+            self.simultaneous_download_entry.configure(state="disabled")
+        else:
+            self.simultaneous_download_entry.configure(state="normal")
+        self.set_apply_button_state()
 
     def change_re_download_automatically(self):
         if GeneralSettings.settings["re_download_automatically"] != self.re_download_automatically_switch.get():
@@ -323,23 +428,53 @@ class NetworkPanel(ctk.CTkFrame):
             self.simultaneous_convert_count_valid = False
         self.set_apply_button_state()
 
+    def download_speed_limit_check(self, _event):
+        value = self.download_speed_limit_entry.get()
+        if SettingsValidateUtility.validate_speed_limit_value(value):
+            self.download_speed_limit_valid = True
+            if int(value) * 1024 != GeneralSettings.settings["download_speed_limit"]:
+                self.download_speed_limit_changed = True
+            else:
+                self.download_speed_limit_changed = False
+        else:
+            self.download_speed_limit_valid = False
+        self.set_apply_button_state()
+
+    def download_speed_limit_per_video_check(self, _event):
+        value = self.download_speed_limit_per_video_entry.get()
+        if SettingsValidateUtility.validate_speed_limit_value(value):
+            self.download_speed_limit_per_video_valid = True
+            if int(value) * 1024 != GeneralSettings.settings["download_speed_limit_per_video"]:
+                self.download_speed_limit_per_video_changed = True
+            else:
+                self.download_speed_limit_per_video_changed = False
+        else:
+            self.download_speed_limit_per_video_valid = False
+        self.set_apply_button_state()
+
     def set_apply_button_state(self):
         if any(
             (
                 self.simultaneous_download_count_changed,
+                self.simultaneous_download_auto_state_changed,
                 self.simultaneous_load_count_changed,
+                self.hedged_loading_state_changed,
                 self.automatic_download_state_changed,
                 self.automatic_download_quality_changed,
                 self.load_thumbnail_state_changed,
                 self.reload_automatically_state_changed,
                 self.re_download_automatically_state_changed,
                 self.simultaneous_convert_count_changed,
+                self.download_speed_limit_changed,
+                self.download_speed_limit_per_video_changed,
             )
         ) and all(
             (
                 self.simultaneous_load_count_valid,
                 self.simultaneous_download_count_valid,
                 self.simultaneous_convert_count_valid,
+                self.download_speed_limit_valid,
+                self.download_speed_limit_per_video_valid,
             )
         ):
             self.apply_changes_button.configure(state="normal")
@@ -350,6 +485,8 @@ class NetworkPanel(ctk.CTkFrame):
         self.simultaneous_load_entry.bind("<KeyRelease>", self.simultaneous_load_count_check)
         self.simultaneous_download_entry.bind("<KeyRelease>", self.simultaneous_download_count_check)
         self.simultaneous_convert_entry.bind("<KeyRelease>", self.simultaneous_convert_count_check)
+        self.download_speed_limit_entry.bind("<KeyRelease>", self.download_speed_limit_check)
+        self.download_speed_limit_per_video_entry.bind("<KeyRelease>", self.download_speed_limit_per_video_check)
 
         def on_mouse_enter_simultaneous_load_entry(event_):
             self.simultaneous_load_entry.configure(
@@ -463,12 +600,72 @@ class NetworkPanel(ctk.CTkFrame):
 
         self.re_download_automatically_switch.bind("<Enter>", on_mouse_enter_re_download_automatically_switch)
         self.re_download_automatically_switch.bind("<Leave>", on_mouse_leave_re_download_automatically_switch)
+        # ------------------------------------------------------------
+
+        def on_mouse_enter_simultaneous_download_auto_switch(event_):
+            self.simultaneous_download_auto_switch.configure(
+                button_color=ThemeManager.get_color_based_on_theme("secondary_hover"),
+            )
+
+        def on_mouse_leave_simultaneous_download_auto_switch(event_):
+            self.simultaneous_download_auto_switch.configure(
+                button_color=ThemeManager.get_color_based_on_theme("secondary"),
+            )
+
+        self.simultaneous_download_auto_switch.bind("<Enter>", on_mouse_enter_simultaneous_download_auto_switch)
+        self.simultaneous_download_auto_switch.bind("<Leave>", on_mouse_leave_simultaneous_download_auto_switch)
+        # ------------------------------------------------------------
+
+        def on_mouse_enter_hedged_loading_switch(event_):
+            self.hedged_loading_switch.configure(
+                button_color=ThemeManager.get_color_based_on_theme("secondary_hover"),
+            )
+
+        def on_mouse_leave_hedged_loading_switch(event_):
+            self.hedged_loading_switch.configure(
+                button_color=ThemeManager.get_color_based_on_theme("secondary"),
+            )
+
+        self.hedged_loading_switch.bind("<Enter>", on_mouse_enter_hedged_loading_switch)
+        self.hedged_loading_switch.bind("<Leave>", on_mouse_leave_hedged_loading_switch)
+        # ------------------------------------------------------------
+
+        def on_mouse_enter_download_speed_limit_entry(event_):
+            self.download_speed_limit_entry.configure(
+                fg_color=ThemeManager.get_color_based_on_theme("primary_hover"),
+            )
+
+        def on_mouse_leave_download_speed_limit_entry(event_):
+            self.download_speed_limit_entry.configure(
+                fg_color=ThemeManager.get_color_based_on_theme("primary"),
+            )
+
+        self.download_speed_limit_entry.bind("<Enter>", on_mouse_enter_download_speed_limit_entry)
+        self.download_speed_limit_entry.bind("<Leave>", on_mouse_leave_download_speed_limit_entry)
+        # ------------------------------------------------------------
+
+        def on_mouse_enter_download_speed_limit_per_video_entry(event_):
+            self.download_speed_limit_per_video_entry.configure(
+                fg_color=ThemeManager.get_color_based_on_theme("primary_hover"),
+            )
+
+        def on_mouse_leave_download_speed_limit_per_video_entry(event_):
+            self.download_speed_limit_per_video_entry.configure(
+                fg_color=ThemeManager.get_color_based_on_theme("primary"),
+            )
+
+        self.download_speed_limit_per_video_entry.bind("<Enter>", on_mouse_enter_download_speed_limit_per_video_entry)
+        self.download_speed_limit_per_video_entry.bind("<Leave>", on_mouse_leave_download_speed_limit_per_video_entry)
 
     # set default values to widgets
     def configure_values(self):
         self.simultaneous_load_entry.insert("end", GeneralSettings.settings["max_simultaneous_loads"])
         self.simultaneous_download_entry.insert("end", GeneralSettings.settings["max_simultaneous_downloads"])
         self.simultaneous_convert_entry.insert("end", GeneralSettings.settings["max_simultaneous_converts"])
+        self.download_speed_limit_entry.insert("end", GeneralSettings.settings["download_speed_limit"] // 1024)
+        self.download_speed_limit_per_video_entry.insert(
+            "end", GeneralSettings.settings["download_speed_limit_per_video"] // 1024
+        )
 
         self.automatic_download_quality_combo_box.set(GeneralSettings.settings["automatic_download"]["quality"])
 
@@ -479,6 +676,19 @@ class NetworkPanel(ctk.CTkFrame):
             self.automatic_download_switch_state.set("disable")
             self.automatic_download_quality_combo_box.configure(state="disabled")
 
+        if GeneralSettings.settings["max_simultaneous_downloads_auto"]:
+            self.simultaneous_download_auto_switch.select()
+            self.simultaneous_download_auto_switch_state.set(True)
+            self.simultaneous_download_entry.configure(state="disabled")
+        else:
+            self.simultaneous_download_auto_switch_state.set(False)
+
+        if GeneralSettings.settings["hedged_loading"]:
+            self.hedged_loading_switch.select()
+            self.hedged_loading_switch_state.set(True)
+        else:
+            self.hedged_loading_switch_state.set(False)
+
         if GeneralSettings.settings["load_thumbnail"]:
             self.load_thumbnail_switch.select()
             self.load_thumbnail_switch_state.set(True)
@@ -508,6 +718,14 @@ class NetworkPanel(ctk.CTkFrame):
             progress_color=ThemeManager.get_accent_color("normal"),
         )
 
+        self.simultaneous_download_auto_switch.configure(
+            progress_color=ThemeManager.get_accent_color("normal"),
+        )
+
+        self.hedged_loading_switch.configure(
+            progress_color=ThemeManager.get_accent_color("normal"),
+        )
+
         self.reload_automatically_switch.configure(
             progress_color=ThemeManager.get_accent_color("normal"),
         )
@@ -537,6 +755,12 @@ class NetworkPanel(ctk.CTkFrame):
         self.simultaneous_load_range_label.configure(
             text_color=ThemeManager.get_color_based_on_theme("text_muted"),
         )
+        self.hedged_loading_switch.configure(
+            button_color=ThemeManager.get_color_based_on_theme("secondary"),
+            button_hover_color=ThemeManager.get_color_based_on_theme("secondary_hover"),
+            fg_color=ThemeManager.get_color_based_on_theme("primary"),
+            text_color=ThemeManager.get_color_based_on_theme("text_normal"),
+        )
 
         self.simultaneous_download_label.configure(text_color=ThemeManager.get_color_based_on_theme("text_normal"))
         self.dash2_label.configure(text_color=ThemeManager.get_color_based_on_theme("text_normal"))
@@ -548,6 +772,12 @@ class NetworkPanel(ctk.CTkFrame):
         self.simultaneous_download_range_label.configure(
             text_color=ThemeManager.get_color_based_on_theme("text_muted"),
         )
+        self.simultaneous_download_auto_switch.configure(
+            button_color=ThemeManager.get_color_based_on_theme("secondary"),
+            button_hover_color=ThemeManager.get_color_based_on_theme("secondary_hover"),
+            fg_color=ThemeManager.get_color_based_on_theme("primary"),
+            text_color=ThemeManager.get_color_based_on_theme("text_normal"),
+        )
 
         self.simultaneous_convert_label.configure(text_color=ThemeManager.get_color_based_on_theme("text_normal"))
         self.dash3_label.configure(text_color=ThemeManager.get_color_based_on_theme("text_normal"))
@@ -601,6 +831,30 @@ class NetworkPanel(ctk.CTkFrame):
             fg_color=ThemeManager.get_color_based_on_theme("primary"),
         )
 
+        self.download_speed_limit_label.configure(text_color=ThemeManager.get_color_based_on_theme("text_normal"))
+        self.dash9_label.configure(text_color=ThemeManager.get_color_based_on_theme("text_normal"))
+        self.download_speed_limit_entry.configure(
+            text_color=ThemeManager.get_color_based_on_theme("text_normal"),
+            fg_color=ThemeManager.get_color_based_on_theme("primary"),
+            border_color=ThemeManager.get_color_based_on_theme("border"),
+        )
+        self.download_speed_limit_unit_label.configure(
+            text_color=ThemeManager.get_color_based_on_theme("text_muted"),
+        )
+
+        self.download_speed_limit_per_video_label.configure(
+            text_color=ThemeManager.get_color_based_on_theme("text_normal")
+        )
+        self.dash10_label.configure(text_color=ThemeManager.get_color_based_on_theme("text_normal"))
+        self.download_speed_limit_per_video_entry.configure(
+            text_color=ThemeManager.get_color_based_on_theme("text_normal"),
+            fg_color=ThemeManager.get_color_based_on_theme("primary"),
+            border_color=ThemeManager.get_color_based_on_theme("border"),
+        )
+        self.download_speed_limit_per_video_unit_label.configure(
+            text_color=ThemeManager.get_color_based_on_theme("text_muted"),
+        )
+
         self.apply_changes_button.configure(
             text_color=ThemeManager.get_color_based_on_theme("background"),
         )
@@ -622,11 +876,13 @@ class NetworkPanel(ctk.CTkFrame):
         self.dash1_label.grid(row=0, column=1, padx=(30, 30), pady=(50, 0), sticky="w")
         self.simultaneous_load_entry.grid(row=0, column=2, pady=(50, 0), sticky="w")
         self.simultaneous_load_range_label.grid(row=0, column=3, pady=(50, 0), padx=(20, 0), sticky="w")
+        self.hedged_loading_switch.grid(row=0, column=4, pady=(50, 0), padx=(20 * scale, 0), sticky="w")
 
         self.simultaneous_download_label.grid(row=1, column=0, padx=(100, 0), pady=(pady, 0), sticky="w")
         self.dash2_label.grid(row=1, column=1, padx=(30, 30), pady=(pady, 0), sticky="w")
         self.simultaneous_download_entry.grid(row=1, column=2, pady=(pady, 0), sticky="w")
         self.simultaneous_download_range_label.grid(row=1, column=3, pady=(pady, 0), padx=(20, 0), sticky="w")
+        self.simultaneous_download_auto_switch.grid(row=1, column=4, pady=(pady, 0), padx=(20 * scale, 0), sticky="w")
 
         self.simultaneous_convert_label.grid(row=2, column=0, padx=(100, 0), pady=(pady, 0), sticky="w")
         self.dash3_label.grid(row=2, column=1, padx=(30, 30), pady=(pady, 0), sticky="w")
@@ -656,9 +912,19 @@ class NetworkPanel(ctk.CTkFrame):
         self.dash8_label.grid(row=8, column=1, padx=(30, 30), pady=(pady, 0), sticky="w")
         self.re_download_automatically_switch.grid(row=8, column=2, pady=(pady, 0), sticky="w")
 
-        self.apply_changes_button.grid(row=9, column=3, pady=(pady, 0), sticky="w")
+        self.download_speed_limit_label.grid(row=9, column=0, padx=(100, 0), pady=(pady, 0), sticky="w")
+        self.dash9_label.grid(row=9, column=1, padx=(30, 30), pady=(pady, 0), sticky="w")
+        self.download_speed_limit_entry.grid(row=9, column=2, pady=(pady, 0), sticky="w")
+        self.download_speed_limit_unit_label.grid(row=9, column=3, pady=(pady, 0), padx=(20, 0), sticky="w")
+
+        self.download_speed_limit_per_video_label.grid(row=10, column=0, padx=(100, 0), pady=(pady, 0), sticky="w")
+        self.dash10_label.grid(row=10, column=1, padx=(30, 30), pady=(pady, 0), sticky="w")
+        self.download_speed_limit_per_video_entry.grid(row=10, column=2, pady=(pady, 0), sticky="w")
+        self.download_speed_limit_per_video_unit_label.grid(row=10, column=3, pady=(pady, 0), padx=(20, 0), sticky="w")
+
+        self.apply_changes_button.grid(row=11, column=3, pady=(pady, 0), sticky="w")
 
-        self.settings_reset_button.grid(row=9, column=4, pady=(pady, 0), padx=(20 * scale, 0), sticky="w")
+        self.settings_reset_button.grid(row=11, column=4, pady=(pady, 0), padx=(20 * scale, 0), sticky="w")
 
     def set_widgets_sizes(self):
         scale = AppearanceSettings.get_scale("decimal")
@@ -668,15 +934,21 @@ class NetworkPanel(ctk.CTkFrame):
         self.automatic_download_switch.configure(switch_width=36 * scale, switch_height=18 * scale)
         self.automatic_download_quality_combo_box.configure(width=140 * scale, height=28 * scale)
         self.load_thumbnail_switch.configure(switch_width=36 * scale, switch_height=18 * scale)
+        self.simultaneous_download_auto_switch.configure(switch_width=36 * scale, switch_height=18 * scale)
+        self.hedged_loading_switch.configure(switch_width=36 * scale, switch_height=18 * scale)
         self.reload_automatically_switch.configure(switch_width=36 * scale, switch_height=18 * scale)
         self.re_download_automatically_switch.configure(switch_width=36 * scale, switch_height=18 * scale)
+        self.download_speed_limit_entry.configure(width=140 * scale, height=28 * scale)
+        self.download_speed_limit_per_video_entry.configure(width=140 * scale, height=28 * scale)
         self.apply_changes_button.configure(width=80 * scale, height=24 * scale)
 
         self.settings_reset_button.configure(width=80 * scale, height=24 * scale)
 
     def set_widgets_texts(self):
         self.simultaneous_load_label.configure(text=LanguageManager.data["maximum_simultaneous_loads"])
+        self.hedged_loading_switch.configure(text=LanguageManager.data["hedge_slow_loads"])
         self.simultaneous_download_label.configure(text=LanguageManager.data["maximum_simultaneous_downloads"])
+        self.simultaneous_download_auto_switch.configure(text=LanguageManager.data["auto_adjust"])
         self.simultaneous_convert_label.configure(text=LanguageManager.data["maximum_simultaneous_converts"])
         self.automatic_download_label.configure(text=LanguageManager.data["automatic_video/playlist_download"])
         self.automatic_download_quality_label.configure(text=LanguageManager.data["download_quality"])
@@ -684,6 +956,10 @@ class NetworkPanel(ctk.CTkFrame):
         self.load_thumbnail_label.configure(text=LanguageManager.data["load_video_thumbnail"])
         self.reload_automatically_label.configure(text=LanguageManager.data["auto-reload_failed_videos"])
         self.re_download_automatically_label.configure(text=LanguageManager.data["auto-re-download_failed_videos"])
+        self.download_speed_limit_label.configure(text=LanguageManager.data["download_speed_limit"])
+        self.download_speed_limit_unit_label.configure(text=LanguageManager.data["speed_limit_unit"])
+        self.download_speed_limit_per_video_label.configure(text=LanguageManager.data["download_speed_limit_per_video"])
+        self.download_speed_limit_per_video_unit_label.configure(text=LanguageManager.data["speed_limit_unit"])
         self.apply_changes_button.configure(text=LanguageManager.data["apply"])
         self.settings_reset_button.configure(text=LanguageManager.data["reset"])
 
@@ -709,13 +985,23 @@ class NetworkPanel(ctk.CTkFrame):
         self.dash7_label.configure(font=title_font)
         self.re_download_automatically_label.configure(font=title_font)
         self.dash8_label.configure(font=title_font)
+        self.download_speed_limit_label.configure(font=title_font)
+        self.dash9_label.configure(font=title_font)
+        self.download_speed_limit_per_video_label.configure(font=title_font)
+        self.dash10_label.configure(font=title_font)
 
         value_font = ("Segoe UI", 13 * scale, "normal")
         self.simultaneous_download_range_label.configure(font=value_font)
         self.simultaneous_load_range_label.configure(font=value_font)
+        self.simultaneous_download_auto_switch.configure(font=value_font)
+        self.hedged_loading_switch.configure(font=value_font)
         self.simultaneous_download_entry.configure(font=value_font)
         self.simultaneous_load_entry.configure(font=value_font)
         self.simultaneous_convert_entry.configure(font=value_font)
+        self.download_speed_limit_entry.configure(font=value_font)
+        self.download_speed_limit_unit_label.configure(font=value_font)
+        self.download_speed_limit_per_video_entry.configure(font=value_font)
+        self.download_speed_limit_per_video_unit_label.configure(font=value_font)
         self.automatic_download_info_label.configure(font=value_font)
         self.automatic_download_quality_combo_box.configure(font=value_font, dropdown_font=value_font)
 
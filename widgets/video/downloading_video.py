@@ -1,28 +1,39 @@
+import asyncio
+import functools
 import os
 import re
 import subprocess
 import sys
 import threading
 import time
+from collections.abc import AsyncIterator, Hashable
 from tkinter import PhotoImage
 from typing import Literal
 
 import customtkinter as ctk
-from pytubefix import request as pytube_request
 
 from services import (
+    AsyncDownloadEngine,
+    DownloadJournal,
     DownloadManager,
     LanguageManager,
+    MetadataCache,
     NotificationManager,
+    ProgressUpdater,
+    SegmentedDownloader,
+    StreamingMuxer,
     ThemeManager,
+    TickScheduler,
+    TokenBucket,
     VideoConvertManager,
     VideoCountTracker,
+    VideoRecord,
 )
 from settings import (
     AppearanceSettings,
     GeneralSettings,
 )
-from utils import DownloadInfoUtility, FileUtility, GuiUtils, ValueConvertUtility
+from utils import DownloadInfoUtility, FileUtility, GuiUtils, MergePlanUtility, ValueConvertUtility
 from utils.logger import get_logger
 from widgets.video.video import Video
 
@@ -63,6 +74,8 @@ class DownloadingVideo(Video):
         playlist_title: str = None,
         video_download_status_callback: callable = None,
         video_download_progress_callback: callable = None,
+        # queue group shared by the videos of a playlist, for fair scheduling between playlists
+        queue_group: Hashable | None = None,
     ):
 
         # download status track and callback
@@ -70,7 +83,10 @@ class DownloadingVideo(Video):
             "waiting"
         )
         self.pause_requested: bool = False
-        self.pause_resume_btn_command: Literal["pause", "resume"] = "pause"
+        # downloaders of the transfer in progress, only used on the download engine loop
+        self.active_downloaders: list[SegmentedDownloader] = []
+        # when the download was last resumed, time spent paused is not download time
+        self.resume_time: float = 0.0
         # status and progress callbacks
         self.video_download_complete_callback: callable = video_download_complete_callback
         self.video_download_status_callback: callable = video_download_status_callback
@@ -83,6 +99,9 @@ class DownloadingVideo(Video):
         # download mode
         self.playlist_title: str = playlist_title
         self.mode: Literal["video", "playlist"] = mode
+        self.queue_group: Hashable | None = queue_group
+        # raised by "download next", kept when the video is queued again
+        self.priority: int = 0
         # widgets
         self.sub_frame: ctk.CTkFrame | None = None
         self.download_progress_bar: ctk.CTkProgressBar | None = None
@@ -109,10 +128,19 @@ class DownloadingVideo(Video):
         self.audio_only_file_name: str = ""
         self.video_only_file_name: str = ""
         self.total_bytes_downloaded: int = 0
+        # part of total_bytes_downloaded kept on disk from earlier attempts, shown as progress
+        # but left out of the speed and ETA as no download time was spent on it here
+        self.resumed_bytes: int = 0
         self.converted_file_name: str = ""
+        # container and audio handling used to merge adaptive streams, see MergePlanUtility
+        self.merge_plan: dict[str, str] = MergePlanUtility.get_merge_plan(None, None)
+        # Set once merging while downloading failed, later attempts use temporary files instead
+        self.streaming_mux_failed: bool = False
 
         # download speed
         self.total_download_time: int = 0
+        # speed of the last chunk, shown with the next progress frame
+        self.net_speed: float = 0
 
         super().__init__(
             root=root,
@@ -134,21 +162,45 @@ class DownloadingVideo(Video):
         self.set_video_data()
         self.set_waiting()
         VideoCountTracker.add_downloading_video()
-        DownloadManager.register(self)
+        DownloadManager.register(self, priority=self.priority, group=self.queue_group)
 
     def download_video(self):
         """
         Start the video download process.
         """
         self.total_download_time = 0
+        self.download_type_label.configure(text=f"{self.download_quality}")
+        self.file_size = self.download_type_info["size"]
+        self.converted_file_size = ValueConvertUtility.convert_size(self.file_size, 2)
         self.set_downloading_progress()
-        threading.Thread(target=self.configure_downloading, daemon=True).start()
         self.set_pause_btn()
         self.pause_resume_btn.place(rely=0.5, anchor="w", relx=1, x=-80 * AppearanceSettings.get_scale("decimal"))
         self.download_state = "downloading"
         if self.mode == "playlist":
             self.video_download_status_callback(self, self.download_state)
         self.display_status()
+        # The transfer runs as a task on the shared download loop instead of its own thread
+        AsyncDownloadEngine.submit(self.configure_downloading())
+
+    def get_context_menu_options(self) -> tuple[list[str], list]:
+        options_texts, options_commands = super().get_context_menu_options()
+        return [*options_texts, "download_next"], [*options_commands, self.download_next]
+
+    def open_context_menu(self, event):
+        # Only a download waiting in the queue can be moved to its front
+        self.context_menu.set_option_state("download_next", "normal" if DownloadManager.is_queued(self) else "disabled")
+        super().open_context_menu(event)
+
+    def download_next(self):
+        """
+        Start the video before the other queued downloads, also if it is queued again later.
+        """
+        self.close_context_menu_directly("event")
+        # Started since the menu was opened
+        if not DownloadManager.is_queued(self):
+            return
+        self.priority = DownloadManager.download_next_priority
+        DownloadManager.move_to_front(self)
 
     def re_download_video(self):
         """
@@ -156,7 +208,7 @@ class DownloadingVideo(Video):
         """
         self.re_download_btn.place_forget()
         self.set_waiting()
-        DownloadManager.register(self)
+        DownloadManager.register(self, priority=self.priority, group=self.queue_group)
 
     def re_convert_video(self):
         """
@@ -164,7 +216,7 @@ class DownloadingVideo(Video):
         """
         self.re_download_btn.place_forget()
         self.set_waiting()
-        VideoConvertManager.register(self)
+        VideoConvertManager.register(self, group=self.queue_group)
 
     def display_status(self):
         """
@@ -189,13 +241,9 @@ class DownloadingVideo(Video):
 
         self.status_label.configure(text=LanguageManager.data[self.download_state])
 
-    def configure_downloading(self):
+    async def configure_downloading(self):
         # print("Configure Downloading : configure_downloading()")
-        self.download_type_label.configure(text=f"{self.download_quality}")
-        self.file_size = self.download_type_info["size"]
-        self.converted_file_size = ValueConvertUtility.convert_size(self.file_size, 2)
         self.download_file_name = FileUtility.get_available_file_name(self.download_file_name)
-        self.set_downloading_progress()
 
         self.download_directory = GeneralSettings.settings["download_directory"]
 
@@ -228,202 +276,411 @@ class DownloadingVideo(Video):
 
         try:
             while self.download_state == "downloading":
-                self.set_download_files_info()
+                await self.set_download_files_info()
         except Exception as error:
             _log.error("configure_downloading loop error: %s", error)
 
     def set_for_converting(self):
-        self.estimated_remaining_time_label.place_forget()
+        """
+        Queue the downloaded streams to be merged, runs on the download engine loop.
+        """
         DownloadManager.unregister_from_active(self)
+        # Ends the download loop right away, the widgets change on the Tk thread
+        self.download_state = "waiting"
+        TickScheduler.call_soon(self.show_queued_for_converting)
 
+    def show_queued_for_converting(self):
+        if self.download_state != "waiting":
+            return
+        self.estimated_remaining_time_label.place_forget()
         self.set_waiting()
-        VideoConvertManager.register(self)
+        VideoConvertManager.register(self, group=self.queue_group)
         self.net_speed_label.place_forget()
         self.download_progress_label.place_forget()
 
         self.pause_resume_btn.place_forget()
 
-    def set_download_files_info(self):
+    def show_eta_label(self):
+        if self.estimated_remaining_time_label is not None:
+            self.estimated_remaining_time_label.place(relx=0.8, anchor="center", rely=0.2)
+
+    async def set_download_files_info(self):
         """
         Download the video.
         """
 
+        # (stream, file name, download type) of every stream still to download
+        downloads = []
         try:
-            if self.download_type_info["type"] == "video" and not self.video_download_completed:
-                if not self.download_type_info["inbuilt_audio"]:
-                    self.video_only_file_name = FileUtility.get_available_file_name(
-                        os.path.join(self.download_directory, "video.pytubetemp")
+            if self.video_stream_data is None:
+                # The video was loaded from the metadata cache, stream urls are only fetched now
+                await self.fetch_stream_data()
+            if self.download_type_info["type"] == "video" and self.download_type_info["inbuilt_audio"]:
+                if not self.video_download_completed:
+                    video_stream = self.find_video_stream()
+                    self.download_file_name = self.get_download_file_path(
+                        self.download_file_name + ".mp4", video_stream
                     )
-                    current_download_file_name = self.video_only_file_name
-                    current_download_type = "video_only"
-                else:
-                    self.download_file_name = FileUtility.get_available_file_name(self.download_file_name + ".mp4")
-                    current_download_file_name = self.download_file_name
-                    current_download_type = "video"
-                current_stream = self.video_stream_data.get_by_itag(self.download_type_info["itag"])
-
-            elif self.download_type_info["type"] == "video" and self.video_download_completed:
+                    downloads.append((video_stream, self.download_file_name, "video"))
+
+            elif self.download_type_info["type"] == "video":
+                video_stream = self.find_video_stream()
+                audio_stream = self.video_stream_data.get_audio_only()
+                self.merge_plan = MergePlanUtility.get_merge_plan(video_stream.video_codec, audio_stream.audio_codec)
+
+                if (
+                    GeneralSettings.settings["streaming_mux"]
+                    and not self.streaming_mux_failed
+                    and StreamingMuxer.is_supported()
+                    and not self.video_download_completed
+                    and not self.audio_for_video_download_completed
+                ):
+                    await self.stream_and_mux(video_stream, audio_stream)
+                    return
+
+                # Adaptive streams, the video and audio tracks are downloaded at the same time
+                if not self.video_download_completed:
+                    self.video_only_file_name = self.get_download_file_path(
+                        os.path.join(self.download_directory, "video.pytubetemp"), video_stream
+                    )
+                    downloads.append((video_stream, self.video_only_file_name, "video_only"))
                 if not self.audio_for_video_download_completed:
-                    self.audio_only_file_name = FileUtility.get_available_file_name(
-                        os.path.join(self.download_directory, "audio.pytubetemp")
+                    self.audio_only_file_name = self.get_download_file_path(
+                        os.path.join(self.download_directory, "audio.pytubetemp"), audio_stream
                     )
-                    current_download_file_name = self.audio_only_file_name
-                    current_stream = self.video_stream_data.get_audio_only()
-                    current_download_type = "audio_for_video"
+                    downloads.append((audio_stream, self.audio_only_file_name, "audio_for_video"))
 
             elif self.download_type_info["type"] == "audio" and not self.audio_download_completed:
-                self.download_file_name = FileUtility.get_available_file_name(self.download_file_name + ".mp3")
-                current_download_file_name = self.download_file_name
-                current_stream = self.video_stream_data.get_audio_only()
-                current_download_type = "audio"
+                audio_stream = self.video_stream_data.get_audio_only()
+                self.download_file_name = self.get_download_file_path(self.download_file_name + ".mp3", audio_stream)
+                downloads.append((audio_stream, self.download_file_name, "audio"))
 
         except Exception as error:
             _log.error("set_download_files_info failed: %s", error)
+            for _download_stream, download_file_name, _download_type in downloads:
+                DownloadJournal.release_path(download_file_name)
             self.set_downloading_failed()
             return
 
-        if (
-            self.download_type_info["type"] == "video"
-            and self.video_download_completed
-            and self.audio_for_video_download_completed
-            and not self.download_type_info["inbuilt_audio"]
-        ):
+        if downloads:
+            await self.download_files(downloads)
+        elif self.download_type_info["type"] == "video" and not self.download_type_info["inbuilt_audio"]:
             self.set_for_converting()
-
-        if (
-            self.download_type_info["type"] == "video"
-            and self.video_download_completed
-            and self.download_type_info["inbuilt_audio"]
-            or self.download_type_info["type"] == "audio"
-            and self.audio_download_completed
-        ):
+        else:
             self.set_downloading_completed()
 
-        elif (
-            (self.download_type_info["type"] == "audio" and not self.audio_download_completed)
-            or (
-                self.download_type_info["type"] == "video"
-                and not self.video_download_completed
-                and self.download_type_info["inbuilt_audio"]
-            )
-            or (
-                self.download_type_info["type"] == "video"
-                and not self.video_download_completed
-                or self.download_type_info["type"] == "video"
-                and not self.download_type_info["inbuilt_audio"]
-                and not self.audio_for_video_download_completed
-            )
-        ):
-            self.download_file(
-                download_stream=current_stream,
-                download_file_name=current_download_file_name,
-                download_file_size=current_stream.filesize,
-                download_type=current_download_type,
-            )
+    async def fetch_stream_data(self):
+        """
+        Fetch the streams of the video, trying the clients like loading it does.
+        """
+        data = await asyncio.to_thread(
+            VideoRecord.fetch_data, self.video_url, lambda: self.download_state != "downloading"
+        )
+        self.video_stream_data = data["video_stream_data"]
 
-    def download_file(
-        self,
-        download_stream,
-        download_file_name: str,
-        download_file_size: int,
-        download_type: Literal["audio", "video", "video_only", "audio_for_video"] = None,
-    ):
-        # store current download status if need to rollback to previous status
-        if self.estimated_remaining_time_label is not None:
-            self.estimated_remaining_time_label.place(relx=0.8, anchor="center", rely=0.2)
+    def find_video_stream(self):
+        """
+        Get the video stream of the chosen download type.
+
+        Streams fetched with another client than the one the video was loaded with may have
+        other itags, the download type is then moved to a stream of the same resolution.
+        """
+        video_stream = DownloadInfoUtility.find_video_stream(self.video_stream_data, self.download_type_info)
+        if int(video_stream.itag) != int(self.download_type_info["itag"]):
+            size = video_stream.filesize
+            if not self.download_type_info["inbuilt_audio"]:
+                size += self.video_stream_data.get_audio_only().filesize
+            self.download_type_info = {**self.download_type_info, "itag": str(video_stream.itag), "size": size}
+            self.file_size = size
+            self.converted_file_size = ValueConvertUtility.convert_size(self.file_size, 2)
+        return video_stream
+
+    def get_video_id(self) -> str:
+        """The id the download journals of the video are matched by."""
+        return MetadataCache.get_video_id(self.video_url) or self.video_url
+
+    def get_download_file_path(self, file_path: str, stream) -> str:
+        """
+        Return the path of a partial download of this stream if there is one, otherwise a free file name.
+
+        The path is claimed for this download right away, see ``DownloadJournal.release_path``.
+        """
+        resumable_file_path = DownloadJournal.find_resumable(
+            file_path, self.get_video_id(), stream.itag, stream.filesize, acquire=True
+        )
+        if resumable_file_path is not None:
+            return resumable_file_path
+        return DownloadJournal.acquire_available_path(file_path)
+
+    def set_download_completed(self, download_type: Literal["audio", "video", "video_only", "audio_for_video"]):
+        """
+        Mark a single stream of the job as downloaded.
+        """
+        if download_type == "audio":
+            self.audio_download_completed = True
+        elif download_type == "video":
+            self.video_download_completed = True
+            self.audio_for_video_download_completed = True
+        elif download_type == "video_only":
+            self.video_download_completed = True
+        elif download_type == "audio_for_video":
+            self.audio_for_video_download_completed = True
+
+    async def download_files(self, downloads: list[tuple]):
+        """
+        Download one or more streams at the same time.
+
+        Progress of all streams is combined into ``bytes_downloaded`` and ``total_bytes_downloaded``.
+
+        Args:
+            downloads (list[tuple]): The (stream, file name, download type) of each stream to download.
+        """
+        TickScheduler.call_soon(self.show_eta_label)
 
         self.bytes_downloaded = 0
         self.download_time = 0
+        # Every stream reports into the same queue so one loop can follow all of them
+        progress_queue = asyncio.Queue()
+        # The speed limit per download covers all of its streams together
+        download_bucket = TokenBucket()
+        journals = []
+        downloaders = []
+        video_id = self.get_video_id()
+        for download_stream, download_file_name, _download_type in downloads:
+            journal = None
+            if download_stream.filesize > 0:
+                journal = DownloadJournal.load(
+                    download_file_name, video_id, download_stream.itag, download_stream.filesize
+                ) or DownloadJournal(download_file_name, video_id, download_stream.itag, download_stream.filesize)
+                journals.append(journal)
+            downloaders.append(
+                SegmentedDownloader(
+                    url=download_stream.url,
+                    file_path=download_file_name,
+                    file_size=download_stream.filesize,
+                    connections=GeneralSettings.settings["download_connections"],
+                    chunk_size=GeneralSettings.settings["chunk_size"],
+                    journal=journal,
+                    progress_queue=progress_queue,
+                    download_bucket=download_bucket,
+                )
+            )
+        download_files_size = sum(download_stream.filesize for download_stream, _, _ in downloads)
+
+        failed = False
+        attempt_resumed_bytes = 0
         try:
-            with open(download_file_name, "wb") as self.downloading_file:
-                stream = pytube_request.stream(download_stream.url)
-                while 1:
-                    try:
-                        if self.pause_requested:
-                            if self.pause_resume_btn_command != "resume":
-                                self.pause_resume_btn.configure(command=self.resume_downloading)
-                                self.download_state = "paused"
-                                if self.mode == "playlist":
-                                    self.video_download_status_callback(self, self.download_state)
-                                self.display_status()
-                                self.set_resume_btn()
-                                self.pause_resume_btn_command = "resume"
-                            time.sleep(0.3)
-                            continue
-
-                        time_s = time.time()
-                        self.download_state = "downloading"
-                        self.pause_resume_btn_command = "pause"
-                        chunk = next(stream, None)
-                        time_e = time.time()
-                        if chunk:
-                            self.downloading_file.write(chunk)
-                            # Calculate running time
-                            self.total_download_time += time_e - time_s
-                            self.download_time += time_e - time_s
-
-                            if self.net_speed_label is not None:
-                                self.net_speed_label.configure(
-                                    text=ValueConvertUtility.convert_size(len(chunk) / (time_e - time_s), 1) + "/s"
-                                )
-                            self.bytes_downloaded += len(chunk)
-                            self.total_bytes_downloaded += len(chunk)
-
-                            self.set_downloading_progress()
-                        else:
-                            if self.bytes_downloaded == download_file_size:
-                                if download_type == "audio":
-                                    self.audio_download_completed = True
-                                elif download_type == "video":
-                                    self.video_download_completed = True
-                                    self.audio_for_video_download_completed = True
-                                elif download_type == "video_only":
-                                    self.video_download_completed = True
-                                elif download_type == "audio_for_video":
-                                    self.audio_for_video_download_completed = True
-                                break
-                            else:
-                                self.total_bytes_downloaded -= self.bytes_downloaded
-                                self.total_download_time -= self.download_time
-                                self.set_downloading_failed()
-                                break
-
-                    except Exception as error:
-                        _log.error("chunk write error: %s", error)
-                        self.total_bytes_downloaded -= self.bytes_downloaded
-                        self.total_download_time -= self.download_time
-                        self.set_downloading_failed()
-                        break
+            for downloader in downloaders:
+                downloader.start()
+                # Bytes kept from a previous attempt count as downloaded straight away
+                self.bytes_downloaded += downloader.resumed_bytes
+                self.total_bytes_downloaded += downloader.resumed_bytes
+                self.resumed_bytes += downloader.resumed_bytes
+                attempt_resumed_bytes += downloader.resumed_bytes
+            ProgressUpdater.publish(self)
+            if self.mode == "playlist":
+                self.video_download_progress_callback(self)
+            if await self.follow_download_progress(downloaders, download_files_size):
+                for journal in journals:
+                    journal.delete()
+                for _download_stream, _download_file_name, download_type in downloads:
+                    self.set_download_completed(download_type)
+            else:
+                failed = True
 
         except Exception as error:
-            _log.error("download_file open/stream error: %s", error)
+            _log.error("download_files open/stream error: %s", error)
+            failed = True
+        finally:
+            for downloader in downloaders:
+                downloader.cancel()
+            # Claimed by get_download_file_path
+            for _download_stream, download_file_name, _download_type in downloads:
+                DownloadJournal.release_path(download_file_name)
+
+        # Only report the failure once the files are released, a retry may resume them straight away
+        if failed:
+            # The retry counts the bytes on disk as resumed again
+            self.resumed_bytes -= attempt_resumed_bytes
             self.set_downloading_failed()
 
-    def converting(self):
-        self.download_file_name = FileUtility.get_available_file_name(self.download_file_name + ".mp4")
+    async def follow_download_progress(self, downloaders: list[SegmentedDownloader], download_files_size: int) -> bool:
+        """
+        Track started downloaders until they finish, handling pause requests and progress updates.
+
+        Args:
+            downloaders (list[SegmentedDownloader]): Started downloaders sharing one progress queue.
+            download_files_size (int): The number of bytes expected in ``bytes_downloaded`` once they are done.
+
+        Returns:
+            bool: True if every downloader finished without errors, False otherwise.
+        """
+        progress = SegmentedDownloader.iter_combined_progress(downloaders)
+        self.active_downloaders = downloaders
+        # A pause requested while the streams were looked up applies now
+        self.apply_pause()
+        try:
+            return await self.drain_download_progress(progress, downloaders, download_files_size)
+        finally:
+            self.active_downloaders = []
+
+    async def drain_download_progress(
+        self,
+        progress: AsyncIterator[tuple[int, float]],
+        downloaders: list[SegmentedDownloader],
+        download_files_size: int,
+    ) -> bool:
+        """
+        Count the progress events of the downloaders until they are exhausted.
+
+        While paused the workers make no requests, so this simply waits for the next chunk.
+        """
+        while 1:
+            try:
+                time_s = time.time()
+                chunk = await anext(progress, None)
+                time_e = time.time()
+                # Only count the time since the last resume if the download was paused meanwhile
+                time_s = max(time_s, self.resume_time)
+                if chunk:
+                    chunk_size, _request_time = chunk
+                    # Calculate running time
+                    self.total_download_time += time_e - time_s
+                    self.download_time += time_e - time_s
+
+                    self.net_speed = chunk_size / max(time_e - time_s, 1e-6)
+                    self.bytes_downloaded += chunk_size
+                    self.total_bytes_downloaded += chunk_size
+
+                    # Only the counters change per chunk, the widgets are rendered once per frame
+                    ProgressUpdater.publish(self)
+                    if self.mode == "playlist":
+                        self.video_download_progress_callback(self)
+                elif (
+                    all(downloader.error is None for downloader in downloaders)
+                    and self.bytes_downloaded == download_files_size
+                ):
+                    return True
+                else:
+                    self.total_bytes_downloaded -= self.bytes_downloaded
+                    self.total_download_time -= self.download_time
+                    return False
+
+            except Exception as error:
+                _log.error("chunk write error: %s", error)
+                self.total_bytes_downloaded -= self.bytes_downloaded
+                self.total_download_time -= self.download_time
+                return False
+
+    async def stream_and_mux(self, video_stream, audio_stream):
+        """
+        Download the adaptive streams straight into ffmpeg instead of temporary files.
+
+        The merge finishes together with the download, so the job skips the convert queue.
+        """
+        TickScheduler.call_soon(self.show_eta_label)
 
+        self.bytes_downloaded = 0
+        self.download_time = 0
         self.converted_file_name = FileUtility.get_available_file_name(
-            os.path.join(GeneralSettings.settings["download_directory"], "temp-converting.mp4")
+            os.path.join(
+                GeneralSettings.settings["download_directory"], f"temp-converting.{self.merge_plan['container']}"
+            )
         )
+        muxer = StreamingMuxer(input_count=2)
+        muxer.open_inputs()
+        progress_queue = asyncio.Queue()
+        download_bucket = TokenBucket()
+        downloaders = [
+            SegmentedDownloader(
+                url=stream.url,
+                file_path=self.converted_file_name,
+                file_size=stream.filesize,
+                chunk_size=GeneralSettings.settings["chunk_size"],
+                progress_queue=progress_queue,
+                sink=sink,
+                download_bucket=download_bucket,
+            )
+            for stream, sink in zip((video_stream, audio_stream), muxer.inputs, strict=True)
+        ]
+
+        failed = False
+        try:
+            muxer.start(self.get_merge_command(*muxer.input_urls, self.converted_file_name))
+            for downloader in downloaders:
+                downloader.start()
+            if await self.follow_download_progress(downloaders, video_stream.filesize + audio_stream.filesize):
+                # Closing flushes the pipes, which waits for ffmpeg to read them
+                await asyncio.to_thread(muxer.close_inputs)
+                # ffmpeg may still be writing the end of the file, nothing is left to pause
+                self.download_state = "converting"
+                TickScheduler.call_soon(self.show_converting)
+                while muxer.is_running():
+                    progress = muxer.get_progress_percentage(self.length)
+                    TickScheduler.call_soon(functools.partial(self.set_convert_progress, progress))
+                    await asyncio.sleep(0.3)
+                # Waited for off the loop, the other downloads keep going meanwhile
+                if await asyncio.to_thread(muxer.wait) == 0:
+                    TickScheduler.call_soon(functools.partial(self.set_convert_progress, 100))
+                else:
+                    self.total_bytes_downloaded -= self.bytes_downloaded
+                    self.total_download_time -= self.download_time
+                    failed = True
+            else:
+                failed = True
+
+        except Exception as error:
+            _log.error("stream_and_mux error: %s", error)
+            failed = True
+        finally:
+            muxer.kill()
+            for downloader in downloaders:
+                downloader.cancel()
+
+        if failed:
+            self.streaming_mux_failed = True
+            try:
+                os.remove(self.converted_file_name)
+            except Exception as error:
+                _log.warning("remove streaming mux output failed: %s", error)
+            self.set_downloading_failed()
+            return
+
+        self.video_download_completed = True
+        self.audio_for_video_download_completed = True
+        self.rename_to_original_name()
+        self.set_downloading_completed()
+
+    def get_merge_command(self, video_input: str, audio_input: str, output: str) -> list[str]:
+        """
+        Build the ffmpeg command that merges a video-only and an audio-only input.
 
-        command = [
+        Codecs are copied whenever ``merge_plan`` allows it.
+        """
+        return [
             VideoConvertManager.FFMPEG_PATH,
             "-i",
-            self.video_only_file_name,
+            video_input,
             "-i",
-            self.audio_only_file_name,
+            audio_input,
             "-map",
             "0:v:0",  # Map the video stream from the first input (video file)
             "-map",
             "1:a:0",  # Map the audio stream from the second input (audio file)
-            "-c:v",
-            "copy",
-            "-c:a",
-            "aac",
-            self.converted_file_name,
+            *MergePlanUtility.get_codec_arguments(self.merge_plan),
+            output,
             "-y",  # Overwrite the output file if it exists
         ]
 
+    def converting(self):
+        self.converted_file_name = FileUtility.get_available_file_name(
+            os.path.join(
+                GeneralSettings.settings["download_directory"], f"temp-converting.{self.merge_plan['container']}"
+            )
+        )
+
+        command = self.get_merge_command(self.video_only_file_name, self.audio_only_file_name, self.converted_file_name)
+
         try:
             # Start the process
             process = subprocess.Popen(
@@ -494,11 +751,51 @@ class DownloadingVideo(Video):
         """
         Pause the downloading process.
         """
+        # The merge that finishes a streaming download may have started meanwhile
+        if self.download_state != "downloading":
+            return
 
         self.pause_resume_btn.configure(command=GuiUtils.do_nothing)
         self.download_state = "pausing"
         self.display_status()
         self.pause_requested = True
+        AsyncDownloadEngine.call_soon(self.apply_pause)
+
+    def apply_pause(self):
+        """
+        Pause the active downloaders, runs on the download engine loop.
+        """
+        if not self.pause_requested or self.download_state != "pausing" or not self.active_downloaders:
+            return
+        for downloader in self.active_downloaders:
+            downloader.pause()
+        self.download_state = "paused"
+        TickScheduler.call_soon(self.show_paused)
+
+    def show_paused(self):
+        """
+        Show the pause applied by ``apply_pause``, on the Tk thread.
+        """
+        # Resumed or removed before the pause was shown
+        if self.download_state != "paused":
+            return
+        if self.mode == "playlist":
+            self.video_download_status_callback(self, self.download_state)
+        self.display_status()
+        self.set_resume_btn()
+        self.pause_resume_btn.configure(command=self.resume_downloading)
+
+    def show_converting(self):
+        """
+        Show the merge that finishes a streaming download, on the Tk thread.
+        """
+        if self.download_state != "converting":
+            return
+        # The streams are fully read, like the merge after a normal download this can't be paused
+        self.pause_resume_btn.place_forget()
+        self.display_status()
+        if self.mode == "playlist":
+            self.video_download_status_callback(self, self.download_state)
 
     def resume_downloading(self):
         """
@@ -507,18 +804,45 @@ class DownloadingVideo(Video):
 
         self.pause_requested = False
         self.set_pause_btn()
-        while self.download_state == "paused":
-            time.sleep(0.3)
         self.pause_resume_btn.configure(command=self.pause_downloading)
         self.download_state = "downloading"
         if self.mode == "playlist":
             self.video_download_status_callback(self, self.download_state)
         self.display_status()
+        AsyncDownloadEngine.call_soon(self.apply_resume)
+
+    def apply_resume(self):
+        """
+        Wake the paused downloaders, runs on the download engine loop.
+        """
+        if self.pause_requested:
+            return
+        self.resume_time = time.time()
+        for downloader in self.active_downloaders:
+            downloader.resume()
+
+    def cancel_downloaders(self):
+        """
+        Stop the active downloaders, runs on the download engine loop.
+        """
+        for downloader in self.active_downloaders:
+            downloader.cancel()
 
     def set_convert_progress(self, progress):
         self.process_percentage_label.configure(text=f"{round(progress, 2)} %")
         self.download_progress_bar.set(progress / 100)
 
+    def render_progress(self):
+        """
+        Show the published download progress, called by the ProgressUpdater on the Tk thread.
+        """
+        # Progress published just before the download ended must not overwrite the new status
+        if self.download_state != "downloading":
+            return
+        if self.net_speed_label is not None:
+            self.net_speed_label.configure(text=ValueConvertUtility.convert_size(self.net_speed, 1) + "/s")
+        self.set_downloading_progress()
+
     def set_downloading_progress(self):
         """
         Set the progress of the downloading process.
@@ -537,38 +861,51 @@ class DownloadingVideo(Video):
         self.set_eta_time()
 
         if self.mode == "playlist":
-            self.video_download_progress_callback()
+            self.video_download_progress_callback(self)
+
+    def get_transferred_bytes(self) -> int:
+        """The bytes downloaded in ``total_download_time``, without the ones resumed from disk."""
+        return self.total_bytes_downloaded - self.resumed_bytes
+
+    def get_estimated_time(self) -> int:
+        return DownloadInfoUtility.get_estimated_time(
+            self.download_type_info["size"] - self.resumed_bytes, self.total_download_time, self.get_transferred_bytes()
+        )
 
     def set_eta_time(self):
         if self.estimated_remaining_time_label is None:
             return
-        estimated_time = DownloadInfoUtility.get_estimated_time(
-            self.download_type_info["size"], self.total_download_time, self.total_bytes_downloaded
-        )
-        if DownloadInfoUtility.get_estimated_time(
-            self.download_type_info["size"], self.total_download_time, self.total_bytes_downloaded
-        ):
+        estimated_time = self.get_estimated_time()
+        if estimated_time:
             self.estimated_remaining_time_label.configure(
                 text=f"{LanguageManager.data['eta']} : {ValueConvertUtility.convert_time(estimated_time) if estimated_time else LanguageManager.data['calculating']}"  # noqa: E501
             )
 
     def set_downloading_failed(self):
         """
-        Set the status to 'failed' if downloading fails.
+        Set the status to 'failed' if downloading fails, safe to call from the download engine loop.
+        """
+        if self.download_state == "removed":
+            return
+        self.download_state = "failed"
+        # The widgets only change on the Tk thread
+        TickScheduler.call_soon(self.show_downloading_failed)
+
+    def show_downloading_failed(self):
+        """
+        Show the failure, or download again if re-downloading automatically, on the Tk thread.
         """
         try:
-            if self.download_state == "removed":
+            # Removed before the failure was shown
+            if self.download_state != "failed":
                 return
 
-            self.download_state = "failed"
-
             if self.mode == "playlist":
                 self.video_download_status_callback(self, self.download_state)
 
             if GeneralSettings.settings["re_download_automatically"] and self.automatically_re_download_count < 5:
-                time.sleep(1)
                 self.automatically_re_download_count += 1
-                self.download_video()
+                self.after(1000, self.retry_download)
             else:
                 DownloadManager.unregister_from_active(self)
                 self.display_status()
@@ -582,7 +919,14 @@ class DownloadingVideo(Video):
             if self.mode == "video":
                 self.show_notification()
         except Exception as error:
-            _log.error("set_downloading_failed error: %s", error)
+            _log.error("show_downloading_failed error: %s", error)
+
+    def retry_download(self):
+        """
+        Download again after a failure, unless the video was removed meanwhile.
+        """
+        if self.download_state == "failed":
+            self.download_video()
 
     def set_converting_failed(self):
         VideoConvertManager.unregister_from_active(self)
@@ -622,6 +966,13 @@ class DownloadingVideo(Video):
         DownloadManager.unregister_from_active(self)
         VideoConvertManager.unregister_from_active(self)
         VideoConvertManager.unregister_from_queued(self)
+        # The widgets only change on the Tk thread
+        TickScheduler.call_soon(self.show_downloading_completed)
+
+    def show_downloading_completed(self):
+        # Removed before the completion was shown
+        if self.download_state != "downloaded":
+            return
         self.pause_resume_btn.place_forget()
         self.display_status()
 
@@ -636,7 +987,9 @@ class DownloadingVideo(Video):
             self.kill()
 
     def rename_to_original_name(self):
-        self.download_file_name = FileUtility.get_available_file_name(self.download_file_name + ".mp4")
+        self.download_file_name = FileUtility.get_available_file_name(
+            f"{self.download_file_name}.{self.merge_plan['container']}"
+        )
         os.rename(self.converted_file_name, self.download_file_name)
 
     def remove_temporary_files(self):
@@ -702,13 +1055,11 @@ class DownloadingVideo(Video):
     def set_widgets_texts(self):
 
         super().set_widgets_texts()
-        if not DownloadInfoUtility.get_estimated_time(
-            self.download_type_info["size"], self.total_download_time, self.total_bytes_downloaded
-        ):
+        if not self.get_estimated_time():
             self.estimated_remaining_time_label.configure(text=f"{LanguageManager.data['calculating']}")
         else:
             self.estimated_remaining_time_label.configure(
-                text=f"{LanguageManager.data['eta']} : {ValueConvertUtility.convert_time(DownloadInfoUtility.get_estimated_time(self.download_type_info['size'], self.total_download_time, self.total_bytes_downloaded))}"  # noqa: E501
+                text=f"{LanguageManager.data['eta']} : {ValueConvertUtility.convert_time(self.get_estimated_time())}"
             )
 
         self.display_status()
@@ -896,6 +1247,8 @@ class DownloadingVideo(Video):
         VideoConvertManager.unregister_from_queued(self)
         VideoCountTracker.remove_downloading_video()
         self.download_state = "removed"
+        # Paused workers would otherwise wait for a resume that never comes
+        AsyncDownloadEngine.call_soon(self.cancel_downloaders)
         if self.mode == "playlist":
             self.video_download_status_callback(self, self.download_state)
 
@@ -151,12 +151,17 @@ class Video(ctk.CTkFrame):
         self.url_label = ctk.CTkLabel(master=self.info_frame, anchor="w", text=self.video_url)
         self.remove_btn = ctk.CTkButton(master=self, command=self.kill, text="X", hover=False)
 
+        options_texts, options_commands = self.get_context_menu_options()
         self.context_menu = ContextMenu(
             master=self.root,
-            options_texts=["copy_url", "open_in_browser", "remove"],
-            options_commands=[self.copy_url, self.open_in_web_browser, self.remove],
+            options_texts=options_texts,
+            options_commands=options_commands,
         )
 
+    def get_context_menu_options(self) -> tuple[list[str], list]:
+        """The language keys and commands of the context menu options."""
+        return ["copy_url", "open_in_browser", "remove"], [self.copy_url, self.open_in_web_browser, self.remove]
+
     def set_widgets_texts(self):
         self.video_title_label.configure(text=f"{LanguageManager.data['title']} : {self.video_title}")
         self.channel_btn.configure(text=f"{LanguageManager.data['channel']} : {self.channel}")
@@ -193,7 +198,7 @@ class Video(ctk.CTkFrame):
         self.remove_btn.configure(width=22 * scale, height=22 * scale, border_spacing=0)
         self.context_menu.configure(
             width=int(130 * AppearanceSettings.get_scale("decimal")),
-            height=int(80 * AppearanceSettings.get_scale("decimal")),
+            height=int(80 / 3 * len(self.context_menu.options_texts) * AppearanceSettings.get_scale("decimal")),
         )
 
     def set_widgets_accent_color(self):